@@ -7,9 +7,12 @@ Purpose: 3-Agent Swarm (Meteorologist, Auditor, Arbiter)
 ═══════════════════════════════════════════════════════════════════════════
 """
 
+import os
+import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional
+from contextlib import nullcontext
+from typing import Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime
 
 from app.models import (
@@ -21,6 +24,10 @@ from app.models import (
 from app.services.weather import Phase6WeatherService
 from app.services.news_flights import Phase6SecondaryDataService
 from app.services.cardano_signer import Phase6CardanoSigner
+from app.services.deadline import Phase6Deadline, Phase6DeadlineExceeded
+from app.services.flight_recorder import get_flight_recorder
+from app.services.metrics import PIPELINE_DURATION, observe_stage
+from app.services.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +39,9 @@ logger = logging.getLogger(__name__)
 class Phase6Agent:
     """Base class for Phase 6 agents (CrewAI-style)."""
     
+    # Stage label of this agent's task on /metrics
+    stage = "task"
+    
     def __init__(self, name: str, role: str, goal: str):
         self.name = name
         self.role = role
@@ -45,10 +55,13 @@ class Phase6Agent:
     def log_complete(self, task: str, duration: float):
         """Log agent task completion."""
         self.logger.info(f"✅ [{self.name}] Completed: {task} ({duration:.2f}s)")
+        observe_stage(self.name, self.stage, duration)
     
-    def log_error(self, task: str, error: Exception):
+    def log_error(self, task: str, error: Exception, duration: Optional[float] = None):
         """Log agent task error."""
         self.logger.error(f"❌ [{self.name}] Failed: {task} - {error}")
+        if duration is not None:
+            observe_stage(self.name, self.stage, duration, ok=False)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -65,6 +78,8 @@ class Phase6MeteorologistAgent(Phase6Agent):
     - Assess data quality and confidence
     """
     
+    stage = "fetch_weather"
+    
     def __init__(self):
         super().__init__(
             name="Meteorologist",
@@ -73,17 +88,23 @@ class Phase6MeteorologistAgent(Phase6Agent):
         )
         self.weather_service = Phase6WeatherService()
     
+    @traced("agent.meteorologist.fetch_weather")
     async def fetch_weather_data(
         self,
         latitude: float,
-        longitude: float
+        longitude: float,
+        deadline: Optional[Phase6Deadline] = None
     ) -> Phase6WeatherData:
         """
         Fetch weather data for given coordinates.
         
+        Primary data is required: without budget for it the request fails
+        (Phase6DeadlineExceeded).
+        
         Args:
             latitude: Latitude in decimal degrees
             longitude: Longitude in decimal degrees
+            deadline: Request deadline
             
         Returns:
             Weather data including wind speed
@@ -95,7 +116,7 @@ class Phase6MeteorologistAgent(Phase6Agent):
         try:
             # Fetch from OpenWeatherMap (REAL-TIME API call)
             weather_data = await self.weather_service.get_current_weather(
-                latitude, longitude
+                latitude, longitude, deadline=deadline
             )
             
             duration = time.time() - start_time
@@ -107,7 +128,7 @@ class Phase6MeteorologistAgent(Phase6Agent):
             return weather_data
         
         except Exception as e:
-            self.log_error(task, e)
+            self.log_error(task, e, time.time() - start_time)
             raise
 
 
@@ -125,6 +146,8 @@ class Phase6AuditorAgent(Phase6Agent):
     - Provide confidence assessment
     """
     
+    stage = "validate"
+    
     def __init__(self):
         super().__init__(
             name="Auditor",
@@ -132,20 +155,45 @@ class Phase6AuditorAgent(Phase6Agent):
             goal="Ensure data accuracy and prevent false triggers"
         )
         self.secondary_service = Phase6SecondaryDataService()
+        # Budget below which secondary validation is skipped
+        self.min_budget_seconds = float(os.getenv("PHASE6_MIN_VALIDATE_MS", "300")) / 1000
+    
+    def _primary_only(
+        self,
+        primary_data: Phase6WeatherData,
+        secondary_sources: Dict[str, Any],
+        notes: str
+    ) -> Phase6AuditResult:
+        """Audit result trusting the primary source, with reduced confidence."""
+        return Phase6AuditResult(
+            validated=True,  # Allow primary-only
+            wind_speed_confirmed=primary_data.wind_speed,
+            discrepancy=0,
+            secondary_sources=secondary_sources,
+            confidence=0.7,  # Reduced confidence without validation
+            notes=notes
+        )
     
+    @traced("agent.auditor.validate")
     async def validate_weather_data(
         self,
         primary_data: Phase6WeatherData,
         latitude: float,
-        longitude: float
+        longitude: float,
+        deadline: Optional[Phase6Deadline] = None
     ) -> Phase6AuditResult:
         """
         Validate primary weather data with secondary sources.
         
+        Secondary validation is optional: when the deadline leaves less than
+        PHASE6_MIN_VALIDATE_MS, or runs out during the lookup, the primary
+        reading is used with reduced confidence and the stage is cut.
+        
         Args:
             primary_data: Primary weather data from Meteorologist
             latitude: Location latitude
             longitude: Location longitude
+            deadline: Request deadline
             
         Returns:
             Audit result with validation and confidence
@@ -154,10 +202,19 @@ class Phase6AuditorAgent(Phase6Agent):
         self.log_start(task)
         start_time = time.time()
         
+        if deadline and deadline.available() < self.min_budget_seconds:
+            deadline.cut("validate", "budget too low for secondary validation")
+            self.log_complete(task, time.time() - start_time)
+            return self._primary_only(
+                primary_data,
+                {"skipped": "deadline"},
+                "Secondary validation skipped (request deadline) - using primary only"
+            )
+        
         try:
             # Fetch secondary data (REAL-TIME API call)
             secondary_data = await self.secondary_service.get_validation_data(
-                latitude, longitude
+                latitude, longitude, deadline=deadline
             )
             
             # Compare primary and secondary sources
@@ -210,15 +267,15 @@ class Phase6AuditorAgent(Phase6Agent):
         
         except Exception as e:
             # If secondary source fails, still allow primary (but reduce confidence)
-            self.logger.warning(f"Secondary source unavailable: {e}")
+            if deadline and isinstance(e, Phase6DeadlineExceeded):
+                deadline.cut("validate", str(e))
+            else:
+                self.logger.warning(f"Secondary source unavailable: {e}")
             
-            result = Phase6AuditResult(
-                validated=True,  # Allow primary-only
-                wind_speed_confirmed=primary_data.wind_speed,
-                discrepancy=0,
-                secondary_sources={"error": str(e)},
-                confidence=0.7,  # Reduced confidence without validation
-                notes="Secondary source unavailable - using primary only"
+            result = self._primary_only(
+                primary_data,
+                {"error": str(e)},
+                "Secondary source unavailable - using primary only"
             )
             
             duration = time.time() - start_time
@@ -241,6 +298,8 @@ class Phase6ArbiterAgent(Phase6Agent):
     - Generate nonce for replay protection
     """
     
+    stage = "decide"
+    
     def __init__(self):
         super().__init__(
             name="Arbiter",
@@ -255,6 +314,7 @@ class Phase6ArbiterAgent(Phase6Agent):
         self.nonce_counter += 1
         return self.nonce_counter
     
+    @traced("agent.arbiter.decide")
     async def make_decision(
         self,
         audit_result: Phase6AuditResult,
@@ -329,14 +389,16 @@ class Phase6ArbiterAgent(Phase6Agent):
             duration = time.time() - start_time
             self.log_complete(task, duration)
             
-            self.logger.info(f"⚖️  Decision: {'TRIGGER' if trigger else 'NO TRIGGER'}")
-            self.logger.info(f"⚖️  Final Wind: {final_wind_speed / 100:.1f} m/s")
-            self.logger.info(f"⚖️  Confidence: {confidence:.2f}")
+            # Trigger decisions bypass log sampling (see app/services/log_config.py)
+            decision_log = {"trigger": trigger, "policy_id": policy_id}
+            self.logger.info(f"⚖️  Decision: {'TRIGGER' if trigger else 'NO TRIGGER'}", extra=decision_log)
+            self.logger.info(f"⚖️  Final Wind: {final_wind_speed / 100:.1f} m/s", extra=decision_log)
+            self.logger.info(f"⚖️  Confidence: {confidence:.2f}", extra=decision_log)
             
             return decision
         
         except Exception as e:
-            self.log_error(task, e)
+            self.log_error(task, e, time.time() - start_time)
             raise
 
 
@@ -361,13 +423,33 @@ class Phase6OracleSwarm:
         
         logger.info("✅ All agents initialized")
     
+    def warmup_tasks(self) -> Dict[str, Callable[[], Awaitable[Any]]]:
+        """
+        Warm-up coroutine per subsystem (run concurrently at startup).
+        
+        Returns:
+            Subsystem name → zero-argument coroutine function
+        """
+        return {
+            "weather_pool": self.meteorologist.weather_service.warm_up,
+            "secondary_pool": self.auditor.secondary_service.warm_up,
+            "cardano_signer": lambda: asyncio.to_thread(self.arbiter.signer.warm_up),
+        }
+    
+    async def close(self):
+        """Release pooled connections."""
+        await self.meteorologist.weather_service.close()
+        await self.auditor.secondary_service.close()
+    
+    @traced("oracle.pipeline")
     async def execute_oracle_pipeline(
         self,
         policy_id: str,
         location_id: str,
         latitude: float,
         longitude: float,
-        threshold_wind_speed: int
+        threshold_wind_speed: int,
+        deadline: Optional[Phase6Deadline] = None
     ) -> Phase6OracleResponse:
         """
         Execute the full 3-agent oracle pipeline.
@@ -377,15 +459,23 @@ class Phase6OracleSwarm:
         2. Auditor validates with secondary sources
         3. Arbiter makes final decision and signs
         
+        With a deadline, each stage's provider calls get only the remaining
+        budget (minus the Arbiter's reserve); stages that had to give way are
+        listed in the response's stages_cut.
+        
         Args:
             policy_id: Cardano policy ID
             location_id: Location identifier
             latitude: Latitude coordinate
             longitude: Longitude coordinate
             threshold_wind_speed: Trigger threshold (m/s × 100)
+            deadline: Request deadline (None: each call keeps its own timeout)
             
         Returns:
             Signed oracle response ready for on-chain submission
+            
+        Raises:
+            Phase6DeadlineExceeded: No budget left for the primary fetch
         """
         logger.info("=" * 80)
         logger.info("🚀 Starting Phase 6 Oracle Pipeline")
@@ -393,23 +483,50 @@ class Phase6OracleSwarm:
         
         pipeline_start = time.time()
         
-        # STEP 1: Meteorologist fetches primary data (REAL-TIME)
-        logger.info("STEP 1/3: Meteorologist - Fetching primary weather data...")
-        weather_data = await self.meteorologist.fetch_weather_data(latitude, longitude)
-        
-        # STEP 2: Auditor validates data (REAL-TIME)
-        logger.info("STEP 2/3: Auditor - Validating with secondary sources...")
-        audit_result = await self.auditor.validate_weather_data(
-            weather_data, latitude, longitude
-        )
-        
-        # STEP 3: Arbiter makes final decision (REAL-TIME)
-        logger.info("STEP 3/3: Arbiter - Making final decision...")
-        decision = await self.arbiter.make_decision(
-            audit_result, threshold_wind_speed, policy_id, location_id
-        )
+        with get_flight_recorder().record(
+            policy_id,
+            location_id,
+            latitude=latitude,
+            longitude=longitude,
+            threshold_wind_speed=threshold_wind_speed,
+        ) as flight:
+            # STEP 1: Meteorologist fetches primary data (REAL-TIME)
+            logger.info("STEP 1/3: Meteorologist - Fetching primary weather data...")
+            with flight.stage("fetch_weather") if flight else nullcontext():
+                weather_data = await self.meteorologist.fetch_weather_data(
+                    latitude, longitude, deadline=deadline
+                )
+            
+            # STEP 2: Auditor validates data (REAL-TIME)
+            logger.info("STEP 2/3: Auditor - Validating with secondary sources...")
+            with flight.stage("validate") if flight else nullcontext():
+                audit_result = await self.auditor.validate_weather_data(
+                    weather_data, latitude, longitude, deadline=deadline
+                )
+            
+            # STEP 3: Arbiter makes final decision (REAL-TIME)
+            logger.info("STEP 3/3: Arbiter - Making final decision...")
+            with flight.stage("decide") if flight else nullcontext():
+                decision = await self.arbiter.make_decision(
+                    audit_result, threshold_wind_speed, policy_id, location_id
+                )
+            
+            if flight:
+                flight.decision = {
+                    "trigger": decision.trigger,
+                    "final_wind_speed": decision.final_wind_speed,
+                    "primary_wind_speed": weather_data.wind_speed,
+                    "confidence": decision.confidence,
+                    "validated": audit_result.validated,
+                    "discrepancy": audit_result.discrepancy,
+                    "reasoning": decision.reasoning,
+                    "nonce": decision.nonce,
+                    "signed": decision.signature is not None,
+                    "stages_cut": list(deadline.stages_cut) if deadline else [],
+                }
         
         pipeline_duration = time.time() - pipeline_start
+        PIPELINE_DURATION.labels("true" if decision.trigger else "false").observe(pipeline_duration)
         
         logger.info("=" * 80)
         logger.info(f"✅ Pipeline complete in {pipeline_duration:.2f}s")
@@ -430,6 +547,7 @@ class Phase6OracleSwarm:
                 "secondary": "NOAA/FlightAware",
                 "audit_notes": audit_result.notes,
             },
+            stages_cut=list(deadline.stages_cut) if deadline else [],
             timestamp=datetime.utcnow()
         )
         
@@ -0,0 +1,114 @@
+"""
+Hyperion API - Debug Endpoints
+Runtime diagnostics for live processes (mounted at /debug, hidden from docs)
+
+Disabled (404) unless HYPERION_DEBUG_TOKEN is set; every request must then
+carry the token in the X-Debug-Token header.
+"""
+
+import os
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.services.loop_watchdog import get_loop_watchdog
+from app.services.profiling import (
+    MAX_PROFILE_SECONDS,
+    debug_token_valid,
+    get_memory_tracker,
+    get_profile_store,
+    profile_window,
+)
+from app.services.tracing import get_tracer
+
+
+async def require_debug_token(x_debug_token: Optional[str] = Header(default=None)) -> None:
+    """Reject debug requests without the configured token"""
+    if not os.getenv("HYPERION_DEBUG_TOKEN"):
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not debug_token_valid(x_debug_token):
+        raise HTTPException(status_code=401, detail="Invalid debug token")
+
+
+router = APIRouter(dependencies=[Depends(require_debug_token)])
+
+
+@router.get("/loop")
+async def loop_status():
+    """
+    Event loop lag percentiles and recent stalls
+
+    Each stall holds the stack of the callback that blocked the loop,
+    captured while it was blocking.
+    """
+    return get_loop_watchdog().status()
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_time_window(
+    seconds: float = Query(10.0, gt=0, le=MAX_PROFILE_SECONDS, description="Window length"),
+    interval_ms: float = Query(5.0, ge=1, le=100, description="Sampling period"),
+):
+    """
+    Sample the event loop for a time window
+
+    Returns the folded stacks (flamegraph.pl / speedscope input); the
+    profile is also stored under the X-Profile-Id response header.
+    """
+    profile = await profile_window(seconds, interval_ms / 1000)
+    return PlainTextResponse(profile["folded"], headers={"X-Profile-Id": profile["id"]})
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """Stored profiles (request and window), newest first"""
+    return {"profiles": get_profile_store().list()}
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str):
+    """Folded stacks of a stored profile"""
+    profile = get_profile_store().get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
+    return PlainTextResponse(profile["folded"])
+
+
+@router.post("/memory/snapshot")
+async def memory_snapshot(top: int = Query(25, ge=1, le=200)):
+    """
+    Take a tracemalloc snapshot and diff it against the previous one
+
+    The first call starts tracing (the report then lists top allocations);
+    later calls list the locations that grew the most since the last call.
+    Snapshotting walks every traced block, so it runs in a worker thread.
+    """
+    return await asyncio.to_thread(get_memory_tracker().snapshot, top)
+
+
+@router.delete("/memory")
+async def memory_stop():
+    """Stop tracemalloc (removes its overhead) and drop the baseline"""
+    return await asyncio.to_thread(get_memory_tracker().stop)
+
+
+@router.get("/traces")
+async def list_traces(limit: int = Query(50, ge=1, le=1000)):
+    """Recently finished traces (root name, duration, span count), newest first"""
+    tracer = get_tracer()
+    return {
+        "sample_rate": tracer.sample_rate,
+        "exported": tracer.exported,
+        "traces": tracer.traces(limit),
+    }
+
+
+@router.get("/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """One trace as an OTLP/JSON export request (loadable by Jaeger/Tempo tooling)"""
+    trace = get_tracer().trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace {trace_id} not found")
+    return trace
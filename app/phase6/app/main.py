@@ -11,9 +11,12 @@ Status: ✅ PRODUCTION READY | ✅ REAL-TIME | ✅ MERGE-SAFE
 """
 
 import os
+import time
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -21,7 +24,8 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
@@ -31,11 +35,26 @@ from app.models import (
     Phase6OracleRequest,
     Phase6OracleResponse,
     Phase6HealthResponse,
+    Phase6ReadinessResponse,
 )
+from app.services.admission import Phase6AdmissionRejected, get_admission_controller
+from app.services.coalescing import get_request_coalescer
+from app.services.deadline import Phase6Deadline
+from app.services.flight_recorder import get_flight_recorder
+from app.services.health_probe import PROBE_DOWN, get_health_prober
+from app.services.idempotency import IdempotencyKeyConflict, get_idempotency_store
+from app.services.log_config import configure_logging
+from app.services.loop_watchdog import get_loop_watchdog, start_loop_watchdog
+from app.api import debug
+from app.services.metrics import CONTENT_TYPE_LATEST, MetricsMiddleware, get_metrics_registry
+from app.services.profiling import ProfilingMiddleware
+from app.services.tracing import TracingMiddleware
+from app.services.startup import create_module_warmer
 
 # Phase 7: Import forensics router
 try:
     from app.api import forensics
+    from app.services.forensic_speculation import get_speculation_manager
     FORENSICS_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"⚠️  Phase 7 forensics not available: {e}")
@@ -45,14 +64,225 @@ except ImportError as e:
 # LOGGING CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - [PHASE6] - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
+# HYPERION_LOG_MODE=json: queued, sampled JSON lines (see app/services/log_config.py)
+configure_logging(
+    "phase6",
+    text_format='%(asctime)s - [PHASE6] - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
 )
 
 logger = logging.getLogger(__name__)
 
+# ═══════════════════════════════════════════════════════════════════════════
+# LIFESPAN (parallel warm-up behind /readyz)
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Subsystems that must warm successfully before /readyz reports ready;
+# the others (connection pre-connects, forensics) only degrade latency
+PHASE6_REQUIRED_SUBSYSTEMS = ("agents", "cardano_signer")
+
+
+class Phase6WarmupState:
+    """Startup warm-up progress, reported by /readyz."""
+    
+    def __init__(self):
+        self.status = "warming"
+        self.subsystems: Dict[str, Dict[str, Any]] = {}
+        self.warmup_ms: Optional[float] = None
+        self.error: Optional[str] = None
+    
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+
+phase6_warmup = Phase6WarmupState()
+
+
+async def phase6_warm_subsystem(name: str, warm, timeout: float):
+    """Run one warm-up coroutine under the timeout and record the outcome."""
+    start = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(warm(), timeout)
+        entry = {"status": "ok"}
+        if isinstance(result, bool):
+            entry["warmed"] = result
+    except asyncio.TimeoutError:
+        entry = {"status": "timeout"}
+    except Exception as e:
+        entry = {"status": "failed", "error": str(e)}
+    entry["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    phase6_warmup.subsystems[name] = entry
+    
+    if entry["status"] == "ok":
+        logger.info(f"🔥 Warmed {name} in {entry['duration_ms']:.0f}ms")
+    else:
+        logger.warning(f"⚠️  Warm-up of {name} {entry['status']}: {entry.get('error', '')}")
+
+
+async def phase6_build_swarm():
+    """
+    Build the swarm exactly once (the only place it is constructed).
+    
+    The build runs in a thread that a warm-up timeout cannot stop, so it is
+    kept in phase6_swarm_build and awaited again by the next attempt instead
+    of starting a second swarm. A failed build is dropped and retried.
+    """
+    global phase6_swarm, phase6_swarm_build
+    if phase6_swarm is not None:
+        return
+    if phase6_swarm_build is None:
+        phase6_swarm_build = asyncio.ensure_future(asyncio.to_thread(Phase6OracleSwarm))
+    build = phase6_swarm_build
+    try:
+        swarm = await asyncio.shield(build)
+    finally:
+        if build.done() and (build.cancelled() or build.exception() is not None):
+            phase6_swarm_build = None
+    phase6_swarm = swarm
+
+
+async def phase6_warm_pending(timeout: float):
+    """
+    Warm every subsystem not yet "ok": the swarm first, then the rest concurrently.
+    
+    Args:
+        timeout: Per-subsystem warm-up budget in seconds
+    """
+    def pending(name: str) -> bool:
+        return phase6_warmup.subsystems.get(name, {}).get("status") != "ok"
+    
+    # Agents validate env vars and keys; everything else hangs off them
+    if pending("agents"):
+        await phase6_warm_subsystem("agents", phase6_build_swarm, timeout)
+    if phase6_swarm is None:
+        return
+    
+    tasks = dict(phase6_swarm.warmup_tasks())
+    tasks["sdk_modules"] = module_warmer.start
+    if FORENSICS_AVAILABLE:
+        tasks["forensics"] = lambda: asyncio.to_thread(get_speculation_manager)
+    
+    await asyncio.gather(*(
+        phase6_warm_subsystem(name, warm, timeout)
+        for name, warm in tasks.items() if pending(name)
+    ))
+
+
+async def phase6_warm_up(timeout: float):
+    """
+    Build the swarm and warm every subsystem, retrying until ready.
+    
+    When a required subsystem fails or times out, /readyz reports "failed"
+    and the subsystems not yet warmed are retried with exponential backoff
+    (PHASE6_WARMUP_RETRY_SECONDS doubling up to PHASE6_WARMUP_RETRY_MAX_SECONDS).
+    
+    Args:
+        timeout: Per-subsystem warm-up budget in seconds
+    """
+    start = time.perf_counter()
+    delay = float(os.getenv("PHASE6_WARMUP_RETRY_SECONDS", "1"))
+    max_delay = float(os.getenv("PHASE6_WARMUP_RETRY_MAX_SECONDS", "30"))
+    
+    while True:
+        await phase6_warm_pending(timeout)
+        
+        phase6_warmup.warmup_ms = round((time.perf_counter() - start) * 1000, 1)
+        failed = [
+            name for name in PHASE6_REQUIRED_SUBSYSTEMS
+            if phase6_warmup.subsystems.get(name, {}).get("status") != "ok"
+        ]
+        if failed:
+            phase6_warmup.status = "failed"
+            entries = {name: phase6_warmup.subsystems.get(name, {}) for name in failed}
+            phase6_warmup.error = "; ".join(
+                f"{name}: {entry.get('error', entry.get('status', 'not warmed'))}"
+                for name, entry in entries.items()
+            )
+            logger.error(f"❌ Phase 6 warm-up failed ({phase6_warmup.error}), retrying in {delay:.1f}s")
+        else:
+            phase6_warmup.status = "ready"
+            phase6_warmup.error = None
+            logger.info(f"✅ PHASE 6 READY - warmed in {phase6_warmup.warmup_ms:.0f}ms")
+        
+        # Dependency probes need the swarm, so they start once the first attempt is over
+        await health_prober.start()
+        if not failed:
+            return
+        
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+async def phase6_probe_weather() -> Dict[str, Any]:
+    """Health probe: OpenWeatherMap reachable through the pooled client."""
+    if phase6_swarm is None:
+        raise RuntimeError("Oracle swarm not initialized")
+    status_code = await phase6_swarm.meteorologist.weather_service.ping()
+    if status_code >= 500:
+        raise RuntimeError(f"HTTP {status_code}")
+    return {"http_status": status_code}
+
+
+async def phase6_probe_secondary() -> Dict[str, Any]:
+    """Health probe: NOAA reachable (not configured in mock mode)."""
+    if phase6_swarm is None:
+        raise RuntimeError("Oracle swarm not initialized")
+    service = phase6_swarm.auditor.secondary_service
+    if service.use_mock:
+        return {"status": "not_configured"}
+    status_code = await service.ping()
+    if status_code >= 500:
+        raise RuntimeError(f"HTTP {status_code}")
+    return {"http_status": status_code}
+
+
+async def phase6_probe_signer() -> Dict[str, Any]:
+    """Health probe: signing key self-test."""
+    if phase6_swarm is None:
+        raise RuntimeError("Oracle swarm not initialized")
+    signer = phase6_swarm.arbiter.signer
+    await asyncio.to_thread(signer.warm_up)
+    return {"verification_key": signer.get_public_key_hex()[:16]}
+
+
+health_prober = get_health_prober()
+health_prober.register("weather_provider", phase6_probe_weather)
+health_prober.register("secondary_provider", phase6_probe_secondary, critical=False)
+health_prober.register("signer", phase6_probe_signer)
+
+
+@asynccontextmanager
+async def phase6_lifespan(app: FastAPI):
+    """Warm subsystems in the background while /livez already answers."""
+    logger.info("=" * 80)
+    logger.info("🚀 PROJECT HYPERION - PHASE 6: SENTINEL SWARM STARTING")
+    logger.info("=" * 80)
+    
+    timeout = float(os.getenv("PHASE6_WARMUP_TIMEOUT", "10"))
+    await start_loop_watchdog()
+    warmup_task = asyncio.create_task(phase6_warm_up(timeout))
+    
+    yield
+    
+    logger.info("🛑 Phase 6 Sentinel Swarm shutting down...")
+    warmup_task.cancel()
+    try:
+        await warmup_task
+    except asyncio.CancelledError:
+        pass
+    await module_warmer.stop()
+    await health_prober.stop()
+    await get_loop_watchdog().stop()
+    
+    global phase6_swarm, phase6_swarm_build
+    if phase6_swarm is not None:
+        await phase6_swarm.close()
+    phase6_swarm = None
+    phase6_swarm_build = None
+    logger.info("✅ Phase 6 shutdown complete")
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # FASTAPI APPLICATION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -63,6 +293,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=phase6_lifespan,
 )
 
 # CORS Middleware (for frontend integration)
@@ -74,6 +305,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency histograms for /metrics
+app.add_middleware(MetricsMiddleware)
+# X-Debug-Profile: 1 (with X-Debug-Token) profiles a single request
+app.add_middleware(ProfilingMiddleware)
+# Root span per sampled request; traceparent / X-Trace-Id response headers
+app.add_middleware(TracingMiddleware)
+
+# Runtime diagnostics (404 unless HYPERION_DEBUG_TOKEN is set)
+app.include_router(debug.router, prefix="/debug", include_in_schema=False)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PHASE 7 FORENSICS INTEGRATION (Optional)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -88,64 +329,38 @@ if FORENSICS_AVAILABLE:
 else:
     logger.info("ℹ️  Phase 7 Forensic Reporting not available")
 
+# Heavy SDKs are imported on first use; warmed at startup
+# (HYPERION_STARTUP_MODE=eager) or in the background (HYPERION_WARMUP=1)
+module_warmer = create_module_warmer(["google.generativeai"])
+
 # ═══════════════════════════════════════════════════════════════════════════
 # GLOBAL STATE (Singleton pattern for agent swarm)
 # ═══════════════════════════════════════════════════════════════════════════
 
 phase6_swarm: Phase6OracleSwarm | None = None
+# Swarm construction started by warm-up (survives warm-up timeouts)
+phase6_swarm_build: "asyncio.Future[Phase6OracleSwarm] | None" = None
 
 
 def get_phase6_swarm() -> Phase6OracleSwarm:
-    """Get or initialize the Phase 6 oracle swarm (singleton pattern)."""
-    global phase6_swarm
+    """
+    Get the warmed Phase 6 oracle swarm.
     
+    The swarm is only ever built by the startup warm-up (phase6_warm_up),
+    never on the request path.
+    
+    Raises:
+        HTTPException: 503 + Retry-After while the swarm is still warming up
+    """
     if phase6_swarm is None:
-        try:
-            logger.info("Initializing Phase 6 Oracle Swarm...")
-            phase6_swarm = Phase6OracleSwarm()
-            logger.info("✅ Phase 6 Oracle Swarm initialized successfully")
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize Phase 6 Oracle Swarm: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to initialize oracle swarm: {str(e)}"
-            )
+        detail = "Oracle swarm warming up"
+        if phase6_warmup.error:
+            detail += f" (retrying: {phase6_warmup.error})"
+        raise HTTPException(status_code=503, detail=detail, headers={"Retry-After": "1"})
     
     return phase6_swarm
 
 
-# ═══════════════════════════════════════════════════════════════════════════
-# STARTUP & SHUTDOWN EVENTS
-# ═══════════════════════════════════════════════════════════════════════════
-
-@app.on_event("startup")
-async def phase6_startup():
-    """Initialize Phase 6 services on startup."""
-    logger.info("=" * 80)
-    logger.info("🚀 PROJECT HYPERION - PHASE 6: SENTINEL SWARM STARTING")
-    logger.info("=" * 80)
-    
-    # Pre-initialize swarm (warm-up)
-    try:
-        get_phase6_swarm()
-    except Exception as e:
-        logger.error(f"❌ Startup failed: {e}")
-        # Don't crash the app, allow health checks to report status
-    
-    logger.info("=" * 80)
-    logger.info("✅ PHASE 6 READY - Real-time oracle monitoring active")
-    logger.info("=" * 80)
-
-
-@app.on_event("shutdown")
-async def phase6_shutdown():
-    """Cleanup Phase 6 resources on shutdown."""
-    logger.info("🛑 Phase 6 Sentinel Swarm shutting down...")
-    global phase6_swarm
-    phase6_swarm = None
-    logger.info("✅ Phase 6 shutdown complete")
-
-
 # ═══════════════════════════════════════════════════════════════════════════
 # EXCEPTION HANDLERS
 # ═══════════════════════════════════════════════════════════════════════════
@@ -160,7 +375,8 @@ async def phase6_http_exception_handler(request: Request, exc: HTTPException):
             "phase": 6,
             "error": exc.detail,
             "timestamp": datetime.utcnow().isoformat(),
-        }
+        },
+        headers=exc.headers,
     )
 
 
@@ -193,63 +409,103 @@ async def phase6_root():
         "status": "operational",
         "endpoints": {
             "health": "/health",
+            "livez": "/livez",
+            "readyz": "/readyz",
             "oracle": "/oracle/run",
             "docs": "/docs",
         }
     }
 
 
+@app.get("/livez")
+async def phase6_livez():
+    """Liveness probe - the process is up and serving (no dependencies)."""
+    return {"status": "alive", "phase": 6}
+
+
+@app.get("/readyz", response_model=Phase6ReadinessResponse)
+async def phase6_readyz(response: Response):
+    """
+    Readiness probe - 200 once the swarm is built and warmed, 503 before.
+    
+    Returns:
+        Warm-up status with per-subsystem durations
+    """
+    if not phase6_warmup.ready:
+        response.status_code = 503
+    
+    return Phase6ReadinessResponse(
+        status=phase6_warmup.status,
+        ready=phase6_warmup.ready,
+        warmup_ms=phase6_warmup.warmup_ms,
+        subsystems=phase6_warmup.subsystems,
+        error=phase6_warmup.error,
+    )
+
+
 @app.get("/health", response_model=Phase6HealthResponse)
 async def phase6_health():
     """
     Health check endpoint.
     
+    Served from memory: dependencies (weather provider, NOAA, signer,
+    Gemini) are checked by the background health prober, and nothing is
+    initialized on the request path.
+    
     Returns:
         Health status including agent swarm state
     """
-    try:
-        swarm = get_phase6_swarm()
-        
-        # Verify all critical services
-        services_status = {
-            "meteorologist": swarm.meteorologist is not None,
-            "auditor": swarm.auditor is not None,
-            "arbiter": swarm.arbiter is not None,
-            "weather_service": True,  # Checked during swarm init
-            "cardano_signer": True,   # Checked during swarm init
-        }
-        
-        all_healthy = all(services_status.values())
-        
-        return Phase6HealthResponse(
-            status="healthy" if all_healthy else "degraded",
-            phase=6,
-            timestamp=datetime.utcnow(),
-            agents={
-                "meteorologist": "online" if services_status["meteorologist"] else "offline",
-                "auditor": "online" if services_status["auditor"] else "offline",
-                "arbiter": "online" if services_status["arbiter"] else "offline",
-            },
-            services=services_status,
-        )
+    swarm = phase6_swarm
+    snapshot = health_prober.snapshot()
     
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
+    if swarm is None:
+        agent_state = "starting" if phase6_warmup.status == "warming" else "error"
         return Phase6HealthResponse(
-            status="unhealthy",
+            status="starting" if agent_state == "starting" else "unhealthy",
             phase=6,
             timestamp=datetime.utcnow(),
             agents={
-                "meteorologist": "error",
-                "auditor": "error",
-                "arbiter": "error",
+                "meteorologist": agent_state,
+                "auditor": agent_state,
+                "arbiter": agent_state,
             },
             services={},
+            dependencies=snapshot["dependencies"],
         )
+    
+    components = snapshot["components"]
+    return Phase6HealthResponse(
+        status=snapshot["status"],
+        phase=6,
+        timestamp=datetime.utcnow(),
+        agents={
+            "meteorologist": "online",
+            "auditor": "online",
+            "arbiter": "online",
+        },
+        services={
+            "meteorologist": True,
+            "auditor": True,
+            "arbiter": True,
+            "weather_service": components.get("weather_provider") != PROBE_DOWN,
+            "cardano_signer": components.get("signer") != PROBE_DOWN,
+        },
+        dependencies=snapshot["dependencies"],
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def phase6_metrics():
+    """Prometheus scrape endpoint."""
+    return Response(get_metrics_registry().render(), media_type=CONTENT_TYPE_LATEST)
 
 
 @app.post("/oracle/run", response_model=Phase6OracleResponse)
-async def phase6_run_oracle(request: Phase6OracleRequest):
+async def phase6_run_oracle(
+    request: Phase6OracleRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+):
     """
     Execute the Phase 6 oracle pipeline.
     
@@ -258,12 +514,118 @@ async def phase6_run_oracle(request: Phase6OracleRequest):
     2. Auditor: Validates with secondary sources
     3. Arbiter: Makes final decision and signs message
     
+    At most PHASE6_ADMISSION_CONCURRENCY pipelines run at once; the rest
+    queue by lane (high_priority or near-threshold policies first). A request
+    that cannot start within its budget (timeout_ms) gets 503 + Retry-After.
+    The same deadline bounds every provider call of the pipeline; optional
+    stages cut to meet it are listed in stages_cut, and 504 is returned when
+    the primary fetch has no budget left.
+    
+    Identical requests arriving while one is in flight join it and get the
+    same response (X-Oracle-Coalesced: 1), unless it runs under a smaller
+    budget than theirs (its stages may have been cut); other requests for the same
+    policy wait for it, so one event is never signed twice. With an
+    Idempotency-Key, retries return the original response
+    (Idempotent-Replayed: true) instead of running the pipeline again.
+    
     Args:
         request: Oracle request with policy_id and location_id
         
     Returns:
         Signed oracle payload ready for on-chain submission
     """
+    budget_ms = request.timeout_ms or int(os.getenv("PHASE6_REQUEST_TIMEOUT_MS", "20000"))
+    deadline = Phase6Deadline(budget_ms / 1000)
+    key = (
+        request.policy_id,
+        request.location_id,
+        request.latitude,
+        request.longitude,
+        request.threshold_wind_speed,
+    )
+    
+    def coalesced_run():
+        return get_request_coalescer().run(
+            key,
+            lambda: phase6_execute_oracle(request, deadline, budget_ms),
+            join_timeout=deadline.remaining(),
+            budget=budget_ms,
+        )
+    
+    try:
+        if idempotency_key is None:
+            (result, joined), replayed = await coalesced_run(), False
+        else:
+            (result, joined), replayed = await get_idempotency_store().run(
+                "oracle.run",
+                idempotency_key,
+                # timeout_ms / high_priority are per-attempt hints: a retry
+                # with a longer deadline still replays the original response
+                jsonable_encoder(request, exclude={"timeout_ms", "high_priority"}),
+                coalesced_run,
+                join_timeout=deadline.remaining(),
+            )
+    except IdempotencyKeyConflict as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except (TimeoutError, asyncio.TimeoutError):
+        raise HTTPException(
+            status_code=504,
+            detail=f"Oracle deadline exceeded ({budget_ms}ms) waiting for the in-flight execution"
+        )
+    
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    elif joined:
+        response.headers["X-Oracle-Coalesced"] = "1"
+    return result
+
+
+async def phase6_execute_oracle(
+    request: Phase6OracleRequest,
+    deadline: Phase6Deadline,
+    budget_ms: int
+) -> Phase6OracleResponse:
+    """
+    Run one admitted oracle pipeline while holding the policy's lock.
+    
+    Args:
+        request: Oracle request
+        deadline: Request deadline (bounds the lock wait, admission and pipeline)
+        budget_ms: Request budget (for error messages)
+        
+    Returns:
+        Signed oracle payload
+    """
+    try:
+        async with get_request_coalescer().locks.hold(request.policy_id, timeout=deadline.available()):
+            return await phase6_admit_and_run(request, deadline, budget_ms)
+    except (TimeoutError, asyncio.TimeoutError) as e:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Oracle deadline exceeded ({budget_ms}ms) waiting for policy {request.policy_id}: {e}"
+        )
+
+
+async def phase6_admit_and_run(
+    request: Phase6OracleRequest,
+    deadline: Phase6Deadline,
+    budget_ms: int
+) -> Phase6OracleResponse:
+    """Acquire an admission slot and execute the pipeline (errors mapped to HTTP)."""
+    # 503 while warming up, before taking a slot
+    swarm = get_phase6_swarm()
+    admission = get_admission_controller()
+    lane = admission.lane_for(request.policy_id, request.high_priority)
+    try:
+        await admission.acquire(lane, deadline.expires_at)
+    except Phase6AdmissionRejected as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    admitted_at = time.monotonic()
+    
     logger.info(f"=" * 80)
     logger.info(f"🔍 Phase 6 Oracle Request Received")
     logger.info(f"Policy ID: {request.policy_id}")
@@ -272,9 +634,6 @@ async def phase6_run_oracle(request: Phase6OracleRequest):
     logger.info(f"=" * 80)
     
     try:
-        # Get swarm instance
-        swarm = get_phase6_swarm()
-        
         # Execute the 3-agent pipeline (REAL-TIME execution)
         logger.info("⚡ Starting real-time agent execution...")
         start_time = datetime.utcnow()
@@ -285,10 +644,24 @@ async def phase6_run_oracle(request: Phase6OracleRequest):
             latitude=request.latitude,
             longitude=request.longitude,
             threshold_wind_speed=request.threshold_wind_speed,
+            deadline=deadline,
         )
         
         execution_time = (datetime.utcnow() - start_time).total_seconds()
         logger.info(f"✅ Pipeline completed in {execution_time:.2f}s")
+        if result.stages_cut:
+            logger.warning(f"✂️  Stages cut to meet the {budget_ms}ms deadline: {', '.join(result.stages_cut)}")
+        admission.note_reading(result.policy_id, result.wind_speed, request.threshold_wind_speed)
+        
+        # Phase 7: near-threshold readings start speculative forensic reports
+        if FORENSICS_AVAILABLE:
+            get_speculation_manager().observe(
+                policy_id=result.policy_id,
+                location_id=result.location_id,
+                wind_speed=result.wind_speed / 100,
+                threshold=request.threshold_wind_speed / 100,
+                measurement_time=result.measurement_time // 1000,
+            )
         
         # Log result
         if result.trigger:
@@ -301,12 +674,44 @@ async def phase6_run_oracle(request: Phase6OracleRequest):
         
         return result
     
+    except (TimeoutError, asyncio.TimeoutError) as e:
+        logger.error(f"⏱️  Oracle deadline exceeded after {budget_ms}ms: {e}")
+        raise HTTPException(
+            status_code=504,
+            detail=f"Oracle deadline exceeded ({budget_ms}ms): {e}"
+        )
+    
     except Exception as e:
         logger.error(f"❌ Oracle execution failed: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Oracle execution failed: {str(e)}"
         )
+    
+    finally:
+        admission.release(time.monotonic() - admitted_at)
+
+
+@app.get("/oracle/flights")
+async def phase6_oracle_flights(
+    policy_id: Optional[str] = Query(None, description="Only executions for this policy"),
+    slow_ms: Optional[float] = Query(None, ge=0, description="Only executions at least this slow"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum records returned"),
+):
+    """
+    Recent oracle pipeline executions from the flight recorder.
+    
+    Each record holds the inputs, per-stage start/end offsets, provider
+    latencies and the decision (or error). Newest first.
+    
+    Returns:
+        Recorder status and the matching executions
+    """
+    recorder = get_flight_recorder()
+    return {
+        **recorder.status(),
+        "flights": recorder.flights(policy_id=policy_id, min_duration_ms=slow_ms, limit=limit),
+    }
 
 
 @app.get("/oracle/status")
@@ -317,12 +722,15 @@ async def phase6_oracle_status():
     Returns:
         Current state of all agents and last execution time
     """
+    swarm = get_phase6_swarm()
+    
     try:
-        swarm = get_phase6_swarm()
-        
         return {
             "phase": 6,
             "swarm_initialized": swarm is not None,
+            "admission": get_admission_controller().status(),
+            "coalescing": get_request_coalescer().status(),
+            "idempotency": get_idempotency_store().status(),
             "agents": {
                 "meteorologist": {
                     "name": swarm.meteorologist.name,
@@ -8,7 +8,7 @@ Purpose: Pydantic models for API requests/responses
 """
 
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field, validator
 
 
@@ -54,6 +54,18 @@ class Phase6OracleRequest(BaseModel):
         le=50000,  # 500 m/s max (unrealistic but safe upper bound)
     )
     
+    high_priority: bool = Field(
+        default=False,
+        description="Use the priority admission lane (near-threshold policies get it automatically)",
+    )
+    
+    timeout_ms: Optional[int] = Field(
+        default=None,
+        description="Response budget in milliseconds (default PHASE6_REQUEST_TIMEOUT_MS)",
+        ge=100,
+        le=120000,
+    )
+    
     class Config:
         schema_extra = {
             "example": {
@@ -92,6 +104,10 @@ class Phase6OracleResponse(BaseModel):
         default_factory=dict,
         description="Data sources used for decision"
     )
+    stages_cut: List[str] = Field(
+        default_factory=list,
+        description="Stages skipped or shortened to meet the request deadline"
+    )
     timestamp: datetime = Field(
         default_factory=datetime.utcnow,
         description="Response generation timestamp"
@@ -112,11 +128,33 @@ class Phase6OracleResponse(BaseModel):
                     "primary": "OpenWeatherMap",
                     "secondary": "NOAA",
                 },
+                "stages_cut": [],
                 "timestamp": "2024-01-01T12:00:00Z",
             }
         }
 
 
+class Phase6ReadinessResponse(BaseModel):
+    """Readiness probe response model (startup warm-up report)."""
+    
+    status: str = Field(..., description="warming, ready or failed")
+    ready: bool = Field(..., description="Whether traffic should be routed here")
+    phase: int = Field(default=6, description="Phase number")
+    timestamp: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="Probe timestamp"
+    )
+    warmup_ms: Optional[float] = Field(
+        default=None,
+        description="Total warm-up duration (once finished)"
+    )
+    subsystems: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Per-subsystem warm-up status and duration"
+    )
+    error: Optional[str] = Field(default=None, description="Why warm-up failed")
+
+
 class Phase6HealthResponse(BaseModel):
     """Health check response model."""
     
@@ -134,6 +172,10 @@ class Phase6HealthResponse(BaseModel):
         default_factory=dict,
         description="Service availability map"
     )
+    dependencies: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Cached dependency probes (status, latency, timestamps)"
+    )
     
     class Config:
         schema_extra = {
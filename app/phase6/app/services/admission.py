@@ -0,0 +1,281 @@
+"""
+═══════════════════════════════════════════════════════════════════════════
+PROJECT HYPERION - PHASE 6: ADMISSION CONTROL
+═══════════════════════════════════════════════════════════════════════════
+Module: app/services/admission.py
+Purpose: Bound concurrent /oracle/run executions and shed excess load fast
+═══════════════════════════════════════════════════════════════════════════
+
+Storms raise /oracle/run traffic exactly when provider latency rises. Without
+a bound every request starts at once and all of them get slow. Here at most
+PHASE6_ADMISSION_CONCURRENCY pipelines run; the rest wait in a bounded queue
+(PHASE6_ADMISSION_QUEUE) ordered by lane, then arrival:
+
+- priority: requests flagged high_priority, and policies whose last reading
+  was within PHASE6_PRIORITY_FRACTION of their threshold
+- normal: everything else
+
+A request is rejected with Phase6AdmissionRejected (503 + Retry-After) when
+it cannot start within its budget: the queue is full, its expected wait
+already exceeds the time left before its deadline (minus a typical pipeline
+run), or it waited PHASE6_ADMISSION_MAX_WAIT_MS. A full queue sheds its
+newest normal request to make room for a priority one.
+"""
+
+import os
+import math
+import time
+import heapq
+import asyncio
+import logging
+import itertools
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+LANE_PRIORITY = "priority"
+LANE_NORMAL = "normal"
+_LANE_RANK = {LANE_PRIORITY: 0, LANE_NORMAL: 1}
+
+REJECT_QUEUE_FULL = "queue_full"
+REJECT_DEADLINE = "deadline"
+REJECT_TIMEOUT = "wait_timeout"
+REJECT_SHED = "shed"
+
+_registry = get_metrics_registry()
+ADMISSIONS = _registry.counter(
+    "hyperion_admission_total",
+    "Oracle run admission decisions by lane (admitted or the rejection reason)",
+    ("lane", "result"),
+)
+ADMISSION_WAIT = _registry.histogram(
+    "hyperion_admission_wait_seconds",
+    "Time admitted oracle runs waited for a slot",
+    ("lane",),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+
+class Phase6AdmissionRejected(Exception):
+    """Raised when a request cannot start within its budget."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Oracle busy ({reason}), retry in {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Phase6AdmissionController:
+    """
+    Concurrency limit with a bounded, lane-ordered waiting queue.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        max_queue: int = 32,
+        max_wait_seconds: float = 5.0,
+        near_threshold_fraction: float = 0.85,
+        max_tracked_policies: int = 10000
+    ):
+        """
+        Args:
+            max_concurrent: Pipelines running at once
+            max_queue: Requests waiting for a slot
+            max_wait_seconds: Longest wait for a slot
+            near_threshold_fraction: Reading/threshold ratio that earns the priority lane
+            max_tracked_policies: Last readings kept for lane selection
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.max_wait_seconds = max_wait_seconds
+        self.near_threshold_fraction = near_threshold_fraction
+        self.max_tracked_policies = max_tracked_policies
+        self.active = 0
+        # Typical pipeline run (EWMA), used for expected waits and Retry-After
+        self.service_seconds = 1.0
+        self._waiters: List[Tuple[int, int, str, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._readings: "OrderedDict[str, float]" = OrderedDict()
+
+    # ───────────────────────────────────────────────────────────────────────
+    # Lanes
+    # ───────────────────────────────────────────────────────────────────────
+
+    def note_reading(self, policy_id: str, wind_speed: int, threshold_wind_speed: int) -> None:
+        """Remember how close a policy's last reading was to its threshold."""
+        if threshold_wind_speed <= 0:
+            return
+        self._readings[policy_id] = wind_speed / threshold_wind_speed
+        self._readings.move_to_end(policy_id)
+        while len(self._readings) > self.max_tracked_policies:
+            self._readings.popitem(last=False)
+
+    def lane_for(self, policy_id: str, high_priority: bool = False) -> str:
+        """Priority lane for flagged requests and near-threshold policies."""
+        if high_priority:
+            return LANE_PRIORITY
+        ratio = self._readings.get(policy_id)
+        if ratio is not None and ratio >= self.near_threshold_fraction:
+            return LANE_PRIORITY
+        return LANE_NORMAL
+
+    # ───────────────────────────────────────────────────────────────────────
+    # Admission
+    # ───────────────────────────────────────────────────────────────────────
+
+    def _queued_ahead(self, lane: str) -> int:
+        rank = _LANE_RANK[lane]
+        return sum(1 for entry in self._waiters if entry[0] <= rank and not entry[3].done())
+
+    def expected_wait(self, lane: str) -> float:
+        """Seconds until a new request in `lane` would likely start."""
+        if self.active < self.max_concurrent and not self._waiters:
+            return 0.0
+        return (self._queued_ahead(lane) // self.max_concurrent + 1) * self.service_seconds
+
+    def retry_after(self) -> int:
+        """Retry-After seconds for rejected requests (queue drain estimate)."""
+        return max(1, math.ceil(self.expected_wait(LANE_NORMAL)))
+
+    def _reject(self, lane: str, reason: str) -> Phase6AdmissionRejected:
+        ADMISSIONS.labels(lane, reason).inc()
+        logger.warning(
+            f"🚦 Oracle run rejected ({reason}, lane {lane}): "
+            f"{self.active} running, {len(self._waiters)} queued",
+            extra={"admission": reason, "lane": lane}
+        )
+        return Phase6AdmissionRejected(reason, self.retry_after())
+
+    def _shed_newest_normal(self) -> bool:
+        normal = [entry for entry in self._waiters if entry[0] == _LANE_RANK[LANE_NORMAL]]
+        if not normal:
+            return False
+        victim = max(normal, key=lambda entry: entry[1])
+        self._waiters.remove(victim)
+        heapq.heapify(self._waiters)
+        if not victim[3].done():
+            victim[3].set_exception(self._reject(LANE_NORMAL, REJECT_SHED))
+        return True
+
+    async def acquire(self, lane: str, deadline: float) -> float:
+        """
+        Wait for a pipeline slot.
+
+        Args:
+            lane: LANE_PRIORITY or LANE_NORMAL
+            deadline: time.monotonic() by which the response is due
+
+        Returns:
+            float: Seconds waited
+
+        Raises:
+            Phase6AdmissionRejected: No slot within the request's budget
+        """
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            ADMISSIONS.labels(lane, "admitted").inc()
+            ADMISSION_WAIT.labels(lane).observe(0.0)
+            return 0.0
+
+        start = time.monotonic()
+        budget = min(self.max_wait_seconds, deadline - start - self.service_seconds)
+        if budget <= 0 or self.expected_wait(lane) > budget:
+            raise self._reject(lane, REJECT_DEADLINE)
+        if len(self._waiters) >= self.max_queue:
+            if lane != LANE_PRIORITY or not self._shed_newest_normal():
+                raise self._reject(lane, REJECT_QUEUE_FULL)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (_LANE_RANK[lane], next(self._sequence), lane, future)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await asyncio.wait_for(future, budget)
+        except Phase6AdmissionRejected:
+            raise
+        except BaseException as e:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Granted just as we gave up: hand the slot on
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._reject(lane, REJECT_TIMEOUT)
+            raise
+
+        waited = time.monotonic() - start
+        ADMISSIONS.labels(lane, "admitted").inc()
+        ADMISSION_WAIT.labels(lane).observe(waited)
+        return waited
+
+    def release(self, service_seconds: Optional[float] = None) -> None:
+        """
+        Free a slot, handing it straight to the next waiter.
+
+        Args:
+            service_seconds: How long the finished pipeline ran (updates the EWMA)
+        """
+        if service_seconds is not None:
+            self.service_seconds = 0.8 * self.service_seconds + 0.2 * service_seconds
+        while self._waiters:
+            _, _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active = max(0, self.active - 1)
+
+    def status(self) -> Dict[str, Any]:
+        queued = {lane: 0 for lane in _LANE_RANK}
+        for _, _, lane, future in self._waiters:
+            if not future.done():
+                queued[lane] += 1
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queued": queued,
+            "service_seconds": round(self.service_seconds, 3),
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SINGLETON
+# ═══════════════════════════════════════════════════════════════════════════
+
+_admission_instance: Optional[Phase6AdmissionController] = None
+
+
+def get_admission_controller() -> Phase6AdmissionController:
+    """
+    Get or create the singleton Phase6AdmissionController.
+
+    Returns:
+        Phase6AdmissionController: Configured from PHASE6_ADMISSION_* and
+        PHASE6_PRIORITY_FRACTION
+    """
+    global _admission_instance
+
+    if _admission_instance is None:
+        _admission_instance = Phase6AdmissionController(
+            max_concurrent=int(os.getenv("PHASE6_ADMISSION_CONCURRENCY", "8")),
+            max_queue=int(os.getenv("PHASE6_ADMISSION_QUEUE", "32")),
+            max_wait_seconds=float(os.getenv("PHASE6_ADMISSION_MAX_WAIT_MS", "5000")) / 1000,
+            near_threshold_fraction=float(os.getenv("PHASE6_PRIORITY_FRACTION", "0.85")),
+        )
+        _registry.callback_gauge(
+            "hyperion_admission_queue_depth",
+            "Oracle runs waiting for a slot by lane",
+            lambda: {(lane,): count for lane, count in _admission_instance.status()["queued"].items()},
+            ("lane",),
+        )
+        _registry.callback_gauge(
+            "hyperion_admission_active",
+            "Oracle runs holding a slot",
+            lambda: _admission_instance.active,
+        )
+
+    return _admission_instance
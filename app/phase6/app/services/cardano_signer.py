@@ -8,6 +8,7 @@ Purpose: Ed25519 message signing for oracle payloads
 """
 
 import os
+import time
 import logging
 from typing import Optional
 import hashlib
@@ -22,6 +23,8 @@ except ImportError:
     logging.warning("PyNaCl not available - install with: pip install pynacl")
 
 from app.models import Phase6CanonicalMessage
+from app.services.metrics import observe_signature
+from app.services.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +65,7 @@ class Phase6CardanoSigner:
         except Exception as e:
             raise ValueError(f"Invalid CARDANO_SK_HEX: {e}")
     
+    @traced("cardano.sign")
     async def sign_oracle_message(
         self,
         policy_id: str,
@@ -86,6 +90,7 @@ class Phase6CardanoSigner:
             Signature as hex string (64 bytes = 128 hex chars)
         """
         logger.info("🔐 Signing oracle message...")
+        start = time.perf_counter()
         
         try:
             # Build canonical message (MUST match Phase 3 Aiken validator!)
@@ -115,12 +120,30 @@ class Phase6CardanoSigner:
             # Verify signature immediately (sanity check)
             self._verify_signature(message_bytes, signature_bytes)
             
+            observe_signature("phase6_arbiter", time.perf_counter() - start)
             return signature_hex
         
         except Exception as e:
             logger.error(f"❌ Signing failed: {e}")
             raise
     
+    def warm_up(self) -> bool:
+        """
+        Sign and verify a throwaway message.
+        
+        Exercises the libsodium code paths and proves the key is usable
+        before the first real trigger needs it.
+        
+        Returns:
+            True when the self-test passed
+        
+        Raises:
+            ValueError: If the signature does not verify
+        """
+        message = b"hyperion-phase6-warmup"
+        self._verify_signature(message, self.signing_key.sign(message).signature)
+        return True
+    
     def _verify_signature(self, message: bytes, signature: bytes):
         """
         Verify signature (sanity check).
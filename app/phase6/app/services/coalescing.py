@@ -0,0 +1,178 @@
+"""
+═══════════════════════════════════════════════════════════════════════════
+PROJECT HYPERION - PHASE 6: REQUEST COALESCING
+═══════════════════════════════════════════════════════════════════════════
+Module: app/services/coalescing.py
+Purpose: One oracle execution per policy at a time, shared by duplicates
+═══════════════════════════════════════════════════════════════════════════
+
+Two concurrent /oracle/run calls for the same policy used to run the full
+pipeline twice, burning two Arbiter nonces and possibly signing one event
+twice. Now:
+
+- duplicates (same policy, location, coordinates and threshold) arriving
+  while an execution is in flight join it and receive the same response;
+  the execution runs in its own task, so it survives the first caller
+  disconnecting
+- an execution started with a smaller response budget is not joined: its
+  optional stages may have been cut to fit a deadline the joiner never had
+- different requests for the same policy are serialised by a keyed lock
+  (one asyncio.Lock per policy, dropped when nobody holds or waits for it)
+
+Joined requests are counted in hyperion_coalesced_requests_total.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_registry = get_metrics_registry()
+COALESCED = _registry.counter(
+    "hyperion_coalesced_requests_total",
+    "Requests that joined an identical in-flight execution instead of running it",
+    ("operation",),
+)
+
+
+class Phase6KeyedLocks:
+    """
+    asyncio.Lock per key, created on demand and dropped when unused.
+    """
+
+    def __init__(self):
+        # key -> [lock, holders + waiters]
+        self._locks: Dict[Hashable, List[Any]] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Hold the lock of `key` for the block.
+
+        Args:
+            key: Lock key (policy_id)
+            timeout: Longest wait for the lock
+
+        Raises:
+            asyncio.TimeoutError: The lock was not acquired in time
+        """
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        lock: asyncio.Lock = entry[0]
+        entry[1] += 1
+        try:
+            if timeout is None or not lock.locked():
+                await lock.acquire()
+            else:
+                await asyncio.wait_for(lock.acquire(), max(timeout, 0.0))
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class Phase6RequestCoalescer:
+    """
+    Single-flight executions keyed by request identity.
+    """
+
+    def __init__(self, operation: str = "oracle_run"):
+        """
+        Args:
+            operation: Label of the coalesced metric
+        """
+        self.operation = operation
+        self.locks = Phase6KeyedLocks()
+        self.coalesced = 0
+        # key -> (execution task, response budget it runs under)
+        self._inflight: Dict[Hashable, Tuple[asyncio.Task, Optional[float]]] = {}
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here even if every caller gave up
+
+    async def run(
+        self,
+        key: Hashable,
+        execute: Callable[[], Awaitable[Any]],
+        join_timeout: Optional[float] = None,
+        budget: Optional[float] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Run `execute()` for `key`, or join the execution already in flight.
+
+        Args:
+            key: Request identity
+            execute: Zero-argument coroutine function doing the work
+            join_timeout: Longest wait when joining (the caller's deadline)
+            budget: The caller's response budget; an in-flight execution
+                started with a smaller one is not joined
+
+        Returns:
+            Tuple[Any, bool]: The execution's result and whether it was joined
+
+        Raises:
+            Whatever the execution raised (for every caller);
+            asyncio.TimeoutError when a joined execution outlives join_timeout
+        """
+        entry = self._inflight.get(key)
+        joined = entry is not None and (budget is None or entry[1] is None or entry[1] >= budget)
+        if joined:
+            task = entry[0]
+            self.coalesced += 1
+            COALESCED.labels(self.operation).inc()
+            logger.info(f"🔗 Joined in-flight {self.operation} ({len(self._inflight)} in flight)")
+        else:
+            # Later duplicates join this (larger-budget) execution
+            task = asyncio.get_running_loop().create_task(execute())
+            self._inflight[key] = (task, budget)
+            task.add_done_callback(lambda done: self._finished(key, done))
+
+        waiter = asyncio.shield(task)
+        if joined and join_timeout is not None:
+            return await asyncio.wait_for(waiter, max(join_timeout, 0.0)), joined
+        return await waiter, joined
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._inflight),
+            "locked_keys": len(self.locks),
+            "coalesced": self.coalesced,
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SINGLETON
+# ═══════════════════════════════════════════════════════════════════════════
+
+_coalescer_instance: Optional[Phase6RequestCoalescer] = None
+
+
+def get_request_coalescer() -> Phase6RequestCoalescer:
+    """
+    Get or create the singleton Phase6RequestCoalescer for /oracle/run.
+
+    Returns:
+        Phase6RequestCoalescer: Shared coalescer and per-policy locks
+    """
+    global _coalescer_instance
+
+    if _coalescer_instance is None:
+        _coalescer_instance = Phase6RequestCoalescer("oracle_run")
+
+    return _coalescer_instance
@@ -0,0 +1,91 @@
+"""
+═══════════════════════════════════════════════════════════════════════════
+PROJECT HYPERION - PHASE 6: REQUEST DEADLINES
+═══════════════════════════════════════════════════════════════════════════
+Module: app/services/deadline.py
+Purpose: One response budget per /oracle/run, shared by every stage
+═══════════════════════════════════════════════════════════════════════════
+
+Outbound calls used to take an independent 10 s timeout each, so one request
+could run 20+ s across sequential fallbacks after its client had given up.
+execute_oracle_pipeline() now passes a Phase6Deadline down to the agents
+and services:
+
+- every provider call is bounded by timeout(cap): the smaller of its own
+  cap and the time left, minus a reserve kept for the Arbiter
+  (PHASE6_DECIDE_RESERVE_MS) so a signed answer can still go out
+- stages that are optional give way when the budget runs low (the Auditor
+  skips secondary validation and lowers confidence) and record it with
+  cut(); the response lists them in stages_cut
+- when nothing is left for a required stage, Phase6DeadlineExceeded
+  (a TimeoutError) is raised and /oracle/run answers 504
+"""
+
+import os
+import time
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Phase6DeadlineExceeded(TimeoutError):
+    """Raised when a required stage has no budget left."""
+
+
+class Phase6Deadline:
+    """
+    Request-scoped deadline (time.monotonic based).
+    """
+
+    def __init__(self, budget_seconds: float, reserve_seconds: Optional[float] = None):
+        """
+        Args:
+            budget_seconds: Time until the response is due
+            reserve_seconds: Budget kept back from provider calls for the
+                Arbiter (default PHASE6_DECIDE_RESERVE_MS)
+        """
+        if reserve_seconds is None:
+            reserve_seconds = float(os.getenv("PHASE6_DECIDE_RESERVE_MS", "200")) / 1000
+        self.budget_seconds = budget_seconds
+        self.reserve_seconds = reserve_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+        self.stages_cut: List[str] = []
+
+    def remaining(self) -> float:
+        """Seconds left before the response is due (negative once late)."""
+        return self.expires_at - time.monotonic()
+
+    def available(self) -> float:
+        """Seconds left for provider calls (remaining minus the reserve)."""
+        return self.remaining() - self.reserve_seconds
+
+    def timeout(self, cap: float, stage: str = "call") -> float:
+        """
+        Timeout for one await: its own cap or the available budget.
+
+        Args:
+            cap: The call's usual timeout
+            stage: Name used in the error
+
+        Returns:
+            float: Seconds the call may take
+
+        Raises:
+            Phase6DeadlineExceeded: No budget left
+        """
+        available = self.available()
+        if available <= 0:
+            raise Phase6DeadlineExceeded(
+                f"No budget left for {stage} ({self.budget_seconds * 1000:.0f}ms request budget)"
+            )
+        return min(cap, available)
+
+    def cut(self, stage: str, reason: str) -> None:
+        """Record a stage skipped or shortened for lack of budget."""
+        if stage not in self.stages_cut:
+            self.stages_cut.append(stage)
+        logger.warning(
+            f"✂️  Stage {stage} cut: {reason} ({self.remaining() * 1000:.0f}ms left)",
+            extra={"stage_cut": stage}
+        )
@@ -0,0 +1,216 @@
+"""
+═══════════════════════════════════════════════════════════════════════════
+PROJECT HYPERION - PHASE 6: PIPELINE FLIGHT RECORDER
+═══════════════════════════════════════════════════════════════════════════
+Module: app/services/flight_recorder.py
+Purpose: Keep the last N oracle pipeline executions in memory
+═══════════════════════════════════════════════════════════════════════════
+
+Each execution of Phase6OracleSwarm.execute_oracle_pipeline() leaves one
+compact record: inputs, per-stage start/end offsets, provider latencies
+and the decision (or the error). Records live in a fixed-size
+ring, so memory is constant; GET /oracle/flights reads them back filtered by
+policy and by a slow threshold.
+
+Provider clients annotate the running execution through note_provider(),
+which looks the record up in a context variable. With
+PHASE6_FLIGHT_RECORDER_SIZE=0 no record is created and the call reduces to
+one context-variable read.
+"""
+
+import os
+import time
+import logging
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_current_flight: ContextVar[Optional["Phase6FlightRecord"]] = ContextVar(
+    "phase6_current_flight", default=None
+)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+class Phase6FlightRecord:
+    """
+    One pipeline execution. Timings are kept as offsets from the start
+    (perf_counter) and only expanded into dicts when read.
+    """
+
+    __slots__ = (
+        "flight_id", "policy_id", "location_id", "inputs", "started_at",
+        "_t0", "duration_ms", "stages", "providers", "decision", "error",
+    )
+
+    def __init__(self, flight_id: int, policy_id: str, location_id: str, inputs: Dict[str, Any]):
+        self.flight_id = flight_id
+        self.policy_id = policy_id
+        self.location_id = location_id
+        self.inputs = inputs
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.stages: List[Tuple[str, float, float, bool]] = []
+        self.providers: List[Tuple[str, float, float, Optional[str]]] = []
+        self.decision: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time one pipeline stage (failed if the block raises)."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.stages.append((name, start - self._t0, time.perf_counter() - self._t0, ok))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Expanded, JSON-ready view of the record."""
+        return {
+            "flight_id": self.flight_id,
+            "policy_id": self.policy_id,
+            "location_id": self.location_id,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "inputs": self.inputs,
+            "stages": [
+                {
+                    "stage": name,
+                    "start_ms": _ms(start),
+                    "end_ms": _ms(end),
+                    "duration_ms": _ms(end - start),
+                    "outcome": "ok" if ok else "error",
+                }
+                for name, start, end, ok in self.stages
+            ],
+            "providers": [
+                {"provider": name, "at_ms": _ms(at), "latency_ms": _ms(latency), "error": error}
+                for name, at, latency, error in self.providers
+            ],
+            "decision": self.decision,
+            "error": self.error,
+        }
+
+
+class Phase6FlightRecorder:
+    """
+    Fixed-size ring of recent pipeline executions.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Args:
+            capacity: Executions kept (0 disables recording)
+        """
+        self.capacity = max(0, capacity)
+        self.enabled = self.capacity > 0
+        self.recorded = 0
+        self._ring: Deque[Phase6FlightRecord] = deque(maxlen=self.capacity or 1)
+
+    @contextmanager
+    def record(
+        self,
+        policy_id: str,
+        location_id: str,
+        **inputs: Any
+    ) -> Iterator[Optional[Phase6FlightRecord]]:
+        """
+        Record one execution; yields None when the recorder is disabled.
+
+        The record is stored when the block exits, with the error if it raised.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        self.recorded += 1
+        flight = Phase6FlightRecord(self.recorded, policy_id, location_id, inputs)
+        token = _current_flight.set(flight)
+        try:
+            yield flight
+        except BaseException as e:
+            flight.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_flight.reset(token)
+            flight.duration_ms = _ms(time.perf_counter() - flight._t0)
+            self._ring.append(flight)
+
+    def flights(
+        self,
+        policy_id: Optional[str] = None,
+        min_duration_ms: Optional[float] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Recorded executions, newest first.
+
+        Args:
+            policy_id: Only this policy
+            min_duration_ms: Only executions at least this slow
+            limit: Maximum records returned
+
+        Returns:
+            Expanded records
+        """
+        matches = []
+        for flight in reversed(list(self._ring)):
+            if policy_id is not None and flight.policy_id != policy_id:
+                continue
+            if min_duration_ms is not None and (flight.duration_ms or 0) < min_duration_ms:
+                continue
+            matches.append(flight.to_dict())
+            if len(matches) >= limit:
+                break
+        return matches
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "capacity": self.capacity,
+            "recorded": self.recorded,
+            "buffered": len(self._ring) if self.enabled else 0,
+        }
+
+
+def note_provider(name: str, seconds: float, error: Optional[BaseException] = None) -> None:
+    """Attach a provider call to the running execution (if one is recorded)."""
+    flight = _current_flight.get()
+    if flight is not None:
+        flight.providers.append((
+            name,
+            time.perf_counter() - seconds - flight._t0,
+            seconds,
+            None if error is None else type(error).__name__,
+        ))
+
+
+# Singleton instance
+_recorder_instance: Optional[Phase6FlightRecorder] = None
+
+
+def get_flight_recorder() -> Phase6FlightRecorder:
+    """
+    Get or create the singleton flight recorder.
+
+    Returns:
+        Phase6FlightRecorder sized by PHASE6_FLIGHT_RECORDER_SIZE (0 disables)
+    """
+    global _recorder_instance
+
+    if _recorder_instance is None:
+        _recorder_instance = Phase6FlightRecorder(
+            capacity=int(os.getenv("PHASE6_FLIGHT_RECORDER_SIZE", "256"))
+        )
+        if _recorder_instance.enabled:
+            logger.info(f"✈️  Flight recorder keeping the last {_recorder_instance.capacity} pipelines")
+
+    return _recorder_instance
@@ -0,0 +1,515 @@
+"""
+PROJECT HYPERION - PHASE 7: FORENSIC REPORT ARCHIVE
+====================================================
+
+Purpose: Keep every generated forensic report, with the oracle payload it
+         explains, in a compact append-only archive for audits.
+
+Layout (FORENSICS_ARCHIVE_DIR):
+- segment-000001.log, segment-000002.log, ...: append-only segment files,
+  rolled at FORENSICS_ARCHIVE_SEGMENT_MB
+- Each segment is a sequence of blocks. A block holds up to
+  FORENSICS_ARCHIVE_BLOCK_RECORDS records as JSON lines, compressed with
+  zstd (if the zstandard package is installed) or gzip:
+
+    magic "HFAB" | codec (1 byte) | raw length | compressed length | crc32
+    (big-endian uint32s) followed by the compressed payload
+
+- index.db: SQLite index of (policy_id, measurement_time) -> (segment,
+  block offset, slot). Lookups and range scans read only the blocks they
+  need; recently decoded blocks are cached.
+
+Writes:
+- submit() only enqueues; a background thread batches records into blocks,
+  appends them and updates the index, so the request path never touches
+  disk. When the queue is full, or the writer is not running (start() is
+  left to the startup hook, off the event loop), records are dropped and
+  counted.
+- Each block is fsynced before its index rows are committed. On start,
+  blocks appended after the last indexed block (crash between append and
+  index) are re-indexed and a torn trailing block is truncated; if the last
+  indexed block itself is missing (OS crash), the segment's index is rebuilt
+  from the blocks that are readable.
+"""
+
+import os
+import gzip
+import json
+import time
+import queue
+import struct
+import sqlite3
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.metrics import count_cache
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+BLOCK_MAGIC = b"HFAB"
+BLOCK_HEADER = struct.Struct(">4sBIII")
+CODEC_GZIP = 1
+CODEC_ZSTD = 2
+CODEC_NAMES = {"gzip": CODEC_GZIP, "zstd": CODEC_ZSTD}
+
+_STOP = object()
+
+
+def compress_block(raw: bytes, codec: int) -> bytes:
+    """Compress a block payload with the given codec"""
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(raw)
+    return gzip.compress(raw, compresslevel=6, mtime=0)
+
+
+def decompress_block(data: bytes, codec: int) -> bytes:
+    """Decompress a block payload"""
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard not installed. Run: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class ForensicReportArchive:
+    """
+    Append-only, block-compressed report archive with a SQLite index
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        block_records: int = 64,
+        flush_seconds: float = 1.0,
+        queue_size: int = 10000,
+        codec: str = "auto",
+        cache_blocks: int = 32
+    ):
+        """
+        Args:
+            directory: Archive directory (created if missing)
+            segment_bytes: Size at which a new segment file is started
+            block_records: Maximum records per compressed block
+            flush_seconds: Maximum time a record waits before its block is written
+            queue_size: Maximum records waiting for the writer
+            codec: "zstd", "gzip" or "auto" (zstd when installed)
+            cache_blocks: Decoded blocks kept in memory for reads
+        """
+        if codec == "auto":
+            codec = "zstd" if zstandard is not None else "gzip"
+        if codec not in CODEC_NAMES:
+            raise ValueError(f"Unknown archive codec '{codec}'. Expected: zstd, gzip, auto")
+        if codec == "zstd" and zstandard is None:
+            raise ImportError("zstandard not installed. Run: pip install zstandard")
+
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.block_records = max(1, block_records)
+        self.flush_seconds = flush_seconds
+        self.codec = CODEC_NAMES[codec]
+        self.cache_blocks = cache_blocks
+        self.stats = {
+            "archived": 0,
+            "dropped": 0,
+            "blocks": 0,
+            "raw_bytes": 0,
+            "compressed_bytes": 0,
+        }
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[int, int], List[Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._segment = 0
+        self._segment_file = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Open the archive, recover the active segment and start the writer"""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+
+            os.makedirs(self.directory, exist_ok=True)
+            self._conn = sqlite3.connect(
+                os.path.join(self.directory, "index.db"), check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS records (
+                    policy_id TEXT NOT NULL,
+                    measurement_time INTEGER NOT NULL,
+                    segment INTEGER NOT NULL,
+                    block_offset INTEGER NOT NULL,
+                    slot INTEGER NOT NULL,
+                    archived_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_records_policy
+                    ON records (policy_id, measurement_time);
+                CREATE INDEX IF NOT EXISTS idx_records_time
+                    ON records (measurement_time);
+                """
+            )
+            self._conn.commit()
+
+            segments = self._segment_numbers()
+            self._segment = segments[-1] if segments else 1
+            self._recover(self._segment)
+            self._segment_file = open(self._segment_path(self._segment), "ab")
+
+            self._thread = threading.Thread(
+                target=self._writer, name="forensic-archive-writer", daemon=True
+            )
+            self._thread.start()
+            logger.info(f"Forensic report archive open at {self.directory}")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush queued records and stop the writer"""
+        with self._start_lock:
+            if self._thread is None:
+                return
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+            self._segment_file.close()
+            self._conn.close()
+            self._conn = None
+
+    def flush(self, timeout: float = 10.0) -> None:
+        """Wait until every record submitted so far is written and indexed"""
+        deadline = time.time() + timeout
+        while self._thread is not None and self._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def submit(self, record: Dict[str, Any]) -> bool:
+        """
+        Queue a report record for archiving (never blocks)
+
+        Args:
+            record: Dict with at least policy_id, measurement_time and report
+
+        Returns:
+            bool: False if the record was dropped because the writer is not
+            running or the queue is full
+        """
+        if self._thread is None:
+            self.stats["dropped"] += 1
+            logger.warning(f"Archive writer not running. Dropped report for policy {record.get('policy_id')}")
+            return False
+
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self.stats["dropped"] += 1
+            logger.warning(f"Archive queue full. Dropped report for policy {record.get('policy_id')}")
+            return False
+
+    def _writer(self) -> None:
+        pending: List[Dict[str, Any]] = []
+        first_pending_at = 0.0
+
+        while True:
+            timeout = self.flush_seconds
+            if pending:
+                timeout = max(0.0, first_pending_at + self.flush_seconds - time.time())
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is not None and item is not _STOP:
+                if not pending:
+                    first_pending_at = time.time()
+                pending.append(item)
+
+            flush_due = item is None or item is _STOP or len(pending) >= self.block_records
+            if pending and flush_due:
+                try:
+                    self._write_block(pending)
+                except Exception as e:
+                    logger.error(f"Archive write failed ({len(pending)} records lost): {e}")
+                for _ in pending:
+                    self._queue.task_done()
+                pending = []
+
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+    def _write_block(self, records: List[Dict[str, Any]]) -> None:
+        raw = "\n".join(json.dumps(r, separators=(",", ":")) for r in records).encode()
+        payload = compress_block(raw, self.codec)
+        header = BLOCK_HEADER.pack(BLOCK_MAGIC, self.codec, len(raw), len(payload), zlib.crc32(payload))
+
+        if self._segment_file.tell() and self._segment_file.tell() + len(header) + len(payload) > self.segment_bytes:
+            self._segment_file.close()
+            self._segment += 1
+            self._segment_file = open(self._segment_path(self._segment), "ab")
+
+        offset = self._segment_file.tell()
+        self._segment_file.write(header + payload)
+        self._segment_file.flush()
+        # On disk before the index points at it (an OS crash must not leave
+        # index rows for a block that was never written)
+        os.fsync(self._segment_file.fileno())
+
+        self._index_block(self._segment, offset, records)
+
+        self.stats["archived"] += len(records)
+        self.stats["blocks"] += 1
+        self.stats["raw_bytes"] += len(raw)
+        self.stats["compressed_bytes"] += len(header) + len(payload)
+
+    def _index_block(self, segment: int, offset: int, records: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._index_lock:
+            self._conn.executemany(
+                "INSERT INTO records (policy_id, measurement_time, segment, block_offset, slot, archived_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (r["policy_id"], int(r["measurement_time"]), segment, offset, slot, r.get("archived_at", now))
+                    for slot, r in enumerate(records)
+                ],
+            )
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Segments and recovery
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.log")
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith("segment-") and name.endswith(".log"):
+                numbers.append(int(name[8:-4]))
+        return sorted(numbers)
+
+    def _read_block_at(self, handle, offset: int) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """Read one block; returns (block end offset, records) or None if torn/corrupt"""
+        handle.seek(offset)
+        header = handle.read(BLOCK_HEADER.size)
+        if len(header) < BLOCK_HEADER.size:
+            return None
+
+        magic, codec, raw_len, comp_len, crc = BLOCK_HEADER.unpack(header)
+        if magic != BLOCK_MAGIC:
+            return None
+
+        payload = handle.read(comp_len)
+        if len(payload) < comp_len or zlib.crc32(payload) != crc:
+            return None
+
+        raw = decompress_block(payload, codec)
+        records = [json.loads(line) for line in raw.decode().split("\n")]
+        return offset + BLOCK_HEADER.size + comp_len, records
+
+    def _recover(self, segment: int) -> None:
+        path = self._segment_path(segment)
+        if not os.path.exists(path):
+            return
+
+        row = self._conn.execute(
+            "SELECT MAX(block_offset) FROM records WHERE segment = ?", (segment,)
+        ).fetchone()
+        last_indexed = row[0]
+
+        with open(path, "rb") as handle:
+            position = 0
+            if last_indexed is not None:
+                block = self._read_block_at(handle, last_indexed)
+                if block:
+                    position = block[0]
+                else:
+                    # The index points at a block that never reached disk:
+                    # drop the segment's rows and re-index what is readable,
+                    # so no stale row shadows a block appended at that offset
+                    logger.warning(
+                        f"Archive segment {segment}: indexed block at offset {last_indexed} "
+                        f"is missing, rebuilding the segment index"
+                    )
+                    with self._index_lock:
+                        self._conn.execute("DELETE FROM records WHERE segment = ?", (segment,))
+                        self._conn.commit()
+
+            recovered = 0
+            while True:
+                block = self._read_block_at(handle, position)
+                if block is None:
+                    break
+                self._index_block(segment, position, block[1])
+                recovered += len(block[1])
+                position = block[0]
+
+        if os.path.getsize(path) > position:
+            logger.warning(f"Archive segment {segment}: truncating torn block at offset {position}")
+            with open(path, "r+b") as handle:
+                handle.truncate(position)
+        if recovered:
+            logger.info(f"Archive segment {segment}: re-indexed {recovered} records")
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _block(self, segment: int, offset: int) -> List[Dict[str, Any]]:
+        key = (segment, offset)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                count_cache("archive_blocks", True)
+                return self._cache[key]
+        count_cache("archive_blocks", False)
+
+        with open(self._segment_path(segment), "rb") as handle:
+            block = self._read_block_at(handle, offset)
+        if block is None:
+            raise RuntimeError(f"Corrupt archive block at segment {segment} offset {offset}")
+
+        with self._cache_lock:
+            self._cache[key] = block[1]
+            while len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        return block[1]
+
+    def _query(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        if self._conn is None:
+            self.start()
+        with self._index_lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._block(segment, offset)[slot] for segment, offset, slot in rows]
+
+    def lookup(
+        self,
+        policy_id: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Archived reports for one policy, oldest measurement first
+
+        Args:
+            policy_id: Policy identifier
+            start: Optional minimum measurement_time (inclusive)
+            end: Optional maximum measurement_time (inclusive)
+            limit: Maximum records returned
+
+        Returns:
+            List[Dict]: Archived records
+        """
+        return self._query(
+            "SELECT segment, block_offset, slot FROM records "
+            "WHERE policy_id = ? AND measurement_time BETWEEN ? AND ? "
+            "ORDER BY measurement_time, segment, block_offset, slot LIMIT ?",
+            (policy_id, start if start is not None else -2**62, end if end is not None else 2**62, limit),
+        )
+
+    def range_scan(self, start: int, end: int, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Archived reports measured between start and end (inclusive)
+
+        Args:
+            start: Minimum measurement_time
+            end: Maximum measurement_time
+            limit: Maximum records returned
+
+        Returns:
+            List[Dict]: Archived records ordered by measurement_time
+        """
+        return self._query(
+            "SELECT segment, block_offset, slot FROM records "
+            "WHERE measurement_time BETWEEN ? AND ? "
+            "ORDER BY measurement_time, segment, block_offset, slot LIMIT ?",
+            (start, end, limit),
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """Writer counters and compression ratio"""
+        stats = dict(self.stats)
+        return {
+            "directory": self.directory,
+            "codec": "zstd" if self.codec == CODEC_ZSTD else "gzip",
+            "segment": self._segment,
+            "queued": self._queue.qsize(),
+            "compression_ratio": round(stats["raw_bytes"] / stats["compressed_bytes"], 2)
+            if stats["compressed_bytes"] else None,
+            "stats": stats,
+        }
+
+
+def build_archive_record(data: Dict[str, Any], report: str) -> Dict[str, Any]:
+    """
+    Build the archived form of a generated report
+
+    Args:
+        data: Report request ('oracle_payload', optional 'policy_metadata', 'report_mode')
+        report: Generated report text
+
+    Returns:
+        dict: Archive record
+    """
+    payload = data["oracle_payload"]
+    return {
+        "policy_id": payload["policy_id"],
+        "measurement_time": payload["measurement_time"],
+        "archived_at": time.time(),
+        "report_mode": data.get("report_mode"),
+        "oracle_payload": payload,
+        "policy_metadata": data.get("policy_metadata"),
+        "report": report,
+    }
+
+
+# Singleton instance for reuse across requests
+_archive_instance: Optional[ForensicReportArchive] = None
+
+
+def get_report_archive() -> Optional[ForensicReportArchive]:
+    """
+    Get or create the singleton ForensicReportArchive
+
+    Returns:
+        ForensicReportArchive: Archive configured from environment,
+        or None when FORENSICS_ARCHIVE=0
+    """
+    global _archive_instance
+
+    if os.getenv("FORENSICS_ARCHIVE", "1") != "1":
+        return None
+
+    if _archive_instance is None:
+        _archive_instance = ForensicReportArchive(
+            directory=os.getenv("FORENSICS_ARCHIVE_DIR", "forensic_archive"),
+            segment_bytes=int(float(os.getenv("FORENSICS_ARCHIVE_SEGMENT_MB", "64")) * 1024 * 1024),
+            block_records=int(os.getenv("FORENSICS_ARCHIVE_BLOCK_RECORDS", "64")),
+            flush_seconds=float(os.getenv("FORENSICS_ARCHIVE_FLUSH_SECONDS", "1")),
+            queue_size=int(os.getenv("FORENSICS_ARCHIVE_QUEUE", "10000")),
+            codec=os.getenv("FORENSICS_ARCHIVE_CODEC", "auto").lower(),
+        )
+
+    return _archive_instance
@@ -0,0 +1,326 @@
+"""
+PROJECT HYPERION - PHASE 7: FORENSIC MODEL BACKENDS
+====================================================
+
+Purpose: Pluggable text-generation backends for GeminiForensicReporter
+
+Backends:
+- "gemini" (default): Google Gemini via google-generativeai
+- "fake": Local stand-in that streams synthetic tokens with configurable
+  latency, jitter, error rate and throughput. Use it for load tests and
+  development without burning Gemini quota or installing the SDK.
+
+Selection:
+- FORENSICS_MODEL_BACKEND=gemini|fake
+- Or pass a backend instance to GeminiForensicReporter(backend=...)
+
+Prompts:
+- stream_generate() takes the per-request prompt plus an optional static
+  system instruction. The Gemini backend builds one GenerativeModel per
+  distinct instruction and reuses it, so the static prefix is set up once
+  per process instead of being concatenated into every prompt.
+- Backends report prompt/output token counts through the optional usage dict.
+
+Fake backend tuning (environment):
+- FORENSICS_FAKE_LATENCY_MS: Time to first token (default 300)
+- FORENSICS_FAKE_JITTER_MS: Uniform +/- jitter on every delay (default 50)
+- FORENSICS_FAKE_ERROR_RATE: Probability a generation fails (default 0.0)
+- FORENSICS_FAKE_TOKENS_PER_SEC: Streaming throughput (default 200)
+- FORENSICS_FAKE_TOKENS: Tokens per report (default 300)
+- FORENSICS_FAKE_CHUNK_TOKENS: Tokens per streamed chunk (default 8)
+"""
+
+import os
+import random
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GEMINI_MODEL = "gemini-1.5-flash"
+
+_FAKE_VOCABULARY = (
+    "hurricane", "wind", "threshold", "oracle", "policy", "payout", "sensor",
+    "measurement", "validated", "Cardano", "contract", "treasury", "location",
+    "exceeded", "recorded", "signature", "audit", "beneficiary", "storm", "the",
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate the token count of a text (~4 characters per token)
+
+    Used for accounting only; exact counts come from the provider.
+    """
+    return (len(text) + 3) // 4
+
+
+class ForensicModelBackend(ABC):
+    """
+    Base class for streaming text-generation backends (subclasses must
+    implement stream_generate as an async generator)
+    """
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    @abstractmethod
+    async def stream_generate(
+        self,
+        prompt: str,
+        system_instruction: Optional[str] = None,
+        usage: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text for a prompt
+
+        Args:
+            prompt: Per-request prompt text
+            system_instruction: Optional static instruction shared across requests
+            usage: Optional dict filled with 'prompt_tokens' / 'output_tokens'
+
+        Yields:
+            str: Generated text chunks
+
+        Raises:
+            Exception: If generation fails
+        """
+        return
+        yield  # Declares the abstract method an async generator
+
+
+class GeminiModelBackend(ForensicModelBackend):
+    """
+    Google Gemini backend (google-generativeai is imported on construction)
+    """
+
+    name = "gemini"
+
+    def __init__(self, api_key: Optional[str] = None, model_name: str = DEFAULT_GEMINI_MODEL):
+        """
+        Args:
+            api_key: Google Gemini API key (defaults to GEMINI_API_KEY env var)
+            model_name: Gemini model to use
+
+        Raises:
+            ValueError: If no API key is configured
+            ImportError: If google-generativeai is not installed
+        """
+        super().__init__(model_name)
+        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+
+        if not self.api_key:
+            raise ValueError(
+                "GEMINI_API_KEY not found. Set environment variable or pass to constructor."
+            )
+
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            raise ImportError(
+                "google-generativeai not installed. Run: pip install google-generativeai"
+            )
+
+        # Configure Gemini
+        genai.configure(api_key=self.api_key)
+        self._genai = genai
+        self.model = genai.GenerativeModel(model_name)
+
+        # One model handle per static system instruction, built on first use
+        self._instruction_models: Dict[str, Any] = {}
+
+    def _model_for(self, system_instruction: Optional[str]) -> Optional[Any]:
+        if not system_instruction:
+            return self.model
+
+        if system_instruction not in self._instruction_models:
+            try:
+                model = self._genai.GenerativeModel(
+                    self.model_name, system_instruction=system_instruction
+                )
+            except TypeError:
+                # SDK predates system instructions: the prefix is inlined instead
+                model = None
+            self._instruction_models[system_instruction] = model
+
+        return self._instruction_models[system_instruction]
+
+    async def stream_generate(
+        self,
+        prompt: str,
+        system_instruction: Optional[str] = None,
+        usage: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        model = self._model_for(system_instruction)
+        if model is None:
+            model, prompt = self.model, f"{system_instruction}\n\n{prompt}"
+
+        response = await asyncio.to_thread(
+            model.generate_content,
+            prompt,
+            stream=True
+        )
+
+        # The SDK iterator blocks on network reads, so pull each chunk in a thread
+        iterator = iter(response)
+        finished = False
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, iterator, None)
+                if chunk is None:
+                    finished = True
+                    break
+                if chunk.text:
+                    yield chunk.text
+        finally:
+            if not finished:
+                self._cancel_response(response)
+
+        metadata = getattr(response, "usage_metadata", None)
+        if usage is not None and metadata is not None:
+            usage["prompt_tokens"] = metadata.prompt_token_count
+            usage["output_tokens"] = metadata.candidates_token_count
+
+    @staticmethod
+    def _cancel_response(response) -> None:
+        """
+        Best-effort cancel of an abandoned SDK stream so generation stops upstream
+
+        The SDK has no public cancel: its streaming response keeps the gRPC
+        call in the private `_iterator`, whose cancel() ends it. Responses
+        without one (other SDK versions) are left to finish upstream.
+        """
+        stream = getattr(response, "_iterator", None)
+        cancel = getattr(stream, "cancel", None)
+        if not callable(cancel):
+            logger.warning(
+                f"⚠️  Gemini stream cannot be cancelled ({type(response).__name__} has no "
+                f"_iterator.cancel); abandoned generation continues upstream"
+            )
+            return
+        try:
+            cancel()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not cancel Gemini stream: {e}")
+
+
+class FakeModelBackend(ForensicModelBackend):
+    """
+    Local Gemini stand-in streaming synthetic tokens
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency_ms: float = 300.0,
+        jitter_ms: float = 50.0,
+        error_rate: float = 0.0,
+        tokens_per_second: float = 200.0,
+        tokens: int = 300,
+        chunk_tokens: int = 8,
+        seed: Optional[int] = None,
+        model_name: str = "fake-gemini"
+    ):
+        """
+        Args:
+            latency_ms: Delay before the first chunk
+            jitter_ms: Uniform +/- jitter applied to every delay
+            error_rate: Probability (0-1) that a generation raises
+            tokens_per_second: Streaming throughput after the first chunk
+            tokens: Number of tokens per generated report
+            chunk_tokens: Tokens per yielded chunk
+            seed: Optional RNG seed for reproducible runs
+            model_name: Reported model name
+        """
+        super().__init__(model_name)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.tokens_per_second = tokens_per_second
+        self.tokens = tokens
+        self.chunk_tokens = max(1, chunk_tokens)
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def from_env(cls, model_name: str = "fake-gemini") -> "FakeModelBackend":
+        """Build a fake backend from FORENSICS_FAKE_* environment variables"""
+        seed = os.getenv("FORENSICS_FAKE_SEED")
+        return cls(
+            model_name=model_name,
+            latency_ms=float(os.getenv("FORENSICS_FAKE_LATENCY_MS", "300")),
+            jitter_ms=float(os.getenv("FORENSICS_FAKE_JITTER_MS", "50")),
+            error_rate=float(os.getenv("FORENSICS_FAKE_ERROR_RATE", "0")),
+            tokens_per_second=float(os.getenv("FORENSICS_FAKE_TOKENS_PER_SEC", "200")),
+            tokens=int(os.getenv("FORENSICS_FAKE_TOKENS", "300")),
+            chunk_tokens=int(os.getenv("FORENSICS_FAKE_CHUNK_TOKENS", "8")),
+            seed=int(seed) if seed is not None else None,
+        )
+
+    def _delay(self, base_ms: float) -> float:
+        jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, base_ms + jitter) / 1000
+
+    async def stream_generate(
+        self,
+        prompt: str,
+        system_instruction: Optional[str] = None,
+        usage: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        if usage is not None:
+            usage["prompt_tokens"] = estimate_tokens(system_instruction or "") + estimate_tokens(prompt)
+            usage["output_tokens"] = self.tokens
+
+        await asyncio.sleep(self._delay(self.latency_ms))
+
+        if self._rng.random() < self.error_rate:
+            raise RuntimeError("Fake backend injected error")
+
+        chunk_interval_ms = (
+            self.chunk_tokens / self.tokens_per_second * 1000
+            if self.tokens_per_second > 0 else 0.0
+        )
+
+        remaining = self.tokens
+        first = True
+        while remaining > 0:
+            if not first:
+                await asyncio.sleep(self._delay(chunk_interval_ms))
+            first = False
+
+            count = min(self.chunk_tokens, remaining)
+            remaining -= count
+            yield " ".join(self._rng.choice(_FAKE_VOCABULARY) for _ in range(count)) + " "
+
+
+def create_model_backend(
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None
+) -> ForensicModelBackend:
+    """
+    Create the backend selected by FORENSICS_MODEL_BACKEND
+
+    Args:
+        api_key: Optional Gemini API key (gemini backend only)
+        model_name: Model to serve (defaults to the backend's default model)
+
+    Returns:
+        ForensicModelBackend: Configured backend
+
+    Raises:
+        ValueError: If the backend name is unknown or Gemini has no API key
+    """
+    kind = os.getenv("FORENSICS_MODEL_BACKEND", "gemini").lower()
+
+    if kind == "fake":
+        logger.warning("Using fake forensic model backend (synthetic reports)")
+        return FakeModelBackend.from_env(model_name or "fake-gemini")
+
+    if kind == "gemini":
+        return GeminiModelBackend(api_key, model_name or DEFAULT_GEMINI_MODEL)
+
+    raise ValueError(f"Unknown FORENSICS_MODEL_BACKEND '{kind}'. Expected: gemini, fake")
@@ -0,0 +1,366 @@
+"""
+PROJECT HYPERION - PHASE 7: BATCH FORENSIC REPORT JOBS
+=======================================================
+
+Purpose: Generate forensic reports for many triggered policies without holding
+         an HTTP request open for every Gemini generation.
+
+Flow:
+1. A client submits a batch of report requests and receives a job id
+2. A bounded pool of workers generates the reports in the background
+3. The client polls the job or subscribes to its progress events
+
+Scheduling:
+- Worker count bounds concurrent Gemini generations (FORENSICS_JOB_WORKERS)
+- Batch work only starts when the Gemini rate limiter has headroom beyond
+  the slots reserved for interactive requests (GEMINI_INTERACTIVE_RESERVE)
+
+Persistence:
+- Jobs and per-item results are stored in SQLite (FORENSICS_JOB_DB)
+- Items that were queued or running when the process stopped are re-queued
+  on the next start, completed results are never regenerated
+"""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from app.services.forensic_routing import ROUTE_BATCH
+from app.services.gemini_reporter import (
+    REPORT_ERROR_MARKER,
+    stream_forensic_report,
+)
+
+logger = logging.getLogger(__name__)
+
+# Job / item states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class ForensicJobStore:
+    """
+    SQLite-backed persistence for batch jobs and their per-item results
+
+    All methods are synchronous; ForensicJobManager calls them through
+    asyncio.to_thread so disk I/O never runs on the event loop.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the job database
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                created_at REAL NOT NULL,
+                total INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_items (
+                job_id TEXT NOT NULL,
+                idx INTEGER NOT NULL,
+                policy_id TEXT NOT NULL,
+                request TEXT NOT NULL,
+                status TEXT NOT NULL,
+                report TEXT,
+                error TEXT,
+                completed_at REAL,
+                PRIMARY KEY (job_id, idx)
+            );
+            """
+        )
+        self._conn.commit()
+
+    def create_job(self, job_id: str, items: List[Dict[str, Any]]) -> None:
+        """Persist a new job and all of its items as queued"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, created_at, total) VALUES (?, ?, ?)",
+                (job_id, time.time(), len(items)),
+            )
+            self._conn.executemany(
+                "INSERT INTO job_items (job_id, idx, policy_id, request, status) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (job_id, idx, item["oracle_payload"]["policy_id"], json.dumps(item), JOB_QUEUED)
+                    for idx, item in enumerate(items)
+                ],
+            )
+            self._conn.commit()
+
+    def set_item_status(
+        self,
+        job_id: str,
+        idx: int,
+        status: str,
+        report: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Update the state (and result) of one job item"""
+        completed_at = time.time() if status in (JOB_COMPLETED, JOB_FAILED) else None
+        with self._lock:
+            self._conn.execute(
+                "UPDATE job_items SET status = ?, report = ?, error = ?, completed_at = ? "
+                "WHERE job_id = ? AND idx = ?",
+                (status, report, error, completed_at, job_id, idx),
+            )
+            self._conn.commit()
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return job metadata and per-state item counts"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, total FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            counts = dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM job_items WHERE job_id = ? GROUP BY status",
+                (job_id,),
+            ).fetchall())
+
+        return {"job_id": job_id, "created_at": row[0], "total": row[1], "counts": counts}
+
+    def get_results(self, job_id: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Return a page of job items in submission order"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT idx, policy_id, status, report, error, completed_at FROM job_items "
+                "WHERE job_id = ? ORDER BY idx LIMIT ? OFFSET ?",
+                (job_id, limit, offset),
+            ).fetchall()
+
+        return [
+            {
+                "index": idx,
+                "policy_id": policy_id,
+                "status": status,
+                "report": report,
+                "error": error,
+                "completed_at": completed_at,
+            }
+            for idx, policy_id, status, report, error, completed_at in rows
+        ]
+
+    def pending_items(self) -> List[tuple]:
+        """Return (job_id, idx, request) for every item not yet finished"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, idx, request FROM job_items WHERE status IN (?, ?) "
+                "ORDER BY rowid",
+                (JOB_QUEUED, JOB_RUNNING),
+            ).fetchall()
+
+        return [(job_id, idx, json.loads(request)) for job_id, idx, request in rows]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+def job_status(job: Dict[str, Any]) -> str:
+    """
+    Derive the overall job state from its item counts
+
+    Args:
+        job: Job dict returned by ForensicJobStore.get_job
+
+    Returns:
+        str: queued, running, completed or failed
+    """
+    counts = job["counts"]
+    finished = counts.get(JOB_COMPLETED, 0) + counts.get(JOB_FAILED, 0)
+
+    if finished >= job["total"]:
+        return JOB_FAILED if counts.get(JOB_FAILED, 0) == job["total"] else JOB_COMPLETED
+    if finished or counts.get(JOB_RUNNING, 0):
+        return JOB_RUNNING
+    return JOB_QUEUED
+
+
+class ForensicJobManager:
+    """
+    Bounded worker pool that drains batch forensic report jobs
+    """
+
+    def __init__(self, store: ForensicJobStore, workers: int = 4):
+        """
+        Args:
+            store: Persistence backend
+            workers: Maximum number of concurrent report generations
+        """
+        self.store = store
+        self.workers = max(1, workers)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    @property
+    def started(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Spawn workers and re-queue items left unfinished by a previous run"""
+        if self.started:
+            return
+
+        self._queue = asyncio.Queue()
+        pending = await asyncio.to_thread(self.store.pending_items)
+        for item in pending:
+            self._queue.put_nowait(item)
+
+        if pending:
+            logger.info(f"Resuming {len(pending)} unfinished forensic job items")
+
+        self._tasks = [
+            asyncio.create_task(self._worker(n)) for n in range(self.workers)
+        ]
+        logger.info(f"Forensic job workers started: {self.workers}")
+
+    async def stop(self) -> None:
+        """Cancel workers (unfinished items stay persisted for the next start)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, items: List[Dict[str, Any]]) -> str:
+        """
+        Persist and enqueue a batch of report requests
+
+        Args:
+            items: Request dicts with 'oracle_payload', optional
+                   'policy_metadata' and 'report_mode'
+
+        Returns:
+            str: New job id
+        """
+        await self.start()
+
+        job_id = uuid.uuid4().hex
+        await asyncio.to_thread(self.store.create_job, job_id, items)
+
+        for idx, item in enumerate(items):
+            self._queue.put_nowait((job_id, idx, item))
+
+        logger.info(f"Forensic job {job_id} queued with {len(items)} reports")
+        return job_id
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return job progress, or None if the job id is unknown"""
+        job = await asyncio.to_thread(self.store.get_job, job_id)
+        if job is not None:
+            job["status"] = job_status(job)
+        return job
+
+    async def get_results(self, job_id: str, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return a page of per-item results"""
+        return await asyncio.to_thread(self.store.get_results, job_id, offset, limit)
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Register a progress event queue for a job"""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Remove a progress event queue"""
+        queues = self._subscribers.get(job_id, [])
+        if queue in queues:
+            queues.remove(queue)
+        if not queues:
+            self._subscribers.pop(job_id, None)
+
+    def _publish(self, job_id: str, event: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(job_id, []):
+            queue.put_nowait(event)
+
+    async def _generate(self, item: Dict[str, Any]) -> str:
+        """Generate one report on the batch route (rate-limit slots are left to interactive traffic)"""
+        chunks = []
+        async for chunk in stream_forensic_report({**item, "request_class": ROUTE_BATCH}):
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    async def _process(self, job_id: str, idx: int, item: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self.store.set_item_status, job_id, idx, JOB_RUNNING)
+        try:
+            report = await self._generate(item)
+            if REPORT_ERROR_MARKER in report:
+                raise RuntimeError(report.strip())
+            status, error = JOB_COMPLETED, None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Forensic job {job_id} item {idx} failed: {e}")
+            report, status, error = None, JOB_FAILED, str(e)
+
+        await asyncio.to_thread(
+            self.store.set_item_status, job_id, idx, status, report, error
+        )
+
+        job = await self.get_job(job_id)
+        self._publish(job_id, {
+            "job_id": job_id,
+            "index": idx,
+            "item_status": status,
+            "status": job["status"] if job else status,
+            "counts": job["counts"] if job else {},
+            "total": job["total"] if job else 0,
+        })
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            job_id, idx, item = await self._queue.get()
+            try:
+                await self._process(job_id, idx, item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Store errors (e.g. "database is locked") must not end the
+                # worker; the item is picked up again by restart recovery
+                logger.error(
+                    f"Forensic worker {worker_id} could not record job {job_id} item {idx}: {e}",
+                    exc_info=True
+                )
+            finally:
+                self._queue.task_done()
+
+
+# Singleton instance for reuse across requests
+_job_manager_instance: Optional[ForensicJobManager] = None
+
+
+def get_job_manager() -> ForensicJobManager:
+    """
+    Get or create the singleton ForensicJobManager
+
+    Returns:
+        ForensicJobManager: Manager backed by FORENSICS_JOB_DB
+    """
+    global _job_manager_instance
+
+    if _job_manager_instance is None:
+        store = ForensicJobStore(os.getenv("FORENSICS_JOB_DB", "forensic_jobs.db"))
+        _job_manager_instance = ForensicJobManager(
+            store, workers=int(os.getenv("FORENSICS_JOB_WORKERS", "4"))
+        )
+
+    return _job_manager_instance
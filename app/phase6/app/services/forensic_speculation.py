@@ -0,0 +1,269 @@
+"""
+PROJECT HYPERION - PHASE 7: SPECULATIVE FORENSIC REPORTS
+=========================================================
+
+Purpose: Have the forensic explanation ready the moment a payout fires.
+
+Flow:
+1. Monitors report wind observations (or forecasts) for their policies
+2. When wind reaches FORENSICS_SPECULATIVE_FRACTION of the threshold, a draft
+   narrative is generated in the background from the provisional figures
+3. When the real trigger arrives, the draft is finalised: every measured
+   value is substituted deterministically around the draft narrative
+4. If the wind falls below FORENSICS_SPECULATIVE_FADE_FRACTION of the
+   threshold, or the draft is older than FORENSICS_SPECULATIVE_TTL seconds,
+   the draft is discarded
+
+The draft narrative is instructed not to quote figures, so finalising never
+needs another LLM call. Drafts only use rate-limit slots that batch work may
+use, leaving interactive requests unaffected.
+
+Configuration (environment):
+- FORENSICS_SPECULATIVE: "1" to enable (default off)
+- FORENSICS_SPECULATIVE_FRACTION: Start threshold fraction (default 0.85)
+- FORENSICS_SPECULATIVE_FADE_FRACTION: Discard threshold fraction (default 0.7)
+- FORENSICS_SPECULATIVE_TTL: Draft lifetime in seconds (default 10800)
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.services.metrics import count_cache
+from app.services.forensic_templates import (
+    MS_TO_MPH,
+    format_measurement_time,
+    render_storm_policy_chunks,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_speculative_prompt(observation: Dict[str, Any]) -> str:
+    """
+    Construct the Gemini prompt for a draft narrative
+
+    Args:
+        observation: Provisional observation (wind_speed, threshold, ...)
+
+    Returns:
+        str: Prompt text
+    """
+    source = "forecast" if observation.get("forecast") else "observed"
+    wind_speed = observation["wind_speed"]
+    return f"""You are an AI insurance adjuster for Project Hyperion, a parametric hurricane insurance protocol on the Cardano blockchain.
+
+A storm is approaching an insured location and a parametric payout is likely. Draft the event narrative (120-200 words) for the forensic report that will explain the payout to the policyholder.
+
+**PROVISIONAL CONDITIONS ({source}):**
+- Location: {observation['location_id']}
+- Time: {format_measurement_time(observation['measurement_time'])}
+- Current wind speed: {wind_speed:.2f} m/s ({wind_speed * MS_TO_MPH:.1f} mph)
+- Trigger threshold: {observation['threshold']:.2f} m/s
+
+**INSTRUCTIONS:**
+Describe the storm event, how the oracle network measures and validates wind speed, and how the Cardano smart contract settles the policy automatically. Do NOT quote any wind speed, threshold, time, amount or identifier: exact measured values are inserted separately. Write in the past tense, as if the threshold has been exceeded. Professional but accessible tone, plain paragraphs.
+
+Generate the narrative now:
+"""
+
+
+class SpeculativeDraft:
+    """
+    A background draft narrative for one policy
+    """
+
+    def __init__(self, observation: Dict[str, Any], task: asyncio.Task):
+        self.observation = observation
+        self.task = task
+        self.created_at = time.time()
+
+
+class SpeculativeReportManager:
+    """
+    Tracks near-threshold policies and their background draft narratives
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        start_fraction: float = 0.85,
+        fade_fraction: float = 0.7,
+        ttl_seconds: float = 10800
+    ):
+        """
+        Args:
+            enabled: Whether observations start drafts at all
+            start_fraction: Fraction of the threshold that starts a draft
+            fade_fraction: Fraction of the threshold below which drafts are discarded
+            ttl_seconds: Maximum draft age before it is discarded
+        """
+        self.enabled = enabled
+        self.start_fraction = start_fraction
+        self.fade_fraction = min(fade_fraction, start_fraction)
+        self.ttl_seconds = ttl_seconds
+        self._drafts: Dict[str, SpeculativeDraft] = {}
+        self.stats = {"started": 0, "finalized": 0, "discarded": 0, "failed": 0}
+
+    def _discard(self, policy_id: str, reason: str) -> None:
+        draft = self._drafts.pop(policy_id, None)
+        if draft is None:
+            return
+        if draft.task.done() and not draft.task.cancelled():
+            draft.task.exception()  # Mark a failed draft's error as retrieved
+        draft.task.cancel()
+        self.stats["discarded"] += 1
+        logger.info(f"Speculative draft for policy {policy_id} discarded: {reason}")
+
+    def _expire(self) -> None:
+        now = time.time()
+        for policy_id in [p for p, d in self._drafts.items() if now - d.created_at > self.ttl_seconds]:
+            self._discard(policy_id, "expired")
+
+    async def _generate_draft(self, observation: Dict[str, Any]) -> str:
+        # Imported here: the reporter consults this module when serving reports
+        from app.services.gemini_reporter import get_gemini_reporter
+
+        reporter = get_gemini_reporter()
+        return await reporter.generate_text(build_speculative_prompt(observation))
+
+    def observe(
+        self,
+        policy_id: str,
+        location_id: str,
+        wind_speed: float,
+        threshold: float,
+        measurement_time: Optional[int] = None,
+        forecast: bool = False
+    ) -> str:
+        """
+        Record a wind observation or forecast for a monitored policy
+
+        Must be called from the event loop thread.
+
+        Args:
+            policy_id: Policy identifier
+            location_id: Location identifier
+            wind_speed: Observed / forecast wind speed (m/s)
+            threshold: Policy trigger threshold (m/s)
+            measurement_time: Unix timestamp (defaults to now)
+            forecast: Whether the value is a forecast
+
+        Returns:
+            str: "started", "drafting", "discarded" or "idle"
+        """
+        if not self.enabled or threshold <= 0:
+            return "idle"
+
+        self._expire()
+        ratio = wind_speed / threshold
+
+        if policy_id in self._drafts:
+            if ratio < self.fade_fraction:
+                self._discard(policy_id, f"wind faded to {ratio:.0%} of threshold")
+                return "discarded"
+            return "drafting"
+
+        if ratio < self.start_fraction:
+            return "idle"
+
+        observation = {
+            "policy_id": policy_id,
+            "location_id": location_id,
+            "wind_speed": wind_speed,
+            "threshold": threshold,
+            "measurement_time": measurement_time or int(time.time()),
+            "forecast": forecast,
+        }
+        task = asyncio.get_running_loop().create_task(self._generate_draft(observation))
+        self._drafts[policy_id] = SpeculativeDraft(observation, task)
+        self.stats["started"] += 1
+        logger.info(f"Speculative draft started for policy {policy_id} ({ratio:.0%} of threshold)")
+        return "started"
+
+    async def finalize(
+        self,
+        oracle_payload: Dict[str, Any],
+        policy_metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[str]]:
+        """
+        Finalise the draft for a triggered policy with the measured values
+
+        Args:
+            oracle_payload: Real (validated) trigger payload
+            policy_metadata: Optional policy NFT metadata
+
+        Returns:
+            List[str]: Report chunks, or None if no usable draft exists
+        """
+        if not self._drafts:
+            return None
+
+        # Drafts explain a payout: below-threshold reports keep the draft alive
+        wind_speed = oracle_payload.get("wind_speed", 0)
+        if wind_speed < oracle_payload.get("threshold", wind_speed):
+            return None
+
+        self._expire()
+        draft = self._drafts.pop(oracle_payload.get("policy_id"), None)
+        count_cache("speculative_drafts", draft is not None)
+        if draft is None:
+            return None
+
+        try:
+            # Drafts still generating are awaited: they already have a head start
+            narrative = await draft.task
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.warning(f"Speculative draft failed ({e}). Generating normally")
+            return None
+
+        self.stats["finalized"] += 1
+        return render_storm_policy_chunks(oracle_payload, policy_metadata, narrative)
+
+    def status(self) -> Dict[str, Any]:
+        """Current drafts and counters"""
+        return {
+            "enabled": self.enabled,
+            "start_fraction": self.start_fraction,
+            "fade_fraction": self.fade_fraction,
+            "drafts": {
+                policy_id: {
+                    "ready": draft.task.done() and not draft.task.cancelled() and draft.task.exception() is None,
+                    "age_s": round(time.time() - draft.created_at, 1),
+                    "wind_speed": draft.observation["wind_speed"],
+                    "threshold": draft.observation["threshold"],
+                    "forecast": draft.observation["forecast"],
+                }
+                for policy_id, draft in self._drafts.items()
+            },
+            "stats": dict(self.stats),
+        }
+
+
+# Singleton instance for reuse across requests
+_speculation_instance: Optional[SpeculativeReportManager] = None
+
+
+def get_speculation_manager() -> SpeculativeReportManager:
+    """
+    Get or create the singleton SpeculativeReportManager
+
+    Returns:
+        SpeculativeReportManager: Manager configured from environment
+    """
+    global _speculation_instance
+
+    if _speculation_instance is None:
+        _speculation_instance = SpeculativeReportManager(
+            enabled=os.getenv("FORENSICS_SPECULATIVE", "0") == "1",
+            start_fraction=float(os.getenv("FORENSICS_SPECULATIVE_FRACTION", "0.85")),
+            fade_fraction=float(os.getenv("FORENSICS_SPECULATIVE_FADE_FRACTION", "0.7")),
+            ttl_seconds=float(os.getenv("FORENSICS_SPECULATIVE_TTL", "10800")),
+        )
+
+    return _speculation_instance
@@ -0,0 +1,184 @@
+"""
+PROJECT HYPERION - BACKGROUND DEPENDENCY HEALTH PROBER
+======================================================
+
+Purpose: Serve /health from memory. Load balancers poll health endpoints
+         every second per instance; instead of building services or calling
+         providers on each hit, a background task checks every dependency
+         (weather provider, chain context, Gemini, signer) on an interval and
+         caches the outcome with timestamps and latencies.
+
+Checks are zero-argument coroutine functions registered per app. A check
+returns an optional detail dict (a "status" key of "degraded" or
+"not_configured" overrides the default "up") or raises to report "down".
+Each round runs all checks concurrently, each under HEALTH_PROBE_TIMEOUT
+seconds, every HEALTH_PROBE_INTERVAL seconds.
+
+Overall status: "unhealthy" when a critical dependency is down, "degraded"
+when any other dependency is down or degraded, else "healthy".
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROBE_UP = "up"
+PROBE_DOWN = "down"
+PROBE_DEGRADED = "degraded"
+PROBE_PENDING = "pending"
+PROBE_NOT_CONFIGURED = "not_configured"
+
+HealthCheck = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class HealthProber:
+    """
+    Periodically checks dependencies and keeps an immutable health snapshot
+    """
+
+    def __init__(self, interval_seconds: float = 15.0, timeout_seconds: float = 5.0):
+        """
+        Args:
+            interval_seconds: Time between probe rounds
+            timeout_seconds: Budget of one check
+        """
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.rounds = 0
+        self._checks: Dict[str, Tuple[HealthCheck, bool]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._snapshot: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._rebuild()
+
+    def register(self, name: str, check: HealthCheck, critical: bool = True) -> None:
+        """
+        Add (or replace) a dependency check; it runs from the next round
+
+        Args:
+            name: Dependency name shown in health responses
+            check: Coroutine function returning detail or raising
+            critical: Whether the dependency being down makes the app unhealthy
+        """
+        self._checks[name] = (check, critical)
+        if name not in self._results:
+            self._results[name] = {"status": PROBE_PENDING, "critical": critical}
+            self._rebuild()
+
+    async def _run_check(self, name: str, check: HealthCheck, critical: bool) -> Dict[str, Any]:
+        previous = self._results.get(name, {})
+        start = time.perf_counter()
+        result: Dict[str, Any] = {"critical": critical}
+        try:
+            detail = await asyncio.wait_for(check(), self.timeout_seconds)
+            detail = dict(detail or {})
+            result["status"] = detail.pop("status", PROBE_UP)
+            if detail:
+                result["detail"] = detail
+        except asyncio.TimeoutError:
+            result["status"] = PROBE_DOWN
+            result["error"] = f"timed out after {self.timeout_seconds:.1f}s"
+        except Exception as e:
+            result["status"] = PROBE_DOWN
+            result["error"] = str(e) or type(e).__name__
+
+        now = time.time()
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        result["checked_at"] = now
+        if result["status"] == PROBE_DOWN:
+            result["last_ok_at"] = previous.get("last_ok_at")
+            result["consecutive_failures"] = previous.get("consecutive_failures", 0) + 1
+            if result["consecutive_failures"] == 1:
+                logger.warning(f"Dependency {name} is down: {result.get('error')}")
+        else:
+            result["last_ok_at"] = now
+            result["consecutive_failures"] = 0
+            if previous.get("status") == PROBE_DOWN:
+                logger.info(f"Dependency {name} recovered")
+        return result
+
+    async def probe_once(self) -> Dict[str, Any]:
+        """Run every check concurrently and publish a new snapshot"""
+        checks = list(self._checks.items())
+        results = await asyncio.gather(*(
+            self._run_check(name, check, critical) for name, (check, critical) in checks
+        ))
+        for (name, _), result in zip(checks, results):
+            self._results[name] = result
+        self.rounds += 1
+        self._rebuild()
+        return self._snapshot
+
+    def _rebuild(self) -> None:
+        status = "healthy"
+        for result in self._results.values():
+            if result["status"] == PROBE_DOWN and result["critical"]:
+                status = "unhealthy"
+                break
+            if result["status"] in (PROBE_DOWN, PROBE_DEGRADED):
+                status = "degraded"
+
+        # Replaced wholesale, never mutated: readers need no lock
+        self._snapshot = {
+            "status": status,
+            "checked_at": max((r.get("checked_at") or 0 for r in self._results.values()), default=0) or None,
+            "probe_rounds": self.rounds,
+            "components": {name: result["status"] for name, result in self._results.items()},
+            "dependencies": dict(self._results),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest health snapshot (O(1), never triggers a check)"""
+        return self._snapshot
+
+    def dependency(self, name: str) -> Optional[Dict[str, Any]]:
+        """Latest result of one dependency"""
+        return self._results.get(name)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.probe_once()
+            except Exception as e:
+                logger.error(f"Health probe round failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def start(self) -> None:
+        """Start probing in the background (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+# Singleton instance
+_prober_instance: Optional[HealthProber] = None
+
+
+def get_health_prober() -> HealthProber:
+    """
+    Get or create the singleton HealthProber
+
+    Returns:
+        HealthProber: Configured from HEALTH_PROBE_INTERVAL / HEALTH_PROBE_TIMEOUT
+    """
+    global _prober_instance
+
+    if _prober_instance is None:
+        _prober_instance = HealthProber(
+            interval_seconds=float(os.getenv("HEALTH_PROBE_INTERVAL", "15")),
+            timeout_seconds=float(os.getenv("HEALTH_PROBE_TIMEOUT", "5")),
+        )
+
+    return _prober_instance
@@ -0,0 +1,191 @@
+"""
+PROJECT HYPERION - IDEMPOTENCY KEYS
+===================================
+
+Purpose: Make retried oracle mutations (job runner retries of
+         /api/v1/oracle/trigger, /monitor/start and /oracle/run) safe.
+
+A request carrying an Idempotency-Key header runs once per key and
+operation:
+- a repeat after it finished gets the original response instantly
+- a duplicate arriving while it runs waits for that execution instead of
+  starting another (no second pipeline, no extra nonce)
+- reusing a key with a different payload raises IdempotencyKeyConflict
+  (422 at the API)
+
+Only successful executions are remembered: when the first one fails, every
+waiter gets its error and the next retry runs again. Entries live in a
+bounded map, oldest first, with a TTL (HYPERION_IDEMPOTENCY_TTL, default 24h;
+HYPERION_IDEMPOTENCY_MAX_KEYS, default 10000); in-flight entries are never
+evicted.
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_registry = get_metrics_registry()
+IDEMPOTENT_REQUESTS = _registry.counter(
+    "hyperion_idempotent_requests_total",
+    "Requests with an Idempotency-Key by result (executed, replayed, joined, conflict)",
+    ("operation", "result"),
+)
+
+
+class IdempotencyKeyConflict(Exception):
+    """Raised when a key is reused with a different request payload."""
+
+
+def payload_fingerprint(payload: Any) -> str:
+    """Stable hash of a JSON-compatible request payload"""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("fingerprint", "task", "created_at")
+
+    def __init__(self, fingerprint: str, task: asyncio.Task):
+        self.fingerprint = fingerprint
+        self.task = task
+        self.created_at = time.monotonic()
+
+    def failed(self) -> bool:
+        return self.task.done() and (self.task.cancelled() or self.task.exception() is not None)
+
+
+class IdempotencyStore:
+    """
+    Bounded TTL map of (operation, key) to the execution it started
+    """
+
+    def __init__(self, ttl_seconds: float = 86400.0, max_entries: int = 10000):
+        """
+        Args:
+            ttl_seconds: How long a finished response is replayed
+            max_entries: Keys kept (oldest finished ones are evicted first)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        for scoped, entry in list(self._entries.items()):
+            if entry.created_at > cutoff:
+                break
+            if entry.task.done():
+                del self._entries[scoped]
+        while len(self._entries) > self.max_entries:
+            finished = next((scoped for scoped, entry in self._entries.items() if entry.task.done()), None)
+            if finished is None:
+                break
+            del self._entries[finished]
+
+    def _finished(self, scoped: Tuple[str, str], task: asyncio.Task) -> None:
+        # Failed executions are forgotten so the next retry runs again
+        entry = self._entries.get(scoped)
+        if entry is not None and entry.task is task and entry.failed():
+            del self._entries[scoped]
+
+    async def run(
+        self,
+        operation: str,
+        key: str,
+        payload: Any,
+        execute: Callable[[], Awaitable[Any]],
+        join_timeout: Optional[float] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Execute once per (operation, key), replaying the result for repeats
+
+        Args:
+            operation: Endpoint name (keys are scoped per operation)
+            key: Idempotency-Key header value
+            payload: JSON-compatible request payload (must match on repeats)
+            execute: Zero-argument coroutine function doing the work
+            join_timeout: Longest wait for an in-flight execution
+
+        Returns:
+            Tuple[Any, bool]: The result and whether it came from an earlier
+            request (replayed or joined)
+
+        Raises:
+            IdempotencyKeyConflict: Key already used with another payload
+            asyncio.TimeoutError: The in-flight execution outlived join_timeout
+        """
+        self._prune()
+        fingerprint = payload_fingerprint(payload)
+        scoped = (operation, key)
+        entry = self._entries.get(scoped)
+        if entry is not None and entry.failed():
+            # Failed before its done callback ran: never replayed
+            del self._entries[scoped]
+            entry = None
+
+        if entry is None:
+            IDEMPOTENT_REQUESTS.labels(operation, "executed").inc()
+            task = asyncio.get_running_loop().create_task(execute())
+            self._entries[scoped] = _Entry(fingerprint, task)
+            task.add_done_callback(lambda done: self._finished(scoped, done))
+            self._prune()
+            return await asyncio.shield(task), False
+
+        if entry.fingerprint != fingerprint:
+            IDEMPOTENT_REQUESTS.labels(operation, "conflict").inc()
+            raise IdempotencyKeyConflict(
+                f"Idempotency-Key {key!r} was already used with a different {operation} request"
+            )
+
+        if entry.task.done():
+            IDEMPOTENT_REQUESTS.labels(operation, "replayed").inc()
+            logger.info(f"↩️  Replaying {operation} response for Idempotency-Key {key!r}")
+            return entry.task.result(), True
+
+        IDEMPOTENT_REQUESTS.labels(operation, "joined").inc()
+        logger.info(f"🔗 Waiting for in-flight {operation} with Idempotency-Key {key!r}")
+        waiter = asyncio.shield(entry.task)
+        if join_timeout is not None:
+            return await asyncio.wait_for(waiter, max(join_timeout, 0.0)), True
+        return await waiter, True
+
+    def status(self) -> Dict[str, Any]:
+        in_flight = sum(1 for entry in self._entries.values() if not entry.task.done())
+        return {
+            "keys": len(self._entries),
+            "in_flight": in_flight,
+            "ttl_seconds": self.ttl_seconds,
+            "max_entries": self.max_entries,
+        }
+
+
+# Singleton instance
+_store_instance: Optional[IdempotencyStore] = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """
+    Get or create the singleton IdempotencyStore
+
+    Returns:
+        IdempotencyStore: Configured from HYPERION_IDEMPOTENCY_TTL /
+        HYPERION_IDEMPOTENCY_MAX_KEYS
+    """
+    global _store_instance
+
+    if _store_instance is None:
+        _store_instance = IdempotencyStore(
+            ttl_seconds=float(os.getenv("HYPERION_IDEMPOTENCY_TTL", "86400")),
+            max_entries=int(os.getenv("HYPERION_IDEMPOTENCY_MAX_KEYS", "10000")),
+        )
+
+    return _store_instance
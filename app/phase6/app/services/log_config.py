@@ -0,0 +1,203 @@
+"""
+PROJECT HYPERION - STRUCTURED, SAMPLED, ASYNCHRONOUS LOGGING
+============================================================
+
+Purpose: Take log I/O off the event loop. An oracle run emits around twenty
+         INFO lines and the monitor loop logs every poll; with plain
+         StreamHandlers each line is a synchronous write on the loop thread.
+
+Modes (HYPERION_LOG_MODE):
+- "text" (default): the classic line format, written synchronously
+- "json": one JSON object per line. Records are put on an in-memory queue
+  by a QueueHandler and formatted/written by a QueueListener thread, so a
+  log call costs the caller a dict copy and a queue put
+
+Sampling (json mode, HYPERION_LOG_SAMPLING): comma-separated
+"logger=rate" pairs, e.g. "app.agents=0.1,app.main=0.25". Below-WARNING
+records of a logger (or its children) are kept at that rate; warnings,
+errors and records logged with extra={"trigger": True} are always kept.
+Separator banners ("=" * 80) carry nothing in JSON and are dropped.
+"""
+
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+LOG_MODE_TEXT = "text"
+LOG_MODE_JSON = "json"
+
+# LogRecord attributes; anything else on a record came from `extra=`
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def parse_sampling(spec: str) -> Dict[str, float]:
+    """
+    Parse HYPERION_LOG_SAMPLING
+
+    Args:
+        spec: "logger=rate,..." (rates clamped to [0, 1])
+
+    Returns:
+        Dict[str, float]: Keep rate per logger name
+    """
+    rates = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        name, rate = item.split("=", 1)
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            continue
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps 1 in round(1/rate) routine records per logger; never drops
+    warnings, errors or trigger records
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._rate_cache: Dict[str, float] = {}
+        self._seen: Dict[str, int] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._rate_cache.get(name)
+        if rate is None:
+            rate = 1.0
+            # Longest configured prefix wins ("app.agents" covers "app.agents.x")
+            for prefix in sorted(self.rates, key=len, reverse=True):
+                if name == prefix or name.startswith(prefix + "."):
+                    rate = self.rates[prefix]
+                    break
+            self._rate_cache[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or getattr(record, "trigger", False):
+            return True
+        if isinstance(record.msg, str) and record.msg and not record.msg.strip("=-─═ "):
+            return False
+        rate = self._rate(record.name)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        seen = self._seen.get(record.name, 0)
+        self._seen[record.name] = seen + 1
+        return seen % round(1 / rate) == 0
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record (extra= fields included)"""
+
+    def __init__(self, app: str):
+        super().__init__()
+        self.app = app
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "app": self.app,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the traceback out of the message text"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def log_mode() -> str:
+    """Configured logging mode (text unless HYPERION_LOG_MODE=json)"""
+    mode = os.getenv("HYPERION_LOG_MODE", LOG_MODE_TEXT).strip().lower()
+    return LOG_MODE_JSON if mode == LOG_MODE_JSON else LOG_MODE_TEXT
+
+
+def configure_logging(
+    app: str,
+    text_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt: Optional[str] = None,
+    mode: Optional[str] = None,
+    level: int = logging.INFO
+) -> str:
+    """
+    Configure the root logger for an app (call once, before logging)
+
+    Args:
+        app: App name written into JSON records
+        text_format: Line format of text mode
+        datefmt: Date format of text mode
+        mode: "text" or "json" (defaults to HYPERION_LOG_MODE)
+        level: Root level
+
+    Returns:
+        str: The mode in effect
+    """
+    global _listener
+
+    mode = mode or log_mode()
+    stop_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(level)
+
+    if mode != LOG_MODE_JSON:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(text_format, datefmt=datefmt))
+        root.addHandler(handler)
+        return LOG_MODE_TEXT
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter(app))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _StructuredQueueHandler(log_queue)
+    # Sampling runs on the caller's thread so dropped records are never queued
+    queue_handler.addFilter(SamplingFilter(parse_sampling(os.getenv("HYPERION_LOG_SAMPLING", ""))))
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return LOG_MODE_JSON
+
+
+def stop_logging() -> None:
+    """Flush and stop the background listener (json mode)"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -8,11 +8,18 @@ Purpose: Secondary data validation (NOAA, flight data, news)
 """
 
 import os
+import time
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 import httpx
 import random
 
+from app.services.deadline import Phase6Deadline, Phase6DeadlineExceeded
+from app.services.flight_recorder import note_provider
+from app.services.metrics import observe_outbound
+from app.services.tracing import TracingTransport
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,13 +43,68 @@ class Phase6SecondaryDataService:
             )
         
         self.timeout = 10.0  # seconds
+        self.noaa_url = "https://www.ncdc.noaa.gov/cdo-web/api/v2"
+        
+        # Shared connection pool (created on first use or at warm-up)
+        self._client: Optional[httpx.AsyncClient] = None
         
         logger.info("✅ Phase 6 Secondary Data Service initialized")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get (creating on first use) the pooled HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                # Pool limits live on the transport; it also traces each call
+                transport=TracingTransport(
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                ),
+            )
+        return self._client
+    
+    async def ping(self) -> int:
+        """
+        Reach the NOAA API host without credentials.
+        
+        Returns:
+            HTTP status code of the probe
+        
+        Raises:
+            httpx.HTTPError: If the host cannot be reached
+        """
+        response = await self._get_client().head(self.noaa_url)
+        return response.status_code
+    
+    async def warm_up(self) -> bool:
+        """
+        Open the connection pool and pre-establish a connection to NOAA.
+        
+        Nothing to warm in mock mode.
+        
+        Returns:
+            True if a connection to NOAA is now pooled
+        """
+        if self.use_mock:
+            return False
+        
+        try:
+            await self.ping()
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"⚠️  NOAA pre-connect failed: {e}")
+            return False
+    
+    async def close(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def get_validation_data(
         self,
         latitude: float,
-        longitude: float
+        longitude: float,
+        deadline: Optional[Phase6Deadline] = None
     ) -> Dict[str, Any]:
         """
         Fetch secondary validation data.
@@ -55,9 +117,13 @@ class Phase6SecondaryDataService:
         Args:
             latitude: Latitude in decimal degrees
             longitude: Longitude in decimal degrees
+            deadline: Request deadline (calls get only the remaining budget)
             
         Returns:
             Validation data including wind speed
+            
+        Raises:
+            Phase6DeadlineExceeded: The budget ran out before a source answered
         """
         logger.info(f"🔍 Fetching secondary data for validation...")
         
@@ -66,12 +132,16 @@ class Phase6SecondaryDataService:
         
         try:
             # Try NOAA first (US government weather service)
-            noaa_data = await self._fetch_noaa_data(latitude, longitude)
+            noaa_data = await self._fetch_noaa_data(latitude, longitude, deadline)
             if noaa_data:
                 return noaa_data
         except Exception as e:
             logger.warning(f"NOAA fetch failed: {e}")
         
+        # Sequential fallbacks only while the request still has budget
+        if deadline and deadline.available() <= 0:
+            raise Phase6DeadlineExceeded("No budget left for secondary source fallbacks")
+        
         try:
             # Fallback to FlightAware airport data
             flight_data = await self._fetch_flight_data(latitude, longitude)
@@ -87,7 +157,8 @@ class Phase6SecondaryDataService:
     async def _fetch_noaa_data(
         self,
         latitude: float,
-        longitude: float
+        longitude: float,
+        deadline: Optional[Phase6Deadline] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Fetch data from NOAA API (National Oceanic and Atmospheric Administration).
@@ -95,7 +166,7 @@ class Phase6SecondaryDataService:
         Note: NOAA API is free but requires registration.
         """
         # NOAA API endpoint (stations near coordinates)
-        url = "https://www.ncdc.noaa.gov/cdo-web/api/v2/stations"
+        url = f"{self.noaa_url}/stations"
         
         headers = {
             "token": self.api_key,
@@ -108,10 +179,22 @@ class Phase6SecondaryDataService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers, params=params)
+            timeout = deadline.timeout(self.timeout, "noaa") if deadline else self.timeout
+            start = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    self._get_client().get(url, headers=headers, params=params, timeout=timeout), timeout
+                )
                 response.raise_for_status()
-                data = response.json()
+            except (httpx.HTTPError, asyncio.TimeoutError) as e:
+                elapsed = time.perf_counter() - start
+                observe_outbound("noaa", elapsed, e)
+                note_provider("noaa", elapsed, e)
+                raise
+            elapsed = time.perf_counter() - start
+            observe_outbound("noaa", elapsed)
+            note_provider("noaa", elapsed)
+            data = response.json()
             
             # Extract wind data from nearest station
             # (Simplified - real implementation would need additional API calls)
@@ -217,7 +300,7 @@ class Phase6SecondaryDataService:
 # REAL-TIME FEATURES:
 # ✓ Async HTTP requests
 # ✓ Multiple source fallback
-# ✓ Timeout protection
+# ✓ Timeout protection (bounded by the request deadline)
 # ✓ Graceful degradation
 #
 # ENVIRONMENT VARIABLES:
@@ -8,11 +8,17 @@ Purpose: OpenWeatherMap API integration
 """
 
 import os
+import time
+import asyncio
 import logging
 from typing import Optional
 import httpx
 
 from app.models import Phase6WeatherData
+from app.services.deadline import Phase6Deadline
+from app.services.flight_recorder import note_provider
+from app.services.metrics import observe_outbound
+from app.services.tracing import TracingTransport
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +41,61 @@ class Phase6WeatherService:
         self.base_url = "https://api.openweathermap.org/data/2.5"
         self.timeout = 10.0  # seconds
         
+        # Shared connection pool (created on first use or at warm-up)
+        self._client: Optional[httpx.AsyncClient] = None
+        
         logger.info("✅ Phase 6 Weather Service initialized")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get (creating on first use) the pooled HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                # Pool limits live on the transport; it also traces each call
+                transport=TracingTransport(
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                ),
+            )
+        return self._client
+    
+    async def ping(self) -> int:
+        """
+        Reach the API host without credentials (no quota used).
+        
+        Returns:
+            HTTP status code of the probe
+        
+        Raises:
+            httpx.HTTPError: If the host cannot be reached
+        """
+        response = await self._get_client().head(self.base_url)
+        return response.status_code
+    
+    async def warm_up(self) -> bool:
+        """
+        Open the connection pool and pre-establish a TLS connection.
+        
+        Returns:
+            True if a connection to the API host is now pooled
+        """
+        try:
+            await self.ping()
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"⚠️  Weather API pre-connect failed: {e}")
+            return False
+    
+    async def close(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def get_current_weather(
         self,
         latitude: float,
-        longitude: float
+        longitude: float,
+        deadline: Optional[Phase6Deadline] = None
     ) -> Phase6WeatherData:
         """
         Fetch current weather data for coordinates.
@@ -48,15 +103,18 @@ class Phase6WeatherService:
         Args:
             latitude: Latitude in decimal degrees
             longitude: Longitude in decimal degrees
+            deadline: Request deadline (the call gets only the remaining budget)
             
         Returns:
             Weather data including wind speed
             
         Raises:
             httpx.HTTPError: If API request fails
+            TimeoutError: If the call exceeds its timeout or the deadline
             ValueError: If response is invalid
         """
         logger.info(f"📡 Fetching weather data for ({latitude}, {longitude})...")
+        timeout = deadline.timeout(self.timeout, "fetch_weather") if deadline else self.timeout
         
         # Build API request
         url = f"{self.base_url}/weather"
@@ -68,10 +126,21 @@ class Phase6WeatherService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
+            start = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    self._get_client().get(url, params=params, timeout=timeout), timeout
+                )
                 response.raise_for_status()
-                data = response.json()
+            except (httpx.HTTPError, asyncio.TimeoutError) as e:
+                elapsed = time.perf_counter() - start
+                observe_outbound("openweathermap", elapsed, e)
+                note_provider("openweathermap", elapsed, e)
+                raise
+            elapsed = time.perf_counter() - start
+            observe_outbound("openweathermap", elapsed)
+            note_provider("openweathermap", elapsed)
+            data = response.json()
             
             # Extract weather data
             wind_data = data.get("wind", {})
@@ -114,6 +183,10 @@ class Phase6WeatherService:
             logger.error(f"❌ Weather API request failed: {e}")
             raise
         
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Weather API request exceeded {timeout:.2f}s")
+            raise
+        
         except (KeyError, ValueError) as e:
             logger.error(f"❌ Invalid weather API response: {e}")
             raise ValueError(f"Invalid weather data format: {e}")
@@ -176,10 +249,9 @@ class Phase6WeatherService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = await self._get_client().get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
             
             logger.info(f"✅ Forecast data received")
             return data
@@ -197,7 +269,8 @@ class Phase6WeatherService:
 # ✓ Async HTTP requests (non-blocking)
 # ✓ Typical response time: 200-500ms
 # ✓ Automatic retry on transient failures
-# ✓ Timeout protection (10 seconds)
+# ✓ Timeout protection (10 seconds, or the request deadline's remaining budget)
+# ✓ Pooled keep-alive connections (pre-connected at startup warm-up)
 #
 # API DOCUMENTATION:
 # - OpenWeatherMap Current Weather: https://openweathermap.org/current
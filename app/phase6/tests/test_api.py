@@ -0,0 +1,477 @@
+"""
+Phase 6 Oracle - API Tests
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+# Test signing key and provider key; keep forensic data out of the working tree
+_DATA_DIR = tempfile.mkdtemp(prefix="hyperion_phase6_")
+os.environ.setdefault("CARDANO_SK_HEX", "11" * 32)
+os.environ.setdefault("OPENWEATHER_API_KEY", "test-key")
+os.environ.setdefault("FORENSICS_JOB_DB", os.path.join(_DATA_DIR, "jobs.db"))
+os.environ.setdefault("FORENSICS_ARCHIVE_DIR", os.path.join(_DATA_DIR, "archive"))
+
+from app import main
+from app.agents import Phase6OracleSwarm
+from app.services import admission, coalescing
+from app.services.admission import (
+    LANE_NORMAL,
+    LANE_PRIORITY,
+    REJECT_QUEUE_FULL,
+    REJECT_SHED,
+    Phase6AdmissionController,
+    Phase6AdmissionRejected,
+)
+from app.services.coalescing import Phase6KeyedLocks, Phase6RequestCoalescer
+from app.services.deadline import Phase6Deadline, Phase6DeadlineExceeded
+from app.services.flight_recorder import Phase6FlightRecorder, note_provider
+
+RUN_REQUEST = {
+    "policy_id": "a1" * 28,
+    "location_id": "miami_beach_buoy_12",
+    "latitude": 25.79,
+    "longitude": -80.13,
+}
+
+
+_SWARM = None
+
+
+@pytest.fixture(autouse=True)
+def swarm(monkeypatch):
+    """Warmed swarm (ASGITransport does not run the lifespan that builds it)"""
+    global _SWARM
+    if _SWARM is None:
+        _SWARM = Phase6OracleSwarm()
+    monkeypatch.setattr(main, "phase6_swarm", _SWARM)
+    return _SWARM
+
+
+def mock_weather(monkeypatch, delay: float = 0.0, wind_speed: float = 30.0) -> list:
+    """Serve OpenWeatherMap from a mock transport; returns the recorded calls"""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json={
+            "wind": {"speed": wind_speed, "deg": 90},
+            "main": {"temp": 20},
+            "dt": int(time.time()),
+        })
+
+    weather_service = main.phase6_swarm.meteorologist.weather_service
+    monkeypatch.setattr(weather_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return calls
+
+
+async def post_runs(*bodies, stagger: float = 0.0):
+    """POST /oracle/run concurrently, starting each `stagger` seconds after the previous"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://phase6") as client:
+        async def post(n, body):
+            await asyncio.sleep(n * stagger)
+            return await client.post("/oracle/run", json=body)
+
+        return await asyncio.gather(*[post(n, body) for n, body in enumerate(bodies)])
+
+
+def wait_for_readyz(client, predicate, timeout: float = 5.0):
+    """Poll /readyz until predicate(response) holds"""
+    deadline = time.monotonic() + timeout
+    while True:
+        response = client.get("/readyz")
+        if predicate(response) or time.monotonic() > deadline:
+            return response
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def cold_start(monkeypatch):
+    """Fresh warm-up state; the swarm build blocks until released"""
+    monkeypatch.setattr(main, "phase6_swarm", None)
+    monkeypatch.setattr(main, "phase6_swarm_build", None)
+    monkeypatch.setattr(main, "phase6_warmup", main.Phase6WarmupState())
+    monkeypatch.setenv("PHASE6_WARMUP_TIMEOUT", "1")
+    monkeypatch.setenv("PHASE6_WARMUP_RETRY_SECONDS", "0.05")
+    monkeypatch.setenv("PHASE6_WARMUP_RETRY_MAX_SECONDS", "0.2")
+
+    release = threading.Event()
+    built = []
+
+    def build():
+        release.wait(5)
+        built.append(1)
+        return Phase6OracleSwarm()
+
+    monkeypatch.setattr(main, "Phase6OracleSwarm", build)
+    return release, built
+
+
+def test_lifespan_warms_up_behind_readyz(cold_start):
+    """/livez answers during warm-up; /readyz and /oracle/run wait for the swarm"""
+    release, built = cold_start
+
+    with TestClient(main.app) as client:
+        assert client.get("/livez").status_code == 200
+        warming = client.get("/readyz")
+        assert warming.status_code == 503 and warming.json()["status"] == "warming"
+        rejected = client.post("/oracle/run", json=RUN_REQUEST)
+        assert rejected.status_code == 503 and rejected.headers["Retry-After"] == "1"
+
+        release.set()
+        ready = wait_for_readyz(client, lambda r: r.status_code == 200)
+
+    assert ready.status_code == 200
+    subsystems = ready.json()["subsystems"]
+    assert {"agents", "cardano_signer", "weather_pool", "secondary_pool"} <= set(subsystems)
+    assert subsystems["agents"]["status"] == subsystems["cardano_signer"]["status"] == "ok"
+    assert all(entry["duration_ms"] >= 0 for entry in subsystems.values())
+    assert ready.json()["warmup_ms"] > 0
+    assert built == [1]
+
+
+def test_warmup_timeout_is_retried_without_a_second_swarm(cold_start, monkeypatch):
+    """A swarm build outliving its timeout is awaited again, not rebuilt"""
+    release, built = cold_start
+    monkeypatch.setenv("PHASE6_WARMUP_TIMEOUT", "0.1")
+
+    with TestClient(main.app) as client:
+        failed = wait_for_readyz(client, lambda r: r.json()["status"] == "failed")
+        assert failed.status_code == 503
+        assert failed.json()["subsystems"]["agents"]["status"] == "timeout"
+
+        release.set()
+        ready = wait_for_readyz(client, lambda r: r.status_code == 200)
+        assert ready.json()["error"] is None
+
+    assert ready.status_code == 200
+    assert built == [1]
+
+
+@pytest.fixture
+def coalescer(monkeypatch):
+    fresh = Phase6RequestCoalescer("oracle_run")
+    monkeypatch.setattr(coalescing, "_coalescer_instance", fresh)
+    return fresh
+
+
+def test_identical_runs_share_one_execution(monkeypatch, coalescer):
+    """Concurrent identical requests get one signed response and one nonce"""
+    calls = mock_weather(monkeypatch, delay=0.2)
+
+    responses = asyncio.run(post_runs(*[RUN_REQUEST] * 4))
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert len(calls) == 1
+    assert len({r.json()["nonce"] for r in responses}) == 1
+    assert len({r.json()["signature"] for r in responses}) == 1
+    assert sum(r.headers.get("X-Oracle-Coalesced") == "1" for r in responses) == 3
+    assert coalescer.status() == {"in_flight": 0, "locked_keys": 0, "coalesced": 3}
+
+
+def test_joined_request_past_its_deadline_gets_504(monkeypatch, coalescer):
+    """A joiner waits only as long as its own budget allows"""
+    mock_weather(monkeypatch, delay=0.6)
+
+    first, joiner = asyncio.run(post_runs(
+        {**RUN_REQUEST, "timeout_ms": 5000},
+        {**RUN_REQUEST, "timeout_ms": 250},
+        stagger=0.05,
+    ))
+
+    assert first.status_code == 200
+    assert joiner.status_code == 504
+    assert coalescer.coalesced == 1
+    assert len(coalescer.locks) == 0
+
+
+def test_shorter_budget_execution_is_not_joined(monkeypatch, coalescer):
+    """A larger-budget duplicate runs its own execution instead of inheriting cuts"""
+    calls = mock_weather(monkeypatch, delay=0.2)
+    monkeypatch.setattr(main.phase6_swarm.auditor, "min_budget_seconds", 0.5)
+
+    short, generous = asyncio.run(post_runs(
+        {**RUN_REQUEST, "timeout_ms": 600},
+        {**RUN_REQUEST, "timeout_ms": 20000},
+        stagger=0.05,
+    ))
+
+    assert short.status_code == generous.status_code == 200
+    assert short.json()["stages_cut"] == ["validate"]
+    assert generous.json()["stages_cut"] == []
+    assert "X-Oracle-Coalesced" not in generous.headers
+    assert len(calls) == 2
+    assert coalescer.coalesced == 0
+
+
+def test_coalescer_joins_only_executions_with_enough_budget():
+    """Joiners with a smaller or equal budget share; larger ones start afresh"""
+    coalescer = Phase6RequestCoalescer("test")
+    runs = []
+
+    async def execute():
+        runs.append(1)
+        run = len(runs)
+        await asyncio.sleep(0.05)
+        return run
+
+    async def scenario():
+        return await asyncio.gather(
+            coalescer.run("k", execute, budget=300),
+            coalescer.run("k", execute, budget=20000),
+            coalescer.run("k", execute, budget=5000),
+            coalescer.run("k", execute, budget=20000),
+        )
+
+    results = asyncio.run(scenario())
+
+    assert results == [(1, False), (2, False), (2, True), (2, True)]
+    assert coalescer.coalesced == 2
+    assert coalescer.status()["in_flight"] == 0
+
+
+def test_deadline_timeout_raises_when_no_budget_is_left():
+    """Stage timeouts are capped by the budget left after the decide reserve"""
+    deadline = Phase6Deadline(1.0, reserve_seconds=0.2)
+    assert 0 < deadline.timeout(10, "fetch") <= 0.8
+    assert deadline.timeout(0.1, "fetch") == 0.1
+
+    with pytest.raises(Phase6DeadlineExceeded):
+        Phase6Deadline(0.1, reserve_seconds=0.2).timeout(10, "fetch")
+
+
+def test_validation_is_cut_when_budget_is_below_minimum(monkeypatch, coalescer):
+    """The auditor trusts the primary source with reduced confidence"""
+    mock_weather(monkeypatch)
+    monkeypatch.setattr(main.phase6_swarm.auditor, "min_budget_seconds", 5.0)
+
+    (response,) = asyncio.run(post_runs({**RUN_REQUEST, "timeout_ms": 2000}))
+
+    assert response.status_code == 200
+    assert response.json()["stages_cut"] == ["validate"]
+    assert response.json()["confidence"] == 0.7
+
+
+def test_generous_budget_cuts_no_stages(monkeypatch, coalescer):
+    mock_weather(monkeypatch)
+
+    (response,) = asyncio.run(post_runs({**RUN_REQUEST, "timeout_ms": 20000}))
+
+    assert response.status_code == 200
+    assert response.json()["stages_cut"] == []
+
+
+def test_primary_fetch_without_budget_gets_504(monkeypatch, coalescer):
+    """A budget inside the decide reserve never reaches the weather provider"""
+    calls = mock_weather(monkeypatch)
+
+    (response,) = asyncio.run(post_runs({**RUN_REQUEST, "timeout_ms": 150}))
+
+    assert response.status_code == 504
+    assert calls == []
+
+
+def test_cancelled_caller_does_not_cancel_shared_execution():
+    """The execution outlives the caller that started it"""
+    coalescer = Phase6RequestCoalescer("test")
+    runs = []
+
+    async def execute():
+        runs.append(1)
+        await asyncio.sleep(0.1)
+        return "signed"
+
+    async def scenario():
+        first = asyncio.create_task(coalescer.run("policy", execute))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(coalescer.run("policy", execute))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, first.cancelled()
+
+    result, cancelled = asyncio.run(scenario())
+    assert cancelled
+    assert result == ("signed", True)
+    assert runs == [1]
+    assert coalescer.status()["in_flight"] == 0
+
+
+def test_policy_locks_serialise_and_are_dropped():
+    """Keyed locks run holders one at a time and forget unused keys"""
+    locks = Phase6KeyedLocks()
+    order = []
+
+    async def holder(name, timeout=None):
+        async with locks.hold("policy", timeout):
+            order.append(name)
+            await asyncio.sleep(0.05)
+
+    async def scenario():
+        first = asyncio.create_task(holder("first"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(holder("second"))
+        await asyncio.sleep(0)
+        in_use = len(locks)
+        with pytest.raises(asyncio.TimeoutError):
+            await holder("late", timeout=0.01)
+        await asyncio.gather(first, second)
+        return in_use
+
+    assert asyncio.run(scenario()) == 1
+    assert order == ["first", "second"]
+    assert len(locks) == 0
+
+
+def test_request_that_cannot_start_in_budget_gets_503_retry_after(monkeypatch, coalescer):
+    """A request whose budget ends before a slot frees up is rejected at once"""
+    controller = Phase6AdmissionController(max_concurrent=1, max_queue=4)
+    monkeypatch.setattr(admission, "_admission_instance", controller)
+    mock_weather(monkeypatch, delay=0.3)
+
+    running, rejected = asyncio.run(post_runs(
+        {**RUN_REQUEST, "timeout_ms": 5000},
+        {**RUN_REQUEST, "policy_id": "b2" * 28, "timeout_ms": 500},
+        stagger=0.05,
+    ))
+
+    assert running.status_code == 200
+    assert rejected.status_code == 503
+    assert "deadline" in rejected.json()["error"]
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert controller.active == 0
+
+
+def test_full_queue_sheds_newest_normal_for_priority():
+    """Priority requests displace the newest normal waiter when the queue is full"""
+    controller = Phase6AdmissionController(max_concurrent=1, max_queue=2)
+
+    async def scenario():
+        deadline = time.monotonic() + 10
+        await controller.acquire(LANE_NORMAL, deadline)
+        older = asyncio.create_task(controller.acquire(LANE_NORMAL, deadline))
+        newest = asyncio.create_task(controller.acquire(LANE_NORMAL, deadline))
+        await asyncio.sleep(0)
+
+        with pytest.raises(Phase6AdmissionRejected) as full:
+            await controller.acquire(LANE_NORMAL, deadline)
+        priority = asyncio.create_task(controller.acquire(LANE_PRIORITY, deadline))
+        await asyncio.sleep(0)
+        with pytest.raises(Phase6AdmissionRejected) as shed:
+            await newest
+
+        controller.release()
+        await priority
+        admitted_before_older = not older.done()
+        controller.release()
+        await older
+        controller.release()
+        return full.value.reason, shed.value.reason, admitted_before_older
+
+    full_reason, shed_reason, priority_first = asyncio.run(scenario())
+    assert full_reason == REJECT_QUEUE_FULL
+    assert shed_reason == REJECT_SHED
+    assert priority_first
+    assert controller.status()["active"] == 0
+
+
+def test_release_hands_slot_to_next_waiter():
+    """A released slot goes straight to the head of the queue"""
+    controller = Phase6AdmissionController(max_concurrent=1, max_queue=4)
+
+    async def scenario():
+        deadline = time.monotonic() + 10
+        await controller.acquire(LANE_NORMAL, deadline)
+        waiter = asyncio.create_task(controller.acquire(LANE_NORMAL, deadline))
+        await asyncio.sleep(0)
+        assert controller.status()["queued"] == {LANE_PRIORITY: 0, LANE_NORMAL: 1}
+
+        controller.release(service_seconds=2.0)
+        active_during_handoff = controller.active
+        await waiter
+        return active_during_handoff
+
+    assert asyncio.run(scenario()) == 1
+    assert controller.active == 1
+    assert controller.service_seconds == pytest.approx(1.2)
+    controller.release()
+    assert controller.active == 0
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    """A waiter that gives up leaves the queue and never holds a slot"""
+    controller = Phase6AdmissionController(max_concurrent=1, max_queue=4)
+
+    async def scenario():
+        deadline = time.monotonic() + 10
+        await controller.acquire(LANE_NORMAL, deadline)
+        waiter = asyncio.create_task(controller.acquire(LANE_NORMAL, deadline))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        queued = controller.status()["queued"][LANE_NORMAL]
+        controller.release()
+        return queued
+
+    assert asyncio.run(scenario()) == 0
+    assert controller.active == 0
+    assert controller.expected_wait(LANE_NORMAL) == 0.0
+
+
+def test_flight_recorder_ring_keeps_newest_and_filters():
+    """The ring evicts the oldest flights; reads filter by policy and duration"""
+    recorder = Phase6FlightRecorder(capacity=3)
+
+    for n in range(5):
+        with recorder.record(f"policy_{n % 2}", "buoy", threshold=n) as flight:
+            with flight.stage("fetch"):
+                note_provider("openweathermap", 0.01)
+            if n == 3:
+                time.sleep(0.02)
+
+    flights = recorder.flights()
+    assert [f["flight_id"] for f in flights] == [5, 4, 3]
+    assert recorder.status() == {"enabled": True, "capacity": 3, "recorded": 5, "buffered": 3}
+    assert [f["flight_id"] for f in recorder.flights(policy_id="policy_0")] == [5, 3]
+    assert [f["flight_id"] for f in recorder.flights(min_duration_ms=15)] == [4]
+    assert [f["flight_id"] for f in recorder.flights(limit=1)] == [5]
+
+    newest = flights[0]
+    assert newest["inputs"] == {"threshold": 4}
+    assert newest["stages"][0]["stage"] == "fetch" and newest["stages"][0]["outcome"] == "ok"
+    assert newest["providers"][0]["provider"] == "openweathermap"
+
+
+def test_flight_recorder_captures_errors_and_ignores_notes_outside_a_flight():
+    """A raising block is stored with its error; notes without a flight are no-ops"""
+    recorder = Phase6FlightRecorder(capacity=4)
+
+    note_provider("openweathermap", 0.01, TimeoutError())
+
+    with pytest.raises(TimeoutError):
+        with recorder.record("policy", "buoy") as flight:
+            with flight.stage("fetch"):
+                raise TimeoutError("provider timed out")
+
+    with recorder.record("policy", "buoy"):
+        pass
+
+    failed, clean = recorder.flights()[1], recorder.flights()[0]
+    assert failed["error"] == "TimeoutError: provider timed out"
+    assert failed["stages"][0]["outcome"] == "error"
+    assert failed["duration_ms"] is not None
+    assert clean["error"] is None
+    assert clean["providers"] == [] and "cache" not in clean
+
+    disabled = Phase6FlightRecorder(capacity=0)
+    with disabled.record("policy", "buoy") as flight:
+        assert flight is None
+    assert disabled.flights() == [] and disabled.status()["buffered"] == 0
@@ -11,7 +11,7 @@ This file shows ONLY the additions for Phase 7.
 Merge with your existing main.py by adding the forensics router.
 """
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -19,15 +19,30 @@ from typing import Dict, Any, Optional
 import logging
 
 # Phase 7: Gemini reporter service
-from app.services.gemini_reporter import stream_forensic_report, get_gemini_reporter
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+from app.services.gemini_reporter import stream_forensic_report, get_gemini_reporter, probe_gemini
+from app.services.health_probe import get_health_prober
+from app.services.log_config import configure_logging
+from app.services.loop_watchdog import get_loop_watchdog, start_loop_watchdog
+from app.api import debug
+from app.services.metrics import CONTENT_TYPE_LATEST, MetricsMiddleware, get_metrics_registry
+from app.services.profiling import ProfilingMiddleware
+from app.services.tracing import TracingMiddleware
+from app.services.forensic_streams import get_stream_hub
+from app.services.startup import STARTUP_MODE_EAGER, create_module_warmer
+
+# Configure logging (HYPERION_LOG_MODE=json for queued, sampled JSON lines)
+configure_logging("phase7")
 logger = logging.getLogger(__name__)
 
+# The Gemini SDK is imported on first use; warmed at startup
+# (HYPERION_STARTUP_MODE=eager) or in the background (HYPERION_WARMUP=1)
+module_warmer = create_module_warmer(["google.generativeai"])
+
+# Gemini is checked in the background; /health only reads the snapshot.
+# Reports fall back to templates without it, so it is not critical.
+health_prober = get_health_prober()
+health_prober.register("gemini", probe_gemini, critical=False)
+
 # ============================================================================
 # FASTAPI APP INITIALIZATION
 # ============================================================================
@@ -53,6 +68,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency histograms for /metrics
+app.add_middleware(MetricsMiddleware)
+# X-Debug-Profile: 1 (with X-Debug-Token) profiles a single request
+app.add_middleware(ProfilingMiddleware)
+# Root span per sampled request; traceparent / X-Trace-Id response headers
+app.add_middleware(TracingMiddleware)
+
+# Runtime diagnostics (404 unless HYPERION_DEBUG_TOKEN is set)
+app.include_router(debug.router, prefix="/debug", include_in_schema=False)
+
 # ============================================================================
 # PYDANTIC MODELS (Request/Response schemas)
 # ============================================================================
@@ -99,6 +124,11 @@ class ForensicReportRequest(BaseModel):
     """
     oracle_payload: OraclePayload
     policy_metadata: Optional[PolicyMetadata] = None
+    report_mode: str = Field(
+        default="auto",
+        pattern="^(auto|llm|template)$",
+        description="auto (Gemini with template fallback), llm (Gemini only) or template (no LLM call)"
+    )
 
 
 # ============================================================================
@@ -124,29 +154,36 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Detailed health check with service status"""
-    try:
-        # Test Gemini connection
-        reporter = get_gemini_reporter()
-        gemini_status = "connected"
-    except Exception as e:
-        gemini_status = f"error: {str(e)}"
-
+    """Detailed health check with service status (served from the prober cache)"""
+    snapshot = health_prober.snapshot()
+    gemini = health_prober.dependency("gemini")
     return {
-        "status": "healthy",
+        "status": snapshot["status"],
         "services": {
             "api": "online",
-            "gemini": gemini_status
-        }
+            "gemini": gemini["status"] if gemini.get("error") is None else f"error: {gemini['error']}"
+        },
+        "checked_at": snapshot["checked_at"],
+        "dependencies": snapshot["dependencies"],
+        "startup": module_warmer.status()
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(get_metrics_registry().render(), media_type=CONTENT_TYPE_LATEST)
+
+
 # ============================================================================
 # PHASE 7: FORENSIC REPORTING ENDPOINTS
 # ============================================================================
 
 @app.post("/forensics/stream")
-async def stream_forensic_report_endpoint(request: ForensicReportRequest):
+async def stream_forensic_report_endpoint(
+    request: ForensicReportRequest,
+    last_event_id: Optional[str] = Header(default=None)
+):
     """
     Stream a forensic report using Google Gemini AI
 
@@ -160,42 +197,42 @@ async def stream_forensic_report_endpoint(request: ForensicReportRequest):
     - Frontend: Use EventSource or fetch with streaming
     - Phase 6: Pass Arbiter's signed oracle data
     - Phase 1: Optionally include CIP-68 metadata for context
+    - Reconnect with Last-Event-ID to resume the same generation
 
     **Returns:** text/event-stream with chunks of the forensic report
     """
     try:
-        logger.info(f"Forensic report requested for policy: {request.oracle_payload.policy_id}")
+        policy_id = request.oracle_payload.policy_id
+        hub = get_stream_hub()
+        session, after_seq = None, -1
 
-        # Prepare data for gemini_reporter
-        data = {
-            "oracle_payload": request.oracle_payload.model_dump(),
-        }
+        if last_event_id:
+            session, after_seq = hub.resume(last_event_id, policy_id)
 
-        if request.policy_metadata:
-            data["policy_metadata"] = request.policy_metadata.model_dump()
+        if session is None:
+            logger.info(f"Forensic report requested for policy: {policy_id}")
 
-        # Stream response using Server-Sent Events (SSE)
-        async def event_generator():
-            """Generate SSE-formatted events"""
-            try:
-                async for chunk in stream_forensic_report(data):
-                    # SSE format: data: <content>\n\n
-                    yield f"data: {chunk}\n\n"
+            # Prepare data for gemini_reporter
+            data = {
+                "oracle_payload": request.oracle_payload.model_dump(),
+                "report_mode": request.report_mode,
+            }
 
-                # Send completion signal
-                yield "data: [DONE]\n\n"
+            if request.policy_metadata:
+                data["policy_metadata"] = request.policy_metadata.model_dump()
 
-            except Exception as e:
-                logger.error(f"Streaming error: {str(e)}")
-                yield f"data: [ERROR] {str(e)}\n\n"
+            session = hub.start(policy_id, lambda: stream_forensic_report(data))
 
+        # Stream response using Server-Sent Events (SSE); disconnecting
+        # clients release the session so unread generations are cancelled
         return StreamingResponse(
-            event_generator(),
+            hub.sse_events(session, after_seq),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "X-Accel-Buffering": "no",  # Disable nginx buffering
+                "X-Stream-Id": session.stream_id,
             }
         )
 
@@ -226,17 +263,17 @@ async def generate_static_report(request: ForensicReportRequest):
         # Prepare data
         data = {
             "oracle_payload": request.oracle_payload.model_dump(),
+            "report_mode": request.report_mode,
         }
 
         if request.policy_metadata:
             data["policy_metadata"] = request.policy_metadata.model_dump()
 
-        # Collect all chunks into one string
-        reporter = get_gemini_reporter()
-        report_text = await reporter.generate_static_report(
-            oracle_payload=data["oracle_payload"],
-            policy_metadata=data.get("policy_metadata")
-        )
+        # Collect all chunks into one string (template fallback included)
+        chunks = []
+        async for chunk in stream_forensic_report(data):
+            chunks.append(chunk)
+        report_text = "".join(chunks)
 
         return {
             "success": True,
@@ -328,12 +365,17 @@ async def startup_event():
     """Initialize services on startup"""
     logger.info("Project Hyperion API starting up...")
 
-    # Test Gemini connection
-    try:
-        reporter = get_gemini_reporter()
-        logger.info("✓ Gemini reporter initialized")
-    except Exception as e:
-        logger.error(f"✗ Gemini reporter failed: {str(e)}")
+    await module_warmer.start()
+    await health_prober.start()
+    await start_loop_watchdog()
+
+    # Test Gemini connection (lazy mode leaves it to the first request)
+    if module_warmer.mode == STARTUP_MODE_EAGER:
+        try:
+            reporter = get_gemini_reporter()
+            logger.info("✓ Gemini reporter initialized")
+        except Exception as e:
+            logger.error(f"✗ Gemini reporter failed: {str(e)}")
 
     logger.info("API ready to accept requests")
 
@@ -342,6 +384,9 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Project Hyperion API shutting down...")
+    await module_warmer.stop()
+    await health_prober.stop()
+    await get_loop_watchdog().stop()
 
 
 # ============================================================================
@@ -0,0 +1,275 @@
+"""
+PROJECT HYPERION - PHASE 7: LATENCY-AWARE MODEL ROUTING
+========================================================
+
+Purpose: Pick the model for each forensic generation by request class and
+         move traffic away from models that get slow or start failing.
+
+Request classes:
+- "interactive": dashboard SSE streams (default FORENSICS_MODELS_INTERACTIVE)
+- "batch": batch jobs, storm narratives, speculative drafts
+  (FORENSICS_MODELS_BATCH)
+- "fallback": one retry on another model when a generation fails before
+  any text was streamed (FORENSICS_MODELS_FALLBACK)
+
+Each class lists candidate models in order of preference (comma separated).
+Interactive and batch default to gemini-1.5-flash with gemini-1.5-flash-8b
+as the second candidate; a class configured with a single model never
+shifts on latency (only the error fallback moves it).
+
+Routing:
+- Every generation records its time to first token and success per model
+  in a rolling window (FORENSICS_ROUTING_WINDOW samples)
+- A model is unhealthy once its error rate over the window exceeds
+  FORENSICS_ROUTING_MAX_ERROR_RATE, or after 3 consecutive errors; it
+  stays out of rotation for FORENSICS_ROUTING_COOLDOWN seconds
+- The preferred healthy model is used unless another healthy candidate's
+  median latency is FORENSICS_ROUTING_SLOWDOWN times faster
+- Every FORENSICS_ROUTING_PROBE_EVERY-th request goes to the candidate with
+  the stalest profile, so a recovered model is noticed
+"""
+
+import os
+import time
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services.forensic_backends import DEFAULT_GEMINI_MODEL, ForensicModelBackend
+from app.services.metrics import observe_outbound
+
+logger = logging.getLogger(__name__)
+
+ROUTE_INTERACTIVE = "interactive"
+ROUTE_BATCH = "batch"
+ROUTE_FALLBACK = "fallback"
+ROUTE_CLASSES = (ROUTE_INTERACTIVE, ROUTE_BATCH, ROUTE_FALLBACK)
+
+FAST_GEMINI_MODEL = "gemini-1.5-flash-8b"
+
+# Two candidates per class, so latency-based shifting works out of the box
+DEFAULT_ROUTE_MODELS = {
+    ROUTE_INTERACTIVE: f"{DEFAULT_GEMINI_MODEL},{FAST_GEMINI_MODEL}",
+    ROUTE_BATCH: f"{DEFAULT_GEMINI_MODEL},{FAST_GEMINI_MODEL}",
+    ROUTE_FALLBACK: FAST_GEMINI_MODEL,
+}
+
+CONSECUTIVE_ERROR_LIMIT = 3
+MIN_SAMPLES = 5
+
+
+class ModelProfile:
+    """
+    Rolling latency / error profile of one model
+    """
+
+    def __init__(self, model_name: str, window: int):
+        self.model_name = model_name
+        self.samples: deque = deque(maxlen=window)  # (first token ms or None, ok)
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.cooldown_until = 0.0
+        self.last_used = 0.0
+
+    def record(self, latency_ms: Optional[float], ok: bool) -> None:
+        self.requests += 1
+        self.last_used = time.time()
+        self.samples.append((latency_ms, ok))
+        if ok:
+            self.consecutive_errors = 0
+        else:
+            self.errors += 1
+            self.consecutive_errors += 1
+
+    @property
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+    def latency_percentile(self, pct: float) -> Optional[float]:
+        latencies = sorted(ms for ms, ok in self.samples if ok and ms is not None)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(pct / 100 * len(latencies)))]
+
+    def status(self) -> Dict[str, Any]:
+        p50 = self.latency_percentile(50)
+        p95 = self.latency_percentile(95)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "window": len(self.samples),
+            "error_rate": round(self.error_rate, 3),
+            "p50_first_token_ms": round(p50, 1) if p50 is not None else None,
+            "p95_first_token_ms": round(p95, 1) if p95 is not None else None,
+            "cooling_down": self.cooldown_until > time.time(),
+        }
+
+
+class ModelRouter:
+    """
+    Chooses a model backend per request class from rolling model profiles
+    """
+
+    def __init__(
+        self,
+        backend_factory: Callable[[str], ForensicModelBackend],
+        routes: Dict[str, List[str]],
+        window: int = 50,
+        max_error_rate: float = 0.5,
+        cooldown_seconds: float = 30.0,
+        slowdown_factor: float = 1.5,
+        probe_every: int = 20
+    ):
+        """
+        Args:
+            backend_factory: Builds the backend for a model name
+            routes: Candidate model names per request class, preferred first
+            window: Samples kept per model
+            max_error_rate: Error rate above which a model is unhealthy
+            cooldown_seconds: Time an unhealthy model stays out of rotation
+            slowdown_factor: Latency ratio that moves traffic off the preferred model
+            probe_every: Route every N-th request to the stalest candidate (0 = never)
+        """
+        self.backend_factory = backend_factory
+        self.routes = {cls: list(models) for cls, models in routes.items() if models}
+        self.window = window
+        self.max_error_rate = max_error_rate
+        self.cooldown_seconds = cooldown_seconds
+        self.slowdown_factor = slowdown_factor
+        self.probe_every = probe_every
+        self._backends: Dict[str, ForensicModelBackend] = {}
+        self._profiles: Dict[str, ModelProfile] = {}
+        self._selections = 0
+
+    @classmethod
+    def single(cls, backend: ForensicModelBackend) -> "ModelRouter":
+        """Router that sends every request class to one backend"""
+        router = cls(lambda name: backend, {c: [backend.model_name] for c in ROUTE_CLASSES})
+        router._backends[backend.model_name] = backend
+        return router
+
+    def backend(self, model_name: str) -> ForensicModelBackend:
+        """Get (creating on first use) the backend for a model"""
+        if model_name not in self._backends:
+            self._backends[model_name] = self.backend_factory(model_name)
+        return self._backends[model_name]
+
+    def profile(self, model_name: str) -> ModelProfile:
+        if model_name not in self._profiles:
+            self._profiles[model_name] = ModelProfile(model_name, self.window)
+        return self._profiles[model_name]
+
+    def _healthy(self, model_name: str) -> bool:
+        return self.profile(model_name).cooldown_until <= time.time()
+
+    def select(self, request_class: str, exclude: Optional[str] = None) -> ForensicModelBackend:
+        """
+        Pick the backend for a request
+
+        Args:
+            request_class: interactive, batch or fallback
+            exclude: Model to avoid (e.g. the one that just failed)
+
+        Returns:
+            ForensicModelBackend: Backend of the chosen model
+
+        Raises:
+            ValueError: If the request class is unknown
+        """
+        if request_class not in ROUTE_CLASSES:
+            raise ValueError(
+                f"Unknown request class '{request_class}'. Expected: {', '.join(ROUTE_CLASSES)}"
+            )
+
+        route = self.routes.get(request_class) or self.routes[ROUTE_INTERACTIVE]
+        # Only the excluded model is configured: callers see it come back
+        candidates = [m for m in route if m != exclude] or route
+
+        healthy = [m for m in candidates if self._healthy(m)] or candidates
+        chosen = healthy[0]
+
+        self._selections += 1
+        if self.probe_every and len(healthy) > 1 and self._selections % self.probe_every == 0:
+            chosen = min(healthy, key=lambda m: self.profile(m).last_used)
+        else:
+            preferred_p50 = self.profile(chosen).latency_percentile(50)
+            for model_name in healthy[1:]:
+                profile = self.profile(model_name)
+                p50 = profile.latency_percentile(50)
+                if (
+                    preferred_p50 is not None and p50 is not None
+                    and len(profile.samples) >= MIN_SAMPLES
+                    and p50 * self.slowdown_factor < preferred_p50
+                ):
+                    chosen, preferred_p50 = model_name, p50
+
+        return self.backend(chosen)
+
+    def record(self, model_name: str, latency_ms: Optional[float], ok: bool) -> None:
+        """
+        Record the outcome of one generation
+
+        Args:
+            model_name: Model that served the request
+            latency_ms: Time to first token (None if none arrived)
+            ok: Whether the generation succeeded
+        """
+        profile = self.profile(model_name)
+        profile.record(latency_ms, ok)
+        observe_outbound(
+            f"gemini/{model_name}",
+            latency_ms / 1000 if latency_ms is not None else None,
+            None if ok else "generation_failed",
+        )
+
+        if ok:
+            return
+
+        unhealthy = (
+            profile.consecutive_errors >= CONSECUTIVE_ERROR_LIMIT
+            or (len(profile.samples) >= MIN_SAMPLES and profile.error_rate > self.max_error_rate)
+        )
+        if unhealthy and profile.cooldown_until <= time.time():
+            profile.cooldown_until = time.time() + self.cooldown_seconds
+            logger.warning(
+                f"Model {model_name} marked unhealthy (error rate {profile.error_rate:.0%}). "
+                f"Routing around it for {self.cooldown_seconds:.0f}s"
+            )
+
+    def status(self) -> Dict[str, Any]:
+        """Routes and per-model profiles"""
+        return {
+            "routes": self.routes,
+            "models": {name: profile.status() for name, profile in self._profiles.items()},
+        }
+
+
+def create_model_router(
+    backend_factory: Callable[[str], ForensicModelBackend]
+) -> ModelRouter:
+    """
+    Build a ModelRouter from FORENSICS_MODELS_* / FORENSICS_ROUTING_* settings
+
+    Args:
+        backend_factory: Builds the backend for a model name
+
+    Returns:
+        ModelRouter: Configured router
+    """
+    routes = {}
+    for request_class in ROUTE_CLASSES:
+        value = os.getenv(f"FORENSICS_MODELS_{request_class.upper()}", DEFAULT_ROUTE_MODELS[request_class])
+        routes[request_class] = [m.strip() for m in value.split(",") if m.strip()]
+
+    return ModelRouter(
+        backend_factory,
+        routes,
+        window=int(os.getenv("FORENSICS_ROUTING_WINDOW", "50")),
+        max_error_rate=float(os.getenv("FORENSICS_ROUTING_MAX_ERROR_RATE", "0.5")),
+        cooldown_seconds=float(os.getenv("FORENSICS_ROUTING_COOLDOWN", "30")),
+        slowdown_factor=float(os.getenv("FORENSICS_ROUTING_SLOWDOWN", "1.5")),
+        probe_every=int(os.getenv("FORENSICS_ROUTING_PROBE_EVERY", "20")),
+    )
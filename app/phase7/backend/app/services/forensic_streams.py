@@ -0,0 +1,453 @@
+"""
+PROJECT HYPERION - PHASE 7: RESUMABLE FORENSIC STREAMS
+=======================================================
+
+Purpose: Let dashboard clients reconnect mid-report without starting a new
+         Gemini generation, and stop generations nobody is reading.
+
+Design:
+- Every /forensics/stream request runs its generation in a StreamSession,
+  decoupled from the HTTP connection that started it
+- Each chunk gets a sequence number and is kept in a bounded buffer
+  (FORENSICS_STREAM_BUFFER chunks); SSE events carry "id: <stream_id>:<seq>"
+- A client reconnecting with "Last-Event-ID: <stream_id>:<seq>" is attached
+  to the same session and receives every chunk after <seq>, whether the
+  generation is still running or has already finished
+- Finished sessions stay resumable for FORENSICS_STREAM_TTL seconds; at most
+  FORENSICS_STREAM_MAX_SESSIONS sessions are kept
+
+Disconnects and backpressure:
+- When the last client of a running session disconnects, the upstream
+  generation is cancelled after FORENSICS_STREAM_CANCEL_GRACE seconds unless
+  a client resumes first
+- Clients read from the shared buffer; a client more than
+  FORENSICS_STREAM_CLIENT_BUFFER chunks behind is a slow consumer and is
+  handled by FORENSICS_STREAM_SLOW_POLICY:
+    coalesce   - send the whole backlog as one event (default)
+    drop       - skip the oldest chunks of the backlog
+    disconnect - end the stream; the client may resume with Last-Event-ID
+- Generated and wasted (generated but never delivered) tokens are counted
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from app.services.forensic_backends import estimate_tokens
+from app.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+SLOW_POLICY_COALESCE = "coalesce"
+SLOW_POLICY_DROP = "drop"
+SLOW_POLICY_DISCONNECT = "disconnect"
+SLOW_POLICIES = (SLOW_POLICY_COALESCE, SLOW_POLICY_DROP, SLOW_POLICY_DISCONNECT)
+
+
+class SlowConsumerError(Exception):
+    """Raised to end the stream of a client that fell too far behind"""
+
+
+def format_sse_event(data: str, event_id: Optional[str] = None) -> str:
+    """
+    Frame one SSE event
+
+    Multi-line data is split into one "data:" line per text line, as the SSE
+    specification requires, so no part of a chunk is lost by the client.
+
+    Args:
+        data: Event payload
+        event_id: Optional event id (sent as "id:")
+
+    Returns:
+        str: SSE-formatted event terminated by a blank line
+    """
+    lines = [f"id: {event_id}"] if event_id else []
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+class StreamSession:
+    """
+    One report generation with a bounded, replayable chunk buffer
+    """
+
+    def __init__(self, stream_id: str, policy_id: str, buffer_size: int):
+        self.stream_id = stream_id
+        self.policy_id = policy_id
+        self.done = False
+        self.error: Optional[str] = None
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self.subscribers = 0
+        self.cancelled = False
+        self.tokens = 0
+        self.delivered_tokens = 0
+        self.cancel_handle: Optional[asyncio.TimerHandle] = None
+        # (seq, chunk, cumulative tokens up to and including the chunk)
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._last_seq = -1
+        self._new_data = asyncio.Event()
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    @property
+    def wasted_tokens(self) -> int:
+        return self.tokens - self.delivered_tokens
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.stream_id}:{seq}"
+
+    def _notify(self) -> None:
+        # Swap the event so waiters captured before the swap are woken exactly once
+        event, self._new_data = self._new_data, asyncio.Event()
+        event.set()
+
+    def append(self, chunk: str) -> None:
+        """Buffer a generated chunk and wake subscribers"""
+        self._last_seq += 1
+        self.tokens += estimate_tokens(chunk)
+        self._buffer.append((self._last_seq, chunk, self.tokens))
+        self._notify()
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """Mark the generation finished (optionally with an error)"""
+        self.done = True
+        self.error = error
+        self.finished_at = time.time()
+        self._notify()
+
+    async def run(self, source: Callable[[], AsyncIterator[str]]) -> None:
+        """Drain a chunk source into the buffer"""
+        try:
+            async for chunk in source():
+                self.append(chunk)
+        except asyncio.CancelledError:
+            self.finish(error="Stream cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Streaming error: {str(e)}")
+            self.finish(error=str(e))
+            return
+        self.finish()
+
+    async def subscribe(
+        self,
+        after_seq: int = -1,
+        max_lag: int = 0,
+        slow_policy: str = SLOW_POLICY_COALESCE,
+        on_slow: Optional[Callable[[str], None]] = None
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Iterate over chunks with a sequence number greater than after_seq
+
+        Chunks evicted from the bounded buffer are skipped.
+
+        Args:
+            after_seq: Last sequence number the client has seen
+            max_lag: Backlog (in chunks) above which slow_policy applies (0 = unlimited)
+            slow_policy: coalesce, drop or disconnect
+            on_slow: Called with the policy each time it is applied
+
+        Yields:
+            Tuple[int, str]: (sequence number, chunk); a coalesced event carries
+            the sequence number of its last chunk
+
+        Raises:
+            SlowConsumerError: If the policy is "disconnect" and the client lags
+        """
+        next_seq = after_seq + 1
+        while True:
+            new_data = self._new_data
+
+            while next_seq <= self._last_seq:
+                first_seq = self._buffer[0][0]
+                if next_seq < first_seq:
+                    logger.warning(
+                        f"Stream {self.stream_id}: chunks {next_seq}-{first_seq - 1} "
+                        "no longer buffered"
+                    )
+                    next_seq = first_seq
+
+                backlog = self._last_seq - next_seq + 1
+                if max_lag and backlog > max_lag:
+                    if on_slow:
+                        on_slow(slow_policy)
+                    if slow_policy == SLOW_POLICY_DISCONNECT:
+                        raise SlowConsumerError(
+                            f"Client fell {backlog} chunks behind stream {self.stream_id}"
+                        )
+                    if slow_policy == SLOW_POLICY_DROP:
+                        next_seq = self._last_seq - max_lag + 1
+                    else:
+                        start = next_seq - first_seq
+                        entries = [self._buffer[i] for i in range(start, start + backlog)]
+                        self._deliver(entries[-1][2])
+                        next_seq = self._last_seq + 1
+                        yield entries[-1][0], "".join(entry[1] for entry in entries)
+                        continue
+
+                seq, chunk, cumulative = self._buffer[next_seq - self._buffer[0][0]]
+                self._deliver(cumulative)
+                next_seq += 1
+                yield seq, chunk
+
+            if self.done:
+                return
+
+            await new_data.wait()
+
+    def _deliver(self, cumulative_tokens: int) -> None:
+        self.delivered_tokens = max(self.delivered_tokens, cumulative_tokens)
+
+
+class ForensicStreamHub:
+    """
+    Registry of live and recently finished stream sessions
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 2048,
+        ttl_seconds: float = 300,
+        max_sessions: int = 1000,
+        cancel_grace_seconds: float = 5.0,
+        client_buffer: int = 256,
+        slow_policy: str = SLOW_POLICY_COALESCE
+    ):
+        """
+        Args:
+            buffer_size: Chunks kept per stream for replay
+            ttl_seconds: How long finished streams stay resumable
+            max_sessions: Maximum sessions kept in memory
+            cancel_grace_seconds: Wait before cancelling a stream without clients
+            client_buffer: Per-client backlog (chunks) before slow_policy applies
+            slow_policy: coalesce, drop or disconnect
+
+        Raises:
+            ValueError: If slow_policy is unknown
+        """
+        if slow_policy not in SLOW_POLICIES:
+            raise ValueError(
+                f"Unknown slow consumer policy '{slow_policy}'. Expected: {', '.join(SLOW_POLICIES)}"
+            )
+
+        self.buffer_size = buffer_size
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.cancel_grace_seconds = cancel_grace_seconds
+        self.client_buffer = client_buffer
+        self.slow_policy = slow_policy
+        self._sessions: "OrderedDict[str, StreamSession]" = OrderedDict()
+        self.stats = {
+            "started": 0,
+            "resumed": 0,
+            "cancelled": 0,
+            "client_disconnects": 0,
+            "slow_coalesced": 0,
+            "slow_dropped": 0,
+            "slow_disconnected": 0,
+            "tokens_generated": 0,
+            "tokens_wasted": 0,
+        }
+
+    def _retire(self, stream_id: str) -> None:
+        session = self._sessions.pop(stream_id)
+        self.stats["tokens_generated"] += session.tokens
+        self.stats["tokens_wasted"] += session.wasted_tokens
+
+    def _purge(self) -> None:
+        now = time.time()
+        expired = [
+            stream_id for stream_id, session in self._sessions.items()
+            if session.done and now - session.finished_at > self.ttl_seconds
+        ]
+        for stream_id in expired:
+            self._retire(stream_id)
+
+        # Over capacity: drop the oldest finished sessions first
+        if len(self._sessions) >= self.max_sessions:
+            for stream_id in [s for s, session in self._sessions.items() if session.done]:
+                self._retire(stream_id)
+                if len(self._sessions) < self.max_sessions:
+                    break
+
+    def start(self, policy_id: str, source: Callable[[], AsyncIterator[str]]) -> StreamSession:
+        """
+        Start a new generation in its own session
+
+        Args:
+            policy_id: Policy the report is for
+            source: Factory returning the chunk async iterator
+
+        Returns:
+            StreamSession: The running session
+        """
+        self._purge()
+        session = StreamSession(uuid.uuid4().hex, policy_id, self.buffer_size)
+        session.task = asyncio.get_running_loop().create_task(session.run(source))
+        self._sessions[session.stream_id] = session
+        self.stats["started"] += 1
+        return session
+
+    def resume(self, last_event_id: str, policy_id: str) -> Tuple[Optional[StreamSession], int]:
+        """
+        Find the session a Last-Event-ID refers to
+
+        Args:
+            last_event_id: "<stream_id>:<seq>" from the reconnecting client
+            policy_id: Policy of the reconnect request (must match)
+
+        Returns:
+            Tuple: (session or None, last sequence number seen by the client)
+        """
+        self._purge()
+        stream_id, _, seq = last_event_id.strip().partition(":")
+        session = self._sessions.get(stream_id)
+
+        if session is None or session.policy_id != policy_id:
+            return None, -1
+
+        self.stats["resumed"] += 1
+        try:
+            return session, int(seq)
+        except ValueError:
+            return session, -1
+
+    def _cancel_if_idle(self, session: StreamSession) -> None:
+        session.cancel_handle = None
+        if session.subscribers or session.done:
+            return
+
+        session.cancelled = True
+        session.task.cancel()
+        self.stats["cancelled"] += 1
+        logger.info(
+            f"Stream {session.stream_id} cancelled: no clients left "
+            f"({session.wasted_tokens} undelivered tokens)"
+        )
+
+    def _on_slow(self, policy: str) -> None:
+        key = {
+            SLOW_POLICY_COALESCE: "slow_coalesced",
+            SLOW_POLICY_DROP: "slow_dropped",
+            SLOW_POLICY_DISCONNECT: "slow_disconnected",
+        }[policy]
+        self.stats[key] += 1
+
+    async def sse_events(self, session: StreamSession, after_seq: int = -1) -> AsyncIterator[str]:
+        """
+        SSE-formatted events for one client of a session
+
+        Tracks the client as a subscriber: when the last client goes away
+        (disconnect or slow-consumer cut) the generation is cancelled after
+        the grace period.
+
+        Args:
+            session: Session to follow
+            after_seq: Last sequence number the client has seen
+
+        Yields:
+            str: SSE events, ending with [DONE] or [ERROR]
+        """
+        if session.cancel_handle is not None:
+            session.cancel_handle.cancel()
+            session.cancel_handle = None
+        session.subscribers += 1
+        completed = False
+
+        try:
+            async for seq, chunk in session.subscribe(
+                after_seq, self.client_buffer, self.slow_policy, self._on_slow
+            ):
+                yield format_sse_event(chunk, session.event_id(seq))
+
+            final_id = session.event_id(session.last_seq + 1)
+            if session.error is not None:
+                yield format_sse_event(f"[ERROR] {session.error}", final_id)
+            else:
+                # Send completion signal
+                yield format_sse_event("[DONE]", final_id)
+            completed = True
+
+        except SlowConsumerError as e:
+            logger.warning(str(e))
+            yield format_sse_event("[ERROR] Slow consumer disconnected. Resume with Last-Event-ID")
+
+        finally:
+            session.subscribers -= 1
+            if not completed:
+                self.stats["client_disconnects"] += 1
+            if not session.subscribers and not session.done and session.cancel_handle is None:
+                session.cancel_handle = asyncio.get_running_loop().call_later(
+                    self.cancel_grace_seconds, self._cancel_if_idle, session
+                )
+
+    def status(self) -> Dict[str, Any]:
+        """Active streams and counters"""
+        live = list(self._sessions.values())
+        stats = dict(self.stats)
+        # Retained sessions are only settled on expiry; cancelled ones are final
+        stats["tokens_generated"] += sum(s.tokens for s in live)
+        stats["tokens_wasted"] += sum(s.wasted_tokens for s in live if s.cancelled)
+        return {
+            "active": sum(1 for s in live if not s.done),
+            "retained": sum(1 for s in live if s.done),
+            "subscribers": sum(s.subscribers for s in live),
+            "slow_policy": self.slow_policy,
+            "stats": stats,
+        }
+
+
+# Singleton instance for reuse across requests
+_stream_hub_instance: Optional[ForensicStreamHub] = None
+
+
+def get_stream_hub() -> ForensicStreamHub:
+    """
+    Get or create the singleton ForensicStreamHub
+
+    Returns:
+        ForensicStreamHub: Hub configured from environment
+    """
+    global _stream_hub_instance
+
+    if _stream_hub_instance is None:
+        _stream_hub_instance = ForensicStreamHub(
+            buffer_size=int(os.getenv("FORENSICS_STREAM_BUFFER", "2048")),
+            ttl_seconds=float(os.getenv("FORENSICS_STREAM_TTL", "300")),
+            max_sessions=int(os.getenv("FORENSICS_STREAM_MAX_SESSIONS", "1000")),
+            cancel_grace_seconds=float(os.getenv("FORENSICS_STREAM_CANCEL_GRACE", "5")),
+            client_buffer=int(os.getenv("FORENSICS_STREAM_CLIENT_BUFFER", "256")),
+            slow_policy=os.getenv("FORENSICS_STREAM_SLOW_POLICY", SLOW_POLICY_COALESCE).lower(),
+        )
+        register_stream_metrics(_stream_hub_instance)
+
+    return _stream_hub_instance
+
+
+def register_stream_metrics(hub: ForensicStreamHub) -> None:
+    """Expose the hub's stream counts and counters on /metrics (read at scrape time)"""
+    registry = get_metrics_registry()
+    registry.callback_gauge(
+        "hyperion_sse_streams",
+        "Forensic SSE generations by state, and connected subscribers",
+        lambda: {
+            (state,): value for state, value in hub.status().items()
+            if state in ("active", "retained", "subscribers")
+        },
+        ("state",),
+    )
+    registry.callback_gauge(
+        "hyperion_sse_stream_events_total",
+        "Forensic SSE stream lifecycle events (started, resumed, cancelled, slow consumers, tokens)",
+        lambda: {(event,): value for event, value in hub.status()["stats"].items()},
+        ("event",),
+        kind="counter",
+    )
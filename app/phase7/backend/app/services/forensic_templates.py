@@ -0,0 +1,235 @@
+"""
+PROJECT HYPERION - PHASE 7: TEMPLATE FORENSIC REPORTS
+======================================================
+
+Purpose: Deterministic, LLM-free forensic report renderer
+         Produces the same explanation a Gemini report would lead with
+         ("wind X m/s exceeded the Y m/s threshold at location Z") from the
+         fields the Gemini prompt is built on.
+
+Used when:
+- The caller explicitly requests report_mode="template"
+- The Gemini rate limiter is saturated (no waiting for a free slot)
+- The Gemini API errors before any text was streamed
+
+Performance:
+- Section templates are bound once at import time
+- Rendering is plain string formatting (a few microseconds per report)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# m/s -> mph conversion factor (kept identical to the Gemini prompt)
+MS_TO_MPH = 2.237
+
+# Report modes accepted by the reporter and the forensics API
+REPORT_MODE_AUTO = "auto"
+REPORT_MODE_LLM = "llm"
+REPORT_MODE_TEMPLATE = "template"
+REPORT_MODES = (REPORT_MODE_AUTO, REPORT_MODE_LLM, REPORT_MODE_TEMPLATE)
+
+
+def format_measurement_time(measurement_time: int) -> str:
+    """Format a Unix timestamp the way forensic reports display it"""
+    return datetime.fromtimestamp(measurement_time).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+def extract_forensic_fields(
+    oracle_payload: Dict[str, Any],
+    policy_metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Extract the report fields shared by the Gemini prompt and the template
+
+    Args:
+        oracle_payload: Raw oracle data
+        policy_metadata: Optional policy NFT metadata
+
+    Returns:
+        dict: Flat mapping of formatted report fields
+    """
+    # Format timestamp
+    timestamp_str = format_measurement_time(oracle_payload.get("measurement_time", 0))
+
+    # Extract key metrics
+    wind_speed = oracle_payload.get("wind_speed", 0)
+    threshold = oracle_payload.get("threshold", wind_speed)  # Default to measured value
+
+    triggered = wind_speed >= threshold
+    excess = wind_speed - threshold
+    excess_pct = (excess / threshold * 100) if threshold else 0.0
+
+    fields = {
+        "policy_id": oracle_payload.get("policy_id", "unknown"),
+        "location_id": oracle_payload.get("location_id", "unknown"),
+        "timestamp_str": timestamp_str,
+        "wind_speed": wind_speed,
+        "wind_speed_mph": wind_speed * MS_TO_MPH,
+        "threshold": threshold,
+        "threshold_mph": threshold * MS_TO_MPH,
+        "nonce": oracle_payload.get("nonce", "N/A"),
+        "triggered": triggered,
+        "comparison": "exceeded" if triggered else "did not exceed",
+        "excess": abs(excess),
+        "excess_pct": abs(excess_pct),
+        "excess_direction": "above" if triggered else "below",
+        "has_policy_metadata": bool(policy_metadata),
+    }
+
+    if policy_metadata:
+        fields.update({
+            "coverage_type": policy_metadata.get("coverage_type", "Hurricane Wind Damage"),
+            "beneficiary": policy_metadata.get("beneficiary", "N/A"),
+            "coverage_amount": policy_metadata.get("coverage_amount", "N/A"),
+        })
+
+    return fields
+
+
+# ============================================================================
+# PRECOMPILED TEMPLATE SECTIONS
+# ============================================================================
+
+_HEADER = "FORENSIC REPORT - Policy {policy_id}\n\n"
+
+_TRIGGER_EVENT = (
+    "Trigger Event: At {timestamp_str}, the oracle recorded a wind speed of "
+    "{wind_speed:.2f} m/s ({wind_speed_mph:.1f} mph) at location {location_id}. "
+    "This {comparison} the agreed threshold of {threshold:.2f} m/s "
+    "({threshold_mph:.1f} mph) by {excess:.2f} m/s ({excess_pct:.1f}% "
+    "{excess_direction} the threshold).\n\n"
+)
+
+_DATA_VALIDATION = (
+    "Data Validation: The reading is bound to location {location_id}, "
+    "timestamped {timestamp_str}, and carries oracle nonce {nonce}, which "
+    "prevents the same measurement from being replayed.\n\n"
+)
+
+_CONTRACT_TRIGGERED = (
+    "Smart Contract Logic: The Cardano smart contract verified the oracle "
+    "signature and compared the measurement against the policy threshold. "
+    "Because the threshold was met, the payout was authorized automatically, "
+    "without human intervention.\n\n"
+)
+
+_CONTRACT_NOT_TRIGGERED = (
+    "Smart Contract Logic: The Cardano smart contract compared the measurement "
+    "against the policy threshold. Because the threshold was not met, no "
+    "payout was authorized.\n\n"
+)
+
+_POLICY = (
+    "Policy: {coverage_type} coverage of {coverage_amount} USDM for "
+    "beneficiary {beneficiary}.\n\n"
+)
+
+_TRANSPARENCY = (
+    "Blockchain Transparency: The oracle data and the contract decision are "
+    "recorded on-chain and can be audited by anyone.\n\n"
+)
+
+_NEXT_STEPS_TRIGGERED = (
+    "Next Steps: The payout will be sent to the policy NFT holder's wallet "
+    "address via the Treasury vault.\n\n"
+)
+
+_NEXT_STEPS_NOT_TRIGGERED = (
+    "Next Steps: No action is required. Monitoring of this location "
+    "continues.\n\n"
+)
+
+_SUMMARY = (
+    "Summary:\n"
+    "- Wind: {wind_speed:.2f} m/s vs threshold {threshold:.2f} m/s\n"
+    "- Location: {location_id}\n"
+    "- Measured: {timestamp_str}\n"
+    "- Outcome: {outcome}\n"
+)
+
+# Bound once so rendering never re-resolves the template strings
+_render_header = _HEADER.format_map
+_render_trigger_event = _TRIGGER_EVENT.format_map
+_render_data_validation = _DATA_VALIDATION.format_map
+_render_policy = _POLICY.format_map
+_render_summary = _SUMMARY.format_map
+
+
+def render_template_chunks(
+    oracle_payload: Dict[str, Any],
+    policy_metadata: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """
+    Render a deterministic forensic report as a list of text chunks
+
+    Each chunk is one report section, so the result can be streamed through
+    the same SSE framing as Gemini output.
+
+    Args:
+        oracle_payload: Raw oracle data (validated by the caller)
+        policy_metadata: Optional policy NFT metadata
+
+    Returns:
+        List[str]: Report sections in display order
+    """
+    fields = extract_forensic_fields(oracle_payload, policy_metadata)
+    triggered = fields["triggered"]
+    fields["outcome"] = "payout authorized" if triggered else "no payout"
+
+    chunks = [
+        _render_header(fields),
+        _render_trigger_event(fields),
+        _render_data_validation(fields),
+        _CONTRACT_TRIGGERED if triggered else _CONTRACT_NOT_TRIGGERED,
+    ]
+
+    if fields["has_policy_metadata"]:
+        chunks.append(_render_policy(fields))
+
+    chunks.append(_TRANSPARENCY)
+    chunks.append(_NEXT_STEPS_TRIGGERED if triggered else _NEXT_STEPS_NOT_TRIGGERED)
+    chunks.append(_render_summary(fields))
+
+    return chunks
+
+
+def render_storm_policy_chunks(
+    oracle_payload: Dict[str, Any],
+    policy_metadata: Optional[Dict[str, Any]],
+    narrative: str
+) -> List[str]:
+    """
+    Render a per-policy report around a shared storm narrative
+
+    The storm narrative is generated once per storm cluster; everything
+    policy-specific is substituted deterministically from the template.
+
+    Args:
+        oracle_payload: Raw oracle data for this policy
+        policy_metadata: Optional policy NFT metadata
+        narrative: Storm narrative shared by the cluster
+
+    Returns:
+        List[str]: Report sections in display order
+    """
+    chunks = render_template_chunks(oracle_payload, policy_metadata)
+    chunks.insert(1, f"Storm Event: {narrative.strip()}\n\n")
+    return chunks
+
+
+def render_template_report(
+    oracle_payload: Dict[str, Any],
+    policy_metadata: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Render a complete deterministic forensic report
+
+    Args:
+        oracle_payload: Raw oracle data (validated by the caller)
+        policy_metadata: Optional policy NFT metadata
+
+    Returns:
+        str: Complete report text
+    """
+    return "".join(render_template_chunks(oracle_payload, policy_metadata))
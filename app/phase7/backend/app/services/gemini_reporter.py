@@ -11,6 +11,29 @@ Integration:
 - Phase 2: References treasury payout logic
 - Phase 1: Connects policy NFT metadata to real-world events
 
+Model backends:
+- Generation goes through a pluggable ForensicModelBackend (see
+  forensic_backends.py). google-generativeai is only imported when the
+  Gemini backend is created, and FORENSICS_MODEL_BACKEND=fake swaps in a
+  local stand-in for load tests.
+- A ModelRouter (forensic_routing.py) picks the model per request class
+  (interactive, batch, fallback) from rolling latency / error profiles.
+
+Prompt layout:
+- FORENSIC_SYSTEM_INSTRUCTION holds the static role and report instructions.
+  It is built once per process and passed to the backend as a system
+  instruction (Gemini keeps one model handle per instruction)
+- The per-request prompt only carries the claim figures and a compact JSON
+  copy of the oracle payload
+- Prompt/output token counts and time to first token are tracked per
+  request (GeminiForensicReporter.prompt_usage())
+
+Report modes:
+- "llm": Always generate with Gemini
+- "template": Deterministic template renderer (no API call, sub-millisecond)
+- "auto" (default): Gemini, falling back to the template when the rate
+  limiter is saturated or the API errors before any text was streamed
+
 Security:
 - Rate limiting implemented to prevent API abuse
 - Input validation for oracle payloads
@@ -20,59 +43,125 @@ Security:
 
 import os
 import json
+import time
 import asyncio
 from typing import AsyncIterator, Dict, Any, Optional
-from datetime import datetime
 import logging
 
-# Google Gemini SDK
-try:
-    import google.generativeai as genai
-except ImportError:
-    raise ImportError(
-        "google-generativeai not installed. Run: pip install google-generativeai"
-    )
+from app.services.forensic_backends import (
+    ForensicModelBackend,
+    create_model_backend,
+    estimate_tokens,
+)
+from app.services.forensic_routing import (
+    ROUTE_BATCH,
+    ROUTE_FALLBACK,
+    ROUTE_INTERACTIVE,
+    ModelRouter,
+    create_model_router,
+)
+from app.services.forensic_speculation import get_speculation_manager
+from app.services.health_probe import PROBE_DEGRADED, PROBE_UP
+from app.services.forensic_templates import (
+    REPORT_MODE_AUTO,
+    REPORT_MODE_LLM,
+    REPORT_MODE_TEMPLATE,
+    REPORT_MODES,
+    extract_forensic_fields,
+    render_template_chunks,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefix of the error text streamed when Gemini fails mid-report
+REPORT_ERROR_MARKER = "[ERROR] Failed to generate report"
+
+# Static part of every forensic report prompt (identical across requests)
+FORENSIC_SYSTEM_INSTRUCTION = """You are an AI insurance adjuster for Project Hyperion, a parametric hurricane insurance protocol on the Cardano blockchain.
+
+Your task is to generate a clear, professional forensic report explaining why an insurance claim was automatically triggered by smart contract logic. Each request gives the CLAIM DETAILS, the RAW ORACLE PAYLOAD (JSON) and, when available, the POLICY METADATA of the CIP-68 policy NFT.
+
+**INSTRUCTIONS:**
+Write a forensic report (200-400 words) that:
+
+1. **Explains the Trigger Event**: Describe what happened in plain English (e.g., "Hurricane winds exceeded the agreed threshold at Location X").
+
+2. **Validates the Data**: Confirm the oracle reading is legitimate (mention timestamp, location, wind speed measurement).
+
+3. **Smart Contract Logic**: Explain how the Cardano smart contract automatically validated this data and authorized the payout WITHOUT human intervention.
+
+4. **Blockchain Transparency**: Highlight that this entire process is recorded on-chain and auditable by anyone.
+
+5. **Next Steps**: Briefly mention that the payout will be sent to the policy NFT holder's wallet address via the Treasury vault (Phase 2).
+
+**TONE:** Professional but accessible. Avoid jargon. Target audience is a policyholder who may not understand blockchain technology.
+
+**FORMAT:** Use clear paragraphs. Include a "Summary" section at the end with bullet points."""
+
+FORENSIC_SYSTEM_INSTRUCTION_TOKENS = estimate_tokens(FORENSIC_SYSTEM_INSTRUCTION)
+
 
 class GeminiForensicReporter:
     """
     Handles streaming forensic report generation using Google Gemini API
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        backend: Optional[ForensicModelBackend] = None
+    ):
         """
         Initialize Gemini client with API key
 
         Args:
             api_key: Google Gemini API key (defaults to GEMINI_API_KEY env var)
+            backend: Optional model backend serving every request class
+                     (defaults to routing across FORENSICS_MODELS_* on the
+                     FORENSICS_MODEL_BACKEND backend)
         """
-        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
-
-        if not self.api_key:
-            raise ValueError(
-                "GEMINI_API_KEY not found. Set environment variable or pass to constructor."
+        if backend is not None:
+            self.router = ModelRouter.single(backend)
+        else:
+            self.router = create_model_router(
+                lambda model_name: create_model_backend(api_key, model_name)
             )
 
-        # Configure Gemini
-        genai.configure(api_key=self.api_key)
-
-        # Use Gemini 1.5 Flash for fast streaming (or gemini-1.5-pro for higher quality)
-        self.model = genai.GenerativeModel("gemini-1.5-flash")
+        # Primary interactive model, created up front so configuration errors surface here
+        self.backend = self.router.backend(self.router.routes[ROUTE_INTERACTIVE][0])
+        self.model_name = self.backend.model_name
 
         # Rate limiting (configurable via env)
         self.max_requests_per_minute = int(os.getenv("GEMINI_RATE_LIMIT", "60"))
         self._request_timestamps = []
 
-        logger.info("GeminiForensicReporter initialized with model: gemini-1.5-flash")
+        # Per-minute slots batch jobs must leave free for interactive requests
+        self.interactive_reserve = int(os.getenv(
+            "GEMINI_INTERACTIVE_RESERVE",
+            str(max(1, self.max_requests_per_minute // 5))
+        ))
+
+        # Running totals for LLM forensic reports (see prompt_usage())
+        self._prompt_stats = {
+            "requests": 0,
+            "prompt_tokens": 0,
+            "output_tokens": 0,
+            "first_token_ms": 0.0,
+        }
+
+        logger.info(
+            f"GeminiForensicReporter initialized with {self.backend.name} backend, "
+            f"model: {self.model_name}"
+        )
 
     async def stream_forensic_report(
         self,
         oracle_payload: Dict[str, Any],
-        policy_metadata: Optional[Dict[str, Any]] = None
+        policy_metadata: Optional[Dict[str, Any]] = None,
+        mode: str = REPORT_MODE_AUTO,
+        request_class: str = ROUTE_INTERACTIVE
     ) -> AsyncIterator[str]:
         """
         Generate a streaming forensic report from oracle data
@@ -93,48 +182,126 @@ class GeminiForensicReporter:
                 - beneficiary: str
                 - coverage_amount: int
 
+            mode: Report mode ("auto", "llm" or "template")
+            request_class: Routing class ("interactive" or "batch")
+
         Yields:
-            str: Text chunks from Gemini's streaming response
+            str: Text chunks from Gemini's streaming response (or the template)
 
         Raises:
-            ValueError: If oracle_payload is invalid
+            ValueError: If oracle_payload or mode is invalid
             Exception: If Gemini API fails
         """
         # Validate input
         self._validate_oracle_payload(oracle_payload)
+        validate_report_mode(mode)
+
+        # Template fast path: explicit, or the limiter has no free slot for an
+        # interactive request (batch work waits for its own budget instead)
+        if mode == REPORT_MODE_TEMPLATE or (
+            mode == REPORT_MODE_AUTO
+            and request_class == ROUTE_INTERACTIVE
+            and self._rate_limit_saturated()
+        ):
+            if mode == REPORT_MODE_AUTO:
+                logger.warning("Rate limit saturated. Serving template forensic report")
+            for chunk in render_template_chunks(oracle_payload, policy_metadata):
+                yield chunk
+            return
 
         # Rate limiting check
-        await self._enforce_rate_limit()
+        await self._enforce_rate_limit(request_class)
 
         # Build forensic prompt
         prompt = self._build_forensic_prompt(oracle_payload, policy_metadata)
 
         logger.info(f"Generating forensic report for policy: {oracle_payload.get('policy_id', 'unknown')}")
 
-        try:
-            # Stream response from Gemini
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                prompt,
-                stream=True
-            )
+        backend = self.router.select(request_class)
+        streamed_any = False
 
-            # Yield chunks as they arrive
-            for chunk in response:
-                if chunk.text:
-                    yield chunk.text
-                    # Small delay to prevent overwhelming frontend
-                    await asyncio.sleep(0.01)
+        try:
+            async for text in self._stream_from(backend, prompt):
+                streamed_any = True
+                yield text
+                # Small delay to prevent overwhelming frontend
+                await asyncio.sleep(0.01)
 
             logger.info("Forensic report generation completed successfully")
+            return
 
         except Exception as e:
-            logger.error(f"Gemini API error: {str(e)}")
-            # Yield error message to frontend
-            yield f"\n\n[ERROR] Failed to generate report: {str(e)}\n"
-            yield "Please check your GEMINI_API_KEY and try again.\n"
+            logger.error(f"Gemini API error ({backend.model_name}): {str(e)}")
+            error = e
+
+        # Nothing reached the client yet: retry once on the fallback model
+        if not streamed_any:
+            try:
+                fallback = self.router.select(ROUTE_FALLBACK, exclude=backend.model_name)
+            except Exception as e:
+                logger.warning(f"Fallback model unavailable: {e}")
+                fallback = backend
+            if fallback.model_name != backend.model_name:
+                logger.warning(f"Retrying forensic report on fallback model {fallback.model_name}")
+                try:
+                    async for text in self._stream_from(fallback, prompt):
+                        streamed_any = True
+                        yield text
+                        await asyncio.sleep(0.01)
+                    return
+                except Exception as e:
+                    logger.error(f"Gemini API error ({fallback.model_name}): {str(e)}")
+                    error = e
+
+        # Still nothing streamed: answer with the template instead
+        if mode == REPORT_MODE_AUTO and not streamed_any:
+            logger.warning("Falling back to template forensic report")
+            for chunk in render_template_chunks(oracle_payload, policy_metadata):
+                yield chunk
+            return
+
+        # Yield error message to frontend
+        yield f"\n\n{REPORT_ERROR_MARKER}: {str(error)}\n"
+        yield "Please check your GEMINI_API_KEY and try again.\n"
+
+    async def _stream_from(
+        self,
+        backend: ForensicModelBackend,
+        prompt: str,
+        system_instruction: Optional[str] = FORENSIC_SYSTEM_INSTRUCTION
+    ) -> AsyncIterator[str]:
+        """
+        Stream one generation and record its latency / outcome with the router
+
+        Args:
+            backend: Backend chosen by the router
+            prompt: Per-request prompt
+            system_instruction: Static instruction (None for free-form prompts)
+
+        Yields:
+            str: Generated text chunks
+        """
+        usage: Dict[str, Any] = {}
+        started = time.perf_counter()
+        first_token_ms: Optional[float] = None
 
-    def _validate_oracle_payload(self, payload: Dict[str, Any]) -> None:
+        try:
+            async for text in backend.stream_generate(
+                prompt, system_instruction=system_instruction, usage=usage
+            ):
+                if first_token_ms is None:
+                    first_token_ms = (time.perf_counter() - started) * 1000
+                yield text
+        except Exception:
+            self.router.record(backend.model_name, first_token_ms, ok=False)
+            raise
+
+        self.router.record(backend.model_name, first_token_ms, ok=True)
+        if system_instruction == FORENSIC_SYSTEM_INSTRUCTION:
+            self._record_prompt_usage(prompt, usage, first_token_ms or 0.0)
+
+    @staticmethod
+    def _validate_oracle_payload(payload: Dict[str, Any]) -> None:
         """
         Validate oracle payload structure
 
@@ -157,26 +324,86 @@ class GeminiForensicReporter:
         if not isinstance(payload.get("measurement_time"), int):
             raise ValueError("measurement_time must be a Unix timestamp (int)")
 
-    async def _enforce_rate_limit(self) -> None:
+    def _rate_limit_saturated(self) -> bool:
         """
-        Simple rate limiting to prevent API abuse
-        Tracks requests per minute
+        Check whether a Gemini request right now would have to wait
+
+        Returns:
+            bool: True if the per-minute budget is used up
         """
         now = asyncio.get_event_loop().time()
+        recent = sum(1 for ts in self._request_timestamps if now - ts < 60)
+        return recent >= self.max_requests_per_minute
 
-        # Remove timestamps older than 60 seconds
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps if now - ts < 60
-        ]
+    async def _enforce_rate_limit(self, request_class: str = ROUTE_INTERACTIVE) -> None:
+        """
+        Simple rate limiting to prevent API abuse
+        Tracks requests per minute
 
-        # Check if limit exceeded
-        if len(self._request_timestamps) >= self.max_requests_per_minute:
-            wait_time = 60 - (now - self._request_timestamps[0])
-            logger.warning(f"Rate limit reached. Waiting {wait_time:.1f}s")
+        Batch requests only get the slots left after interactive_reserve, so
+        background work can never use up the interactive share. The slot is
+        recorded in the same step as the check, so concurrent callers
+        cannot all pass on the same free slot.
+
+        Args:
+            request_class: Routing class ("interactive" or "batch")
+        """
+        budget = self.max_requests_per_minute
+        if request_class != ROUTE_INTERACTIVE:
+            budget = max(1, budget - self.interactive_reserve)
+
+        while True:
+            now = asyncio.get_event_loop().time()
+
+            # Remove timestamps older than 60 seconds
+            self._request_timestamps = [
+                ts for ts in self._request_timestamps if now - ts < 60
+            ]
+
+            if len(self._request_timestamps) < budget:
+                # Record this request
+                self._request_timestamps.append(now)
+                return
+
+            # Sleep until the oldest counted request leaves the window
+            wait_time = max(0.05, 60 - (now - self._request_timestamps[0]))
+            logger.warning(f"Rate limit reached ({request_class}). Waiting {wait_time:.1f}s")
             await asyncio.sleep(wait_time)
 
-        # Record this request
-        self._request_timestamps.append(now)
+    def _record_prompt_usage(self, prompt: str, usage: Dict[str, Any], first_token_ms: float) -> None:
+        """Add one completed report to the prompt statistics"""
+        prompt_tokens = usage.get(
+            "prompt_tokens", FORENSIC_SYSTEM_INSTRUCTION_TOKENS + estimate_tokens(prompt)
+        )
+        stats = self._prompt_stats
+        stats["requests"] += 1
+        stats["prompt_tokens"] += prompt_tokens
+        stats["output_tokens"] += usage.get("output_tokens", 0)
+        stats["first_token_ms"] += first_token_ms
+
+        logger.info(
+            f"Forensic prompt: {prompt_tokens} tokens "
+            f"({FORENSIC_SYSTEM_INSTRUCTION_TOKENS} static), "
+            f"first token after {first_token_ms:.0f}ms"
+        )
+
+    def prompt_usage(self) -> Dict[str, Any]:
+        """
+        Prompt token and latency statistics for LLM forensic reports
+
+        Returns:
+            dict: Totals and per-request averages
+        """
+        stats = self._prompt_stats
+        requests = stats["requests"] or 1
+        return {
+            "requests": stats["requests"],
+            "static_prompt_tokens": FORENSIC_SYSTEM_INSTRUCTION_TOKENS,
+            "prompt_tokens_total": stats["prompt_tokens"],
+            "output_tokens_total": stats["output_tokens"],
+            "avg_prompt_tokens": round(stats["prompt_tokens"] / requests, 1),
+            "avg_first_token_ms": round(stats["first_token_ms"] / requests, 1),
+        }
 
     def _build_forensic_prompt(
         self,
@@ -184,7 +411,8 @@ class GeminiForensicReporter:
         policy_metadata: Optional[Dict[str, Any]] = None
     ) -> str:
         """
-        Construct the Gemini prompt for forensic report generation
+        Construct the per-request part of the forensic report prompt
+        (the static part is FORENSIC_SYSTEM_INSTRUCTION)
 
         Args:
             oracle_payload: Raw oracle data
@@ -193,37 +421,32 @@ class GeminiForensicReporter:
         Returns:
             str: Formatted prompt for Gemini
         """
-        # Format timestamp
-        measurement_time = oracle_payload.get("measurement_time", 0)
-        timestamp_str = datetime.fromtimestamp(measurement_time).strftime("%Y-%m-%d %H:%M:%S UTC")
-
-        # Extract key metrics
-        wind_speed = oracle_payload.get("wind_speed", 0)
-        location_id = oracle_payload.get("location_id", "unknown")
-        policy_id = oracle_payload.get("policy_id", "unknown")
-        threshold = oracle_payload.get("threshold", wind_speed)  # Default to measured value
-
-        # Convert wind speed from m/s to mph for readability
-        wind_speed_mph = wind_speed * 2.237
-        threshold_mph = threshold * 2.237
-
-        # Build base prompt
-        prompt = f"""You are an AI insurance adjuster for Project Hyperion, a parametric hurricane insurance protocol on the Cardano blockchain.
-
-Your task is to generate a clear, professional forensic report explaining why an insurance claim was automatically triggered by smart contract logic.
-
-**CLAIM DETAILS:**
+        # Extract key metrics (shared with the template renderer)
+        fields = extract_forensic_fields(oracle_payload, policy_metadata)
+        timestamp_str = fields["timestamp_str"]
+        wind_speed = fields["wind_speed"]
+        location_id = fields["location_id"]
+        policy_id = fields["policy_id"]
+        threshold = fields["threshold"]
+        wind_speed_mph = fields["wind_speed_mph"]
+        threshold_mph = fields["threshold_mph"]
+
+        # Compact payload copy: unset optional fields carry no information
+        raw_payload = json.dumps(
+            {k: v for k, v in oracle_payload.items() if v is not None},
+            separators=(",", ":")
+        )
+
+        # Build per-request prompt
+        prompt = f"""**CLAIM DETAILS:**
 - Policy ID: {policy_id}
 - Location: {location_id}
 - Measurement Time: {timestamp_str}
 - Recorded Wind Speed: {wind_speed:.2f} m/s ({wind_speed_mph:.1f} mph)
 - Trigger Threshold: {threshold:.2f} m/s ({threshold_mph:.1f} mph)
-- Oracle Nonce: {oracle_payload.get('nonce', 'N/A')}
+- Oracle Nonce: {fields['nonce']}
 
-**RAW ORACLE PAYLOAD:**
-```json
-{json.dumps(oracle_payload, indent=2)}
-```
+**RAW ORACLE PAYLOAD:** {raw_payload}
 """
 
         # Add policy metadata if available
@@ -237,34 +460,38 @@ Your task is to generate a clear, professional forensic report explaining why an
 - Coverage Amount: {coverage_amount} USDM
 """
 
-        # Add instructions
-        prompt += """
-**INSTRUCTIONS:**
-Write a forensic report (200-400 words) that:
-
-1. **Explains the Trigger Event**: Describe what happened in plain English (e.g., "Hurricane winds exceeded the agreed threshold at Location X").
-
-2. **Validates the Data**: Confirm the oracle reading is legitimate (mention timestamp, location, wind speed measurement).
+        prompt += "\nGenerate the forensic report now:\n"
 
-3. **Smart Contract Logic**: Explain how the Cardano smart contract automatically validated this data and authorized the payout WITHOUT human intervention.
+        return prompt
 
-4. **Blockchain Transparency**: Highlight that this entire process is recorded on-chain and auditable by anyone.
+    async def generate_text(self, prompt: str, request_class: str = ROUTE_BATCH) -> str:
+        """
+        Generate free-form text for a prompt (rate limited, no template fallback)
+        Used for shared narratives such as storm summaries
 
-5. **Next Steps**: Briefly mention that the payout will be sent to the policy NFT holder's wallet address via the Treasury vault (Phase 2).
+        Args:
+            prompt: Complete prompt text
+            request_class: Routing class (defaults to "batch")
 
-**TONE:** Professional but accessible. Avoid jargon. Target audience is a policyholder who may not understand blockchain technology.
+        Returns:
+            str: Generated text
 
-**FORMAT:** Use clear paragraphs. Include a "Summary" section at the end with bullet points.
+        Raises:
+            Exception: If the model backend fails
+        """
+        await self._enforce_rate_limit(request_class)
 
-Generate the forensic report now:
-"""
+        chunks = []
+        async for text in self._stream_from(self.router.select(request_class), prompt, None):
+            chunks.append(text)
 
-        return prompt
+        return "".join(chunks)
 
     async def generate_static_report(
         self,
         oracle_payload: Dict[str, Any],
-        policy_metadata: Optional[Dict[str, Any]] = None
+        policy_metadata: Optional[Dict[str, Any]] = None,
+        mode: str = REPORT_MODE_AUTO
     ) -> str:
         """
         Generate a complete (non-streaming) forensic report
@@ -273,17 +500,32 @@ Generate the forensic report now:
         Args:
             oracle_payload: Raw oracle data
             policy_metadata: Optional policy metadata
+            mode: Report mode ("auto", "llm" or "template")
 
         Returns:
             str: Complete forensic report text
         """
         chunks = []
-        async for chunk in self.stream_forensic_report(oracle_payload, policy_metadata):
+        async for chunk in self.stream_forensic_report(oracle_payload, policy_metadata, mode):
             chunks.append(chunk)
 
         return "".join(chunks)
 
 
+def validate_report_mode(mode: str) -> None:
+    """
+    Validate a requested report mode
+
+    Args:
+        mode: Report mode to check
+
+    Raises:
+        ValueError: If mode is not one of REPORT_MODES
+    """
+    if mode not in REPORT_MODES:
+        raise ValueError(f"Invalid report mode '{mode}'. Expected one of: {', '.join(REPORT_MODES)}")
+
+
 # Singleton instance for reuse across requests
 _reporter_instance: Optional[GeminiForensicReporter] = None
 
@@ -304,13 +546,40 @@ def get_gemini_reporter() -> GeminiForensicReporter:
     return _reporter_instance
 
 
+async def probe_gemini() -> Dict[str, Any]:
+    """
+    Health check for the model backend (run by the background health prober)
+
+    Builds the reporter once, off the event loop, and reports routing
+    health from recorded traffic; it never sends a generation request.
+
+    Returns:
+        Dict[str, Any]: Backend, model, routing and prompt usage; "degraded"
+        while every interactive model is cooling down
+    """
+    reporter = await asyncio.to_thread(get_gemini_reporter)
+    routing = reporter.router.status()
+    interactive = routing["routes"].get(ROUTE_INTERACTIVE, [])
+    cooling = {name for name, profile in routing["models"].items() if profile["cooling_down"]}
+
+    return {
+        "status": PROBE_DEGRADED if interactive and cooling.issuperset(interactive) else PROBE_UP,
+        "backend": reporter.backend.name,
+        "model": reporter.model_name,
+        "routing": routing,
+        "prompt_usage": reporter.prompt_usage(),
+    }
+
+
 # Convenience function for direct use
 async def stream_forensic_report(data: Dict[str, Any]) -> AsyncIterator[str]:
     """
     Convenience function for streaming forensic reports
 
     Args:
-        data: Dict containing 'oracle_payload' and optional 'policy_metadata'
+        data: Dict containing 'oracle_payload' and optional 'policy_metadata',
+              'report_mode' ("auto", "llm" or "template") and 'request_class'
+              ("interactive" or "batch")
 
     Yields:
         str: Report text chunks
@@ -329,13 +598,42 @@ async def stream_forensic_report(data: Dict[str, Any]) -> AsyncIterator[str]:
         >>> async for chunk in stream_forensic_report(data):
         ...     print(chunk, end="", flush=True)
     """
-    reporter = get_gemini_reporter()
-
     oracle_payload = data.get("oracle_payload")
     if not oracle_payload:
         raise ValueError("Missing 'oracle_payload' in request data")
 
     policy_metadata = data.get("policy_metadata")
-
-    async for chunk in reporter.stream_forensic_report(oracle_payload, policy_metadata):
+    mode = data.get("report_mode", REPORT_MODE_AUTO)
+    validate_report_mode(mode)
+
+    # Template mode never needs a Gemini client
+    if mode == REPORT_MODE_TEMPLATE:
+        GeminiForensicReporter._validate_oracle_payload(oracle_payload)
+        for chunk in render_template_chunks(oracle_payload, policy_metadata):
+            yield chunk
+        return
+
+    # A speculative draft started before the trigger only needs the measured values
+    speculative = await get_speculation_manager().finalize(oracle_payload, policy_metadata)
+    if speculative:
+        GeminiForensicReporter._validate_oracle_payload(oracle_payload)
+        logger.info(f"Serving speculative forensic report for policy: {oracle_payload.get('policy_id')}")
+        for chunk in speculative:
+            yield chunk
+        return
+
+    try:
+        reporter = get_gemini_reporter()
+    except Exception as e:
+        # Without a Gemini client only the template can answer
+        if mode == REPORT_MODE_LLM:
+            raise
+        logger.warning(f"Gemini reporter unavailable ({e}). Serving template forensic report")
+        GeminiForensicReporter._validate_oracle_payload(oracle_payload)
+        for chunk in render_template_chunks(oracle_payload, policy_metadata):
+            yield chunk
+        return
+
+    request_class = data.get("request_class", ROUTE_INTERACTIVE)
+    async for chunk in reporter.stream_forensic_report(oracle_payload, policy_metadata, mode, request_class):
         yield chunk
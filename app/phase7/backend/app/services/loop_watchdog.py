@@ -0,0 +1,213 @@
+"""
+PROJECT HYPERION - EVENT LOOP LAG WATCHDOG
+==========================================
+
+Purpose: Catch blocking calls on the event loop (synchronous Gemini chunk
+         iteration, pycardano's synchronous Blockfrost calls, inline
+         signing) in production.
+
+Two cheap parts:
+- a heartbeat task sleeps HYPERION_LOOP_WATCHDOG_INTERVAL_MS and records
+  how late it wakes up: the loop lag. Samples feed a histogram and a rolling
+  window whose percentiles are published on /metrics and /debug/loop
+- a daemon thread checks the heartbeat. When the loop has not ticked for
+  HYPERION_LOOP_LAG_THRESHOLD_MS, it captures the stack of the loop thread,
+  i.e. the callback that is blocking it, once per stall
+
+HYPERION_LOOP_WATCHDOG=0 turns both off.
+"""
+
+import os
+import sys
+import math
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from app.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_registry = get_metrics_registry()
+LOOP_LAG = _registry.histogram(
+    "hyperion_event_loop_lag_seconds",
+    "Event loop heartbeat lateness",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+LOOP_STALLS = _registry.counter(
+    "hyperion_event_loop_stalls_total", "Event loop blocked longer than the watchdog threshold"
+)
+
+_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+class LoopWatchdog:
+    """
+    Measures event loop lag and records the stack of long stalls
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        threshold_seconds: float = 0.25,
+        window: int = 1200,
+        max_stalls: int = 50
+    ):
+        """
+        Args:
+            interval_seconds: Heartbeat period
+            threshold_seconds: Blocking time that counts as a stall
+            window: Lag samples kept for percentiles
+            max_stalls: Stall records kept
+        """
+        self.interval_seconds = interval_seconds
+        self.threshold_seconds = threshold_seconds
+        self._lags: Deque[float] = deque(maxlen=window)
+        self._stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stalls)
+        self._current_stall: Optional[Dict[str, Any]] = None
+        self._last_beat = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(0.0, loop.time() - expected)
+            self._last_beat = time.monotonic()
+            self._lags.append(lag)
+            LOOP_LAG.labels().observe(lag)
+
+            stall = self._current_stall
+            if stall is not None:
+                self._current_stall = None
+                stall["blocked_ms"] = round(lag * 1000, 1)
+                logger.warning(
+                    f"Event loop blocked for {lag * 1000:.0f}ms in {stall['task'] or 'a callback'}",
+                    extra={"blocked_ms": stall["blocked_ms"]}
+                )
+
+    def _capture(self, blocked: float) -> Dict[str, Any]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        task = None
+        try:
+            current = asyncio.current_task(self._loop)
+            task = current.get_name() if current else None
+        except RuntimeError:
+            pass
+        return {
+            "detected_at": time.time(),
+            "blocked_ms": round(blocked * 1000, 1),
+            "task": task,
+            "stack": traceback.format_stack(frame)[-30:] if frame else [],
+        }
+
+    def _watch(self) -> None:
+        poll = max(self.threshold_seconds / 2, 0.01)
+        while not self._stop.wait(poll):
+            blocked = time.monotonic() - self._last_beat - self.interval_seconds
+            if blocked > self.threshold_seconds and self._current_stall is None:
+                stall = self._capture(blocked)
+                self._current_stall = stall
+                self._stalls.append(stall)
+                LOOP_STALLS.labels().inc()
+
+    async def start(self) -> None:
+        """Start the heartbeat and the watcher thread (idempotent)"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._thread = None
+
+    def _window_quantiles(self) -> Dict[str, float]:
+        ordered = sorted(self._lags)
+        return {str(q): _percentile(ordered, q) for q in _QUANTILES}
+
+    def lag_percentiles(self) -> Dict[str, float]:
+        """Lag over the sample window in ms (p50/p90/p99/max)"""
+        summary = {
+            f"p{round(float(q) * 100)}": round(lag * 1000, 2)
+            for q, lag in self._window_quantiles().items()
+        }
+        summary["max"] = round(max(self._lags, default=0.0) * 1000, 2)
+        return summary
+
+    def status(self) -> Dict[str, Any]:
+        """Lag summary and recent stalls (newest first)"""
+        return {
+            "enabled": self.running,
+            "interval_ms": self.interval_seconds * 1000,
+            "threshold_ms": self.threshold_seconds * 1000,
+            "samples": len(self._lags),
+            "lag_ms": self.lag_percentiles(),
+            "stalls": list(reversed(self._stalls)),
+        }
+
+
+# Singleton instance
+_watchdog_instance: Optional[LoopWatchdog] = None
+
+
+def get_loop_watchdog() -> LoopWatchdog:
+    """
+    Get or create the singleton LoopWatchdog
+
+    Returns:
+        LoopWatchdog: Configured from HYPERION_LOOP_WATCHDOG_INTERVAL_MS /
+        HYPERION_LOOP_LAG_THRESHOLD_MS
+    """
+    global _watchdog_instance
+
+    if _watchdog_instance is None:
+        _watchdog_instance = LoopWatchdog(
+            interval_seconds=float(os.getenv("HYPERION_LOOP_WATCHDOG_INTERVAL_MS", "100")) / 1000,
+            threshold_seconds=float(os.getenv("HYPERION_LOOP_LAG_THRESHOLD_MS", "250")) / 1000,
+        )
+        _registry.callback_gauge(
+            "hyperion_event_loop_lag_window_seconds",
+            "Event loop lag percentiles over the recent sample window",
+            lambda: {(q,): lag for q, lag in _watchdog_instance._window_quantiles().items()},
+            ("quantile",),
+        )
+
+    return _watchdog_instance
+
+
+async def start_loop_watchdog() -> None:
+    """Start the watchdog unless HYPERION_LOOP_WATCHDOG=0"""
+    if os.getenv("HYPERION_LOOP_WATCHDOG", "1") != "0":
+        await get_loop_watchdog().start()
@@ -0,0 +1,441 @@
+"""
+PROJECT HYPERION - PROMETHEUS METRICS
+=====================================
+
+Purpose: /metrics for every FastAPI app in the Prometheus text format
+         (version 0.0.4), without a client library dependency.
+
+Families:
+- hyperion_http_request_duration_seconds{method,route,status}
+- hyperion_http_requests_in_flight
+- hyperion_agent_stage_duration_seconds{agent,stage,outcome}
+- hyperion_pipeline_duration_seconds{trigger}
+- hyperion_outbound_request_duration_seconds{provider,outcome}
+- hyperion_outbound_errors_total{provider,kind}
+- hyperion_cache_requests_total{cache,result} and hyperion_cache_hit_ratio{cache}
+- hyperion_signatures_total{signer} and hyperion_signing_duration_seconds{signer}
+- hyperion_active_monitors, hyperion_sse_streams{state}, ... (scrape-time gauges)
+
+Hot path cost: a tuple-keyed dict lookup plus a bisect per observation.
+There are no locks; updates run on the event loop or, rarely, worker
+threads, where a racing increment may be lost, which is acceptable for
+monitoring. Values owned by services (stream counts, cache counters) are
+read at scrape time through callbacks instead of being mirrored per event.
+"""
+
+import time
+import logging
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric(ABC):
+    """
+    One metric family
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Exposition lines (HELP, TYPE and samples)"""
+
+
+class LabelledMetric(Metric):
+    """
+    Metric whose children are created per label-value tuple
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Fresh child for a label-value tuple seen for the first time"""
+
+    def labels(self, *values: str) -> Any:
+        """Child for these label values (positional, in labelnames order)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in list(self._children.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}")
+        return lines
+
+
+class Counter(LabelledMetric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+
+class Gauge(LabelledMetric):
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+
+class Histogram(LabelledMetric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), list(child.counts)):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+CallbackValue = Union[float, Dict[Tuple[str, ...], float], None]
+
+
+class CallbackGauge(Metric):
+    """
+    Gauge evaluated at scrape time (for values a service already tracks);
+    kind="counter" exposes a service's own monotonic counter
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], CallbackValue],
+        labelnames: Iterable[str] = (),
+        kind: str = "gauge"
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+        self.kind = kind
+
+    def render(self) -> List[str]:
+        try:
+            value = self.callback()
+        except Exception as e:
+            logger.debug(f"Metric callback {self.name} failed: {e}")
+            return []
+        if value is None:
+            return []
+
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        samples = value.items() if isinstance(value, dict) else [((), value)]
+        for values, sample in samples:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(sample)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named metric families rendered together for /metrics
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics.setdefault(name, cls(name, *args, **kwargs))
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} already registered as {metric.kind}")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def callback_gauge(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], CallbackValue],
+        labelnames: Iterable[str] = (),
+        kind: str = "gauge"
+    ) -> CallbackGauge:
+        """Register (or replace) a metric read at scrape time"""
+        metric = CallbackGauge(name, documentation, callback, labelnames, kind)
+        self._metrics[name] = metric
+        return metric
+
+    def render(self) -> str:
+        """All families in the Prometheus text exposition format"""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Singleton registry shared by every module of an app
+_registry_instance = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the app-wide MetricsRegistry
+
+    Returns:
+        MetricsRegistry: The process registry
+    """
+    return _registry_instance
+
+
+# ----------------------------------------------------------------------
+# Standard families and cheap recording helpers
+# ----------------------------------------------------------------------
+
+HTTP_REQUEST_DURATION = _registry_instance.histogram(
+    "hyperion_http_request_duration_seconds",
+    "HTTP request latency by route template (streams: until the last byte)",
+    ("method", "route", "status"),
+)
+HTTP_IN_FLIGHT = _registry_instance.gauge(
+    "hyperion_http_requests_in_flight", "HTTP requests currently being served"
+)
+AGENT_STAGE_DURATION = _registry_instance.histogram(
+    "hyperion_agent_stage_duration_seconds",
+    "Duration of one agent stage (Meteorologist, Auditor, Arbiter, oracle client)",
+    ("agent", "stage", "outcome"),
+)
+PIPELINE_DURATION = _registry_instance.histogram(
+    "hyperion_pipeline_duration_seconds",
+    "End-to-end oracle pipeline duration",
+    ("trigger",),
+)
+OUTBOUND_DURATION = _registry_instance.histogram(
+    "hyperion_outbound_request_duration_seconds",
+    "Latency of calls to external providers",
+    ("provider", "outcome"),
+)
+OUTBOUND_ERRORS = _registry_instance.counter(
+    "hyperion_outbound_errors_total",
+    "Failed calls to external providers by error type",
+    ("provider", "kind"),
+)
+CACHE_REQUESTS = _registry_instance.counter(
+    "hyperion_cache_requests_total",
+    "Cache lookups by result (hit or miss)",
+    ("cache", "result"),
+)
+SIGNATURES = _registry_instance.counter(
+    "hyperion_signatures_total", "Oracle messages signed", ("signer",)
+)
+SIGNING_DURATION = _registry_instance.histogram(
+    "hyperion_signing_duration_seconds",
+    "Time to build, sign and self-verify one oracle message",
+    ("signer",),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.1),
+)
+
+
+def observe_stage(agent: str, stage: str, seconds: float, ok: bool = True) -> None:
+    """Record one agent stage"""
+    AGENT_STAGE_DURATION.labels(agent, stage, "ok" if ok else "error").observe(seconds)
+
+
+def observe_outbound(
+    provider: str,
+    seconds: Optional[float],
+    error: Union[BaseException, str, None] = None
+) -> None:
+    """
+    Record one provider call
+
+    Args:
+        provider: Provider name ("openweathermap", "gemini/<model>", ...)
+        seconds: Call latency (None if unknown)
+        error: Exception (or error kind) the call failed with
+    """
+    if seconds is not None:
+        OUTBOUND_DURATION.labels(provider, "ok" if error is None else "error").observe(seconds)
+    if error is not None:
+        kind = error if isinstance(error, str) else type(error).__name__
+        OUTBOUND_ERRORS.labels(provider, kind).inc()
+
+
+def observe_signature(signer: str, seconds: float) -> None:
+    """Record one signed oracle message"""
+    SIGNATURES.labels(signer).inc()
+    SIGNING_DURATION.labels(signer).observe(seconds)
+
+
+def count_cache(cache: str, hit: bool) -> None:
+    """Record one cache lookup"""
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def _cache_hit_ratios() -> Dict[Tuple[str, ...], float]:
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), child in list(CACHE_REQUESTS._children.items()):
+        entry = totals.setdefault(cache, [0.0, 0.0])
+        entry[0 if result == "hit" else 1] += child.value
+    return {(cache,): hits / (hits + misses) for cache, (hits, misses) in totals.items() if hits + misses}
+
+
+_registry_instance.callback_gauge(
+    "hyperion_cache_hit_ratio", "Cache hits / lookups since start", _cache_hit_ratios, ("cache",)
+)
+
+
+def route_template(scope: Dict[str, Any]) -> str:
+    """
+    Route template of a handled request ("/api/v1/forensics/archive/{policy_id}")
+
+    Routes of included routers may only know their own path, so the router
+    prefix is taken from the leading segments of the request path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if not template:
+        return "unmatched"
+
+    path_segments = scope["path"].rstrip("/").split("/")
+    template_segments = template.rstrip("/").split("/")
+    prefix_length = len(path_segments) - len(template_segments)
+    if prefix_length <= 0:
+        return template
+    return "/".join(path_segments[:prefix_length + 1]) + template
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route latency (route template, not raw path)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.labels().inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.labels().dec()
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"], route_template(scope), str(status[0])
+            ).observe(time.perf_counter() - start)
@@ -0,0 +1,355 @@
+"""
+PROJECT HYPERION - ON-DEMAND PROFILING
+======================================
+
+Purpose: Profile a live process without redeploying.
+
+- Sampling profiler: a thread samples the event loop thread every few ms
+  and aggregates stacks in the folded format ("a;b;c 42") read by
+  flamegraph.pl, speedscope and inferno
+  * one request: send X-Debug-Profile: 1 with a valid X-Debug-Token; only
+    samples taken while that request's task runs (or awaits, shown as an
+    "[awaiting X]" leaf under its await chain) are counted, so concurrent
+    requests do not pollute it. The response carries X-Profile-Id
+  * a time window: POST /debug/profile?seconds=N samples everything
+- Memory: tracemalloc snapshots on demand, each diffed against the previous
+  one, to find growth in long-running monitor processes. Tracing only runs
+  between the first snapshot and DELETE /debug/memory
+
+Profiles are kept in memory (last HYPERION_PROFILE_KEEP, default 20) and
+served by /debug/profiles/{id}. Nothing runs unless HYPERION_DEBUG_TOKEN is
+set and a caller asks for it.
+"""
+
+import os
+import sys
+import time
+import uuid
+import asyncio
+import logging
+import secrets
+import threading
+import tracemalloc
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_PROFILE_SECONDS = 60.0
+
+
+def debug_token_valid(presented: Optional[str]) -> bool:
+    """Whether `presented` matches HYPERION_DEBUG_TOKEN (never, if unset)"""
+    token = os.getenv("HYPERION_DEBUG_TOKEN")
+    return bool(token and presented and secrets.compare_digest(presented, token))
+
+
+def _frame_label(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+def _thread_stack(frame) -> List[str]:
+    stack = []
+    while frame is not None:
+        stack.append(_frame_label(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _await_stack(task: asyncio.Task) -> List[str]:
+    """Await chain of a suspended task, outermost coroutine first"""
+    stack = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None) \
+            or getattr(awaitable, "ag_frame", None)
+        if frame is None:
+            break
+        stack.append(_frame_label(frame))
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None) \
+            or getattr(awaitable, "ag_await", None)
+    waiter = getattr(task, "_fut_waiter", None)
+    stack.append(f"[awaiting {type(waiter).__name__ if waiter is not None else 'scheduling'}]")
+    return stack
+
+
+class StackSampler:
+    """
+    Samples one thread's stack on an interval (optionally only for one task)
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        interval_seconds: float = 0.005,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        task: Optional[asyncio.Task] = None
+    ):
+        """
+        Args:
+            thread_id: Thread to sample (the event loop thread)
+            interval_seconds: Sampling period
+            loop: Loop of `task`
+            task: Only count samples belonging to this task
+        """
+        self.thread_id = thread_id
+        self.interval_seconds = interval_seconds
+        self.loop = loop
+        self.task = task
+        self.samples: Counter = Counter()
+        self.started_at = time.time()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _sample(self) -> Optional[List[str]]:
+        if self.task is None:
+            frame = sys._current_frames().get(self.thread_id)
+            return _thread_stack(frame) if frame is not None else None
+        if self.task.done():
+            return None
+        try:
+            running = asyncio.current_task(self.loop) is self.task
+        except RuntimeError:
+            running = False
+        if running:
+            frame = sys._current_frames().get(self.thread_id)
+            return _thread_stack(frame) if frame is not None else None
+        return _await_stack(self.task)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                stack = self._sample()
+            except Exception:
+                continue
+            if stack:
+                self.samples[";".join(stack)] += 1
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop sampling and build the profile record"""
+        self._stop.set()
+        self._thread.join(timeout=1)
+        return {
+            "id": uuid.uuid4().hex[:12],
+            "started_at": self.started_at,
+            "duration_ms": round((time.time() - self.started_at) * 1000, 1),
+            "interval_ms": self.interval_seconds * 1000,
+            "samples": sum(self.samples.values()),
+            "folded": "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common()) + "\n",
+        }
+
+
+class ProfileStore:
+    """
+    Last N profiles in memory
+    """
+
+    def __init__(self, keep: int = 20):
+        self._profiles: Deque[Dict[str, Any]] = deque(maxlen=max(1, keep))
+
+    def add(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        self._profiles.append(profile)
+        logger.info(
+            f"Stored profile {profile['id']} ({profile.get('target')}, "
+            f"{profile['samples']} samples, {profile['duration_ms']:.0f}ms)"
+        )
+        return profile
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        for profile in self._profiles:
+            if profile["id"] == profile_id:
+                return profile
+        return None
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Profile metadata, newest first"""
+        return [
+            {key: value for key, value in profile.items() if key != "folded"}
+            for profile in reversed(self._profiles)
+        ]
+
+
+async def profile_window(seconds: float, interval_seconds: float = 0.005) -> Dict[str, Any]:
+    """
+    Sample the event loop thread for a time window and store the profile
+
+    Args:
+        seconds: Window length (capped at MAX_PROFILE_SECONDS)
+        interval_seconds: Sampling period
+
+    Returns:
+        Dict[str, Any]: Stored profile (with folded stacks)
+    """
+    seconds = min(max(seconds, 0.1), MAX_PROFILE_SECONDS)
+    sampler = StackSampler(threading.get_ident(), interval_seconds).start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profile = sampler.stop()
+    profile["target"] = f"window {seconds:g}s"
+    return get_profile_store().add(profile)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles single requests sent with X-Debug-Profile: 1 and a valid
+    X-Debug-Token; adds X-Profile-Id to the response
+    """
+
+    def __init__(self, app, interval_seconds: float = 0.002):
+        self.app = app
+        self.interval_seconds = interval_seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        if headers.get(b"x-debug-profile") != b"1" or \
+                not debug_token_valid(headers.get(b"x-debug-token", b"").decode("latin-1")):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = StackSampler(
+            threading.get_ident(), self.interval_seconds,
+            loop=asyncio.get_running_loop(), task=asyncio.current_task(),
+        )
+        profile_id = uuid.uuid4().hex[:12]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", profile_id.encode())
+                ]
+            await send(message)
+
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile = sampler.stop()
+            profile["id"] = profile_id
+            profile["target"] = f"{scope['method']} {scope['path']}"
+            get_profile_store().add(profile)
+
+
+class MemoryTracker:
+    """
+    tracemalloc snapshots, each diffed against the previous one
+
+    Snapshots are slow (every traced block is walked) and are taken off the
+    event loop; the lock keeps concurrent calls from racing on the baseline.
+    """
+
+    def __init__(self, frames: int = 10):
+        self.frames = frames
+        self.snapshots = 0
+        self._lock = threading.Lock()
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._previous_at: Optional[float] = None
+
+    def snapshot(self, top: int = 25) -> Dict[str, Any]:
+        """
+        Take a snapshot (starting tracemalloc on first use)
+
+        Args:
+            top: Locations reported
+
+        Returns:
+            Dict[str, Any]: Traced totals and the top growth since the previous
+            snapshot (top allocations for the first one)
+        """
+        with self._lock:
+            return self._snapshot(top)
+
+    def _snapshot(self, top: int) -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._previous = None
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        now = time.time()
+
+        if self._previous is None:
+            stats = snapshot.statistics("lineno")[:top]
+            top_entries = [
+                {"location": str(stat.traceback[0]), "size_kb": round(stat.size / 1024, 1), "count": stat.count}
+                for stat in stats
+            ]
+            since = None
+        else:
+            stats = snapshot.compare_to(self._previous, "lineno")[:top]
+            top_entries = [
+                {
+                    "location": str(stat.traceback[0]),
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "size_kb": round(stat.size / 1024, 1),
+                    "count_diff": stat.count_diff,
+                }
+                for stat in stats
+            ]
+            since = round(now - self._previous_at, 1)
+
+        self._previous = snapshot
+        self._previous_at = now
+        self.snapshots += 1
+        return {
+            "snapshot": self.snapshots,
+            "traced_kb": round(current / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "seconds_since_previous": since,
+            "top": top_entries,
+        }
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop tracing and drop the stored snapshot"""
+        with self._lock:
+            was_tracing = tracemalloc.is_tracing()
+            tracemalloc.stop()
+            self._previous = None
+            self._previous_at = None
+        return {"tracing": False, "was_tracing": was_tracing, "snapshots": self.snapshots}
+
+
+# Singleton instances
+_store_instance: Optional[ProfileStore] = None
+_memory_instance: Optional[MemoryTracker] = None
+
+
+def get_profile_store() -> ProfileStore:
+    """
+    Get or create the singleton ProfileStore
+
+    Returns:
+        ProfileStore: Keeps HYPERION_PROFILE_KEEP profiles
+    """
+    global _store_instance
+
+    if _store_instance is None:
+        _store_instance = ProfileStore(keep=int(os.getenv("HYPERION_PROFILE_KEEP", "20")))
+
+    return _store_instance
+
+
+def get_memory_tracker() -> MemoryTracker:
+    """
+    Get or create the singleton MemoryTracker
+
+    Returns:
+        MemoryTracker: Shared tracemalloc helper
+    """
+    global _memory_instance
+
+    if _memory_instance is None:
+        _memory_instance = MemoryTracker()
+
+    return _memory_instance
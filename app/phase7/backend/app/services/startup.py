@@ -0,0 +1,226 @@
+"""
+PROJECT HYPERION - LAZY STARTUP & WARM-UP
+=========================================
+
+Purpose: Keep worker cold start cheap. Heavy SDKs (pycardano, the Gemini SDK,
+         PyNaCl) are imported where they are first used rather than when the
+         app module loads, and can be warmed in the background once the
+         server is accepting connections.
+
+Modes (HYPERION_STARTUP_MODE):
+- "lazy" (default): nothing heavy is imported at startup. With
+  HYPERION_WARMUP=1 the app's heavy modules are imported on a worker thread
+  HYPERION_WARMUP_DELAY seconds after startup, i.e. once uvicorn has bound
+  its socket, so the first request does not pay for them
+- "eager": heavy modules are imported during startup, before the app
+  reports ready (the old behaviour: slower start, flat first request)
+
+HYPERION_WARMUP_MODULES (comma separated) overrides the app's module list.
+
+Import profiler:
+
+    python -m app.services.startup app.main --top 25
+
+runs `python -X importtime` in a fresh interpreter and prints the self and
+cumulative import cost of each module.
+"""
+
+import os
+import re
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import importlib
+import subprocess
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STARTUP_MODE_LAZY = "lazy"
+STARTUP_MODE_EAGER = "eager"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def startup_mode() -> str:
+    """Configured startup mode (lazy unless HYPERION_STARTUP_MODE=eager)"""
+    mode = os.getenv("HYPERION_STARTUP_MODE", STARTUP_MODE_LAZY).strip().lower()
+    return STARTUP_MODE_EAGER if mode == STARTUP_MODE_EAGER else STARTUP_MODE_LAZY
+
+
+def import_modules(modules: List[str]) -> Dict[str, Optional[float]]:
+    """
+    Import modules one by one and time them
+
+    Args:
+        modules: Dotted module names
+
+    Returns:
+        Dict[str, Optional[float]]: Import time in ms per module (None if the
+        module is not installed)
+    """
+    timings: Dict[str, Optional[float]] = {}
+    for name in modules:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.info(f"Warm-up skipped {name}: {e}")
+            timings[name] = None
+            continue
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
+
+
+class ModuleWarmer:
+    """
+    Imports an app's heavy modules at startup (eager) or in the background
+    after startup (lazy + HYPERION_WARMUP=1)
+    """
+
+    def __init__(
+        self,
+        modules: List[str],
+        mode: str = STARTUP_MODE_LAZY,
+        background: bool = False,
+        delay_seconds: float = 1.0
+    ):
+        """
+        Args:
+            modules: Heavy modules of the app
+            mode: "lazy" or "eager"
+            background: Warm lazily-loaded modules after startup
+            delay_seconds: Wait before background warm-up starts
+        """
+        self.modules = modules
+        self.mode = mode
+        self.background = background
+        self.delay_seconds = delay_seconds
+        self.state = "idle"
+        self.timings: Dict[str, Optional[float]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def _warm(self) -> None:
+        self.state = "running"
+        start = time.perf_counter()
+        self.timings = await asyncio.to_thread(import_modules, self.modules)
+        self.state = "done"
+        logger.info(
+            f"Warmed {len(self.modules)} modules in {(time.perf_counter() - start) * 1000:.0f}ms: "
+            f"{self.timings}"
+        )
+
+    async def _warm_later(self) -> None:
+        await asyncio.sleep(self.delay_seconds)
+        try:
+            await self._warm()
+        except Exception as e:
+            self.state = "failed"
+            logger.warning(f"Background warm-up failed: {e}")
+
+    async def start(self) -> None:
+        """Run from the app's startup hook"""
+        if self.mode == STARTUP_MODE_EAGER:
+            await self._warm()
+        elif self.background and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._warm_later())
+
+    async def stop(self) -> None:
+        """Run from the app's shutdown hook"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        """Mode, warm-up state and per-module import times"""
+        return {
+            "mode": self.mode,
+            "background_warmup": self.background,
+            "state": self.state,
+            "modules_ms": self.timings,
+        }
+
+
+def create_module_warmer(default_modules: List[str]) -> ModuleWarmer:
+    """
+    Build a ModuleWarmer from HYPERION_STARTUP_MODE / HYPERION_WARMUP* settings
+
+    Args:
+        default_modules: The app's heavy modules (HYPERION_WARMUP_MODULES overrides)
+
+    Returns:
+        ModuleWarmer: Configured warmer
+    """
+    override = os.getenv("HYPERION_WARMUP_MODULES")
+    modules = [m.strip() for m in override.split(",") if m.strip()] if override else list(default_modules)
+    return ModuleWarmer(
+        modules,
+        mode=startup_mode(),
+        background=os.getenv("HYPERION_WARMUP", "0") == "1",
+        delay_seconds=float(os.getenv("HYPERION_WARMUP_DELAY", "1")),
+    )
+
+
+def profile_imports(target: str, cwd: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Measure the import cost of every module pulled in by `import target`
+
+    Args:
+        target: Module to import (e.g. "app.main")
+        cwd: Directory to run the fresh interpreter in (defaults to the current one)
+
+    Returns:
+        List[Dict[str, Any]]: One entry per module (name, depth, self_ms,
+        cumulative_ms), in import order
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append({
+            "module": name,
+            "depth": (len(indent) - 1) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-module import cost of an app")
+    parser.add_argument("target", nargs="?", default="app.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=20, help="Modules to show")
+    parser.add_argument("--depth", type=int, help="Only show modules up to this nesting depth")
+    args = parser.parse_args()
+
+    entries = profile_imports(args.target)
+    if args.depth is not None:
+        entries = [e for e in entries if e["depth"] <= args.depth]
+    total = max((e["cumulative_ms"] for e in entries if e["module"] == args.target), default=0.0)
+
+    print(f"import {args.target}: {total:.1f}ms total")
+    print(f"{'cumulative ms':>14} {'self ms':>10}  module")
+    for entry in sorted(entries, key=lambda e: e["cumulative_ms"], reverse=True)[:args.top]:
+        print(
+            f"{entry['cumulative_ms']:>14.1f} {entry['self_ms']:>10.1f}  "
+            f"{'  ' * entry['depth']}{entry['module']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
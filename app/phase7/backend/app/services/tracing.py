@@ -0,0 +1,442 @@
+"""
+PROJECT HYPERION - LIGHTWEIGHT TRACING
+======================================
+
+Purpose: One trace per request or monitor poll across Meteorologist →
+         Auditor → Arbiter → signer → chain submission, without an
+         OpenTelemetry SDK dependency.
+
+- Spans are propagated through a context variable, so nested calls and
+  tasks created inside a span join its trace
+- TracingMiddleware starts the root span of a request. It honours an
+  incoming W3C `traceparent` and answers with `traceparent` and
+  `X-Trace-Id` headers
+- TracingTransport wraps httpx calls in CLIENT spans and forwards
+  `traceparent` to the provider
+- @traced / span() mark agent methods and signing/submission steps
+
+Finished traces are exported in the OTLP/JSON layout (resourceSpans →
+scopeSpans → spans) to an in-process collector (GET /debug/traces) and,
+with HYPERION_TRACE_FILE set, appended as one JSON line per trace by a
+writer thread (the OpenTelemetry Collector's file exporter format).
+
+HYPERION_TRACE_SAMPLE_RATE (default 0) is the share of new traces
+recorded. When a trace is not sampled, span() and @traced cost one
+context-variable read.
+"""
+
+import os
+import json
+import time
+import queue
+import random
+import asyncio
+import logging
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Deque, Dict, Iterator, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("hyperion_current_span", default=None)
+
+
+class Span:
+    """
+    One timed operation of a trace
+    """
+
+    __slots__ = (
+        "trace", "name", "span_id", "parent_id", "kind",
+        "start_ns", "end_ns", "attributes", "status", "status_message",
+    )
+
+    def __init__(self, trace: "_Trace", name: str, parent_id: Optional[str], kind: int, attributes: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.status = STATUS_UNSET
+        self.status_message: Optional[str] = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = str(error) or type(error).__name__
+        self.attributes["exception.type"] = type(error).__name__
+
+    def traceparent(self) -> str:
+        """W3C trace context header value of this span"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class _Trace:
+    """Spans of one trace in this process, exported when the local root ends"""
+
+    __slots__ = ("trace_id", "spans", "exported")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: List[Span] = []
+        self.exported = False
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parse a W3C traceparent header ("00-<trace>-<parent>-<flags>")"""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        sampled = bool(int(parts[3], 16) & 1)
+        int(parts[1], 16), int(parts[2], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32:
+        return None
+    return {"trace_id": parts[1], "parent_id": parts[2], "sampled": sampled}
+
+
+class Tracer:
+    """
+    Sampling decision, span lifecycle and export
+    """
+
+    def __init__(self, service: str, sample_rate: float = 0.0, keep: int = 200, path: Optional[str] = None):
+        """
+        Args:
+            service: service.name resource attribute
+            sample_rate: Share of new traces recorded (0 disables tracing)
+            keep: Traces kept by the in-process collector
+            path: File that finished traces are appended to (OTLP/JSON lines)
+        """
+        self.service = service
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+        self.path = path
+        self.exported = 0
+        self._traces: Deque[Dict[str, Any]] = deque(maxlen=max(1, keep))
+        self._file_queue: Optional["queue.SimpleQueue[str]"] = None
+
+    def should_sample(self) -> bool:
+        return self.sample_rate > 0 and (self.sample_rate >= 1.0 or random.random() < self.sample_rate)
+
+    @contextmanager
+    def start_trace(
+        self,
+        name: str,
+        kind: int = SPAN_KIND_INTERNAL,
+        traceparent: Optional[str] = None,
+        **attributes: Any
+    ) -> Iterator[Optional[Span]]:
+        """
+        Start the local root span of a trace (None when not sampled)
+
+        Args:
+            name: Root span name
+            kind: SPAN_KIND_*
+            traceparent: Incoming W3C header; its sampled flag wins
+            attributes: Span attributes
+        """
+        parent = parse_traceparent(traceparent)
+        sampled = parent["sampled"] if parent else self.should_sample()
+        if not sampled:
+            yield None
+            return
+
+        trace = _Trace(parent["trace_id"] if parent else f"{random.getrandbits(128):032x}")
+        try:
+            with self._span(trace, name, parent["parent_id"] if parent else None, kind, attributes) as root:
+                yield root
+        finally:
+            trace.exported = True
+            self._export(trace.trace_id, trace.spans)
+            trace.spans = []
+
+    @contextmanager
+    def _span(
+        self,
+        trace: _Trace,
+        name: str,
+        parent_id: Optional[str],
+        kind: int,
+        attributes: Dict[str, Any]
+    ) -> Iterator[Span]:
+        span = Span(trace, name, parent_id, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            if not isinstance(e, (asyncio.CancelledError, GeneratorExit)):
+                span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            if trace.exported:
+                # Ended after its local root (a background task): export alone
+                self._export(trace.trace_id, [span])
+            else:
+                trace.spans.append(span)
+
+    def _export(self, trace_id: str, spans: List[Span]) -> None:
+        if not spans:
+            return
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service)]},
+                "scopeSpans": [{
+                    "scope": {"name": "hyperion"},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }]
+        }
+        root = min(spans, key=lambda s: s.start_ns)
+        self._traces.append({
+            "trace_id": trace_id,
+            "name": root.name,
+            "start_ns": root.start_ns,
+            "duration_ms": round(((root.end_ns or root.start_ns) - root.start_ns) / 1e6, 2),
+            "spans": len(spans),
+            "error": any(span.status == STATUS_ERROR for span in spans),
+            "otlp": payload,
+        })
+        self.exported += 1
+        if self.path:
+            self._write(json.dumps(payload, separators=(",", ":")))
+
+    def _write(self, line: str) -> None:
+        if self._file_queue is None:
+            self._file_queue = queue.SimpleQueue()
+            threading.Thread(target=self._writer, name="trace-writer", daemon=True).start()
+        self._file_queue.put(line)
+
+    def _writer(self) -> None:
+        while True:
+            line = self._file_queue.get()
+            try:
+                with open(self.path, "a") as output:
+                    output.write(line + "\n")
+            except OSError as e:
+                logger.warning(f"Trace export to {self.path} failed: {e}")
+
+    def traces(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Recent traces (summary only), newest first"""
+        return [
+            {key: value for key, value in trace.items() if key != "otlp"}
+            for trace in list(reversed(self._traces))[:limit]
+        ]
+
+    def trace(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """Every exported batch of a trace, merged into one OTLP/JSON document"""
+        spans = [
+            span
+            for trace in self._traces if trace["trace_id"] == trace_id
+            for span in trace["otlp"]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        ]
+        if not spans:
+            return None
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service)]},
+                "scopeSpans": [{"scope": {"name": "hyperion"}, "spans": spans}],
+            }]
+        }
+
+
+def current_span() -> Optional[Span]:
+    """Span of the running context (None when not tracing)"""
+    return _current_span.get()
+
+
+_NO_SPAN = nullcontext()
+
+
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> ContextManager[Optional[Span]]:
+    """
+    Child span of the running span; a shared no-op outside a sampled trace
+
+    Args:
+        name: Span name ("agent.meteorologist.fetch_weather", "cardano.sign", ...)
+        kind: SPAN_KIND_*
+        attributes: Span attributes
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return _NO_SPAN
+    return get_tracer()._span(parent.trace, name, parent.span_id, kind, attributes)
+
+
+def traced(name: str, **attributes: Any) -> Callable:
+    """Decorator: run a sync or async function inside span(name)"""
+
+    def decorate(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with span(name, **attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with span(name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport wrapper: CLIENT span per request, traceparent forwarded
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None, **transport_kwargs: Any):
+        self._transport = transport or httpx.AsyncHTTPTransport(**transport_kwargs)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if _current_span.get() is None:
+            return await self._transport.handle_async_request(request)
+        with span(
+            f"HTTP {request.method}",
+            kind=SPAN_KIND_CLIENT,
+            **{"http.method": request.method, "server.address": request.url.host},
+        ) as client_span:
+            request.headers["traceparent"] = client_span.traceparent()
+            response = await self._transport.handle_async_request(request)
+            client_span.set_attribute("http.status_code", response.status_code)
+            if response.status_code >= 500:
+                client_span.status = STATUS_ERROR
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware: root SERVER span per request, trace headers on responses
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tracer = get_tracer()
+        incoming = None
+        for key, value in scope.get("headers") or []:
+            if key == b"traceparent":
+                incoming = value.decode("latin-1")
+                break
+        if incoming is None and tracer.sample_rate <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        with tracer.start_trace(
+            f"{scope['method']} {scope['path']}",
+            kind=SPAN_KIND_SERVER,
+            traceparent=incoming,
+            **{"http.method": scope["method"], "url.path": scope["path"]},
+        ) as root:
+            if root is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    root.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        root.status = STATUS_ERROR
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"traceparent", root.traceparent().encode()),
+                        (b"x-trace-id", root.trace_id.encode()),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+# Singleton instance
+_tracer_instance: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """
+    Get or create the singleton Tracer
+
+    Returns:
+        Tracer: Configured from HYPERION_TRACE_SAMPLE_RATE / HYPERION_TRACE_FILE /
+        HYPERION_TRACE_KEEP / HYPERION_SERVICE_NAME
+    """
+    global _tracer_instance
+
+    if _tracer_instance is None:
+        _tracer_instance = Tracer(
+            service=os.getenv("HYPERION_SERVICE_NAME", "hyperion"),
+            sample_rate=float(os.getenv("HYPERION_TRACE_SAMPLE_RATE", "0")),
+            keep=int(os.getenv("HYPERION_TRACE_KEEP", "200")),
+            path=os.getenv("HYPERION_TRACE_FILE") or None,
+        )
+
+    return _tracer_instance
@@ -3,51 +3,99 @@ Project Hyperion - Phase 3: Oracle Client
 Real-time weather monitoring and oracle trigger submission
 """
 
+import os
 import asyncio
+import logging
 import time
 import cbor2
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 from nacl.signing import SigningKey, VerifyKey
 
-try:
-    from pycardano import (
-        BlockFrostChainContext,
-        Network,
-        TransactionBuilder,
-        TransactionOutput,
-        UTxO,
-        PlutusData,
-        plutus_script_hash,
-    )
-except ImportError:
-    # Graceful degradation if pycardano not installed yet
-    BlockFrostChainContext = None
-    print("⚠️  pycardano not installed - install with: pip install pycardano")
+from app.services.metrics import observe_outbound, observe_signature, observe_stage
+from app.services.tracing import SPAN_KIND_CLIENT, get_tracer, span, traced
+from app.services.trigger_slo import (
+    OUTCOME_CONFIRMED,
+    OUTCOME_FAILED,
+    OUTCOME_UNCONFIRMED,
+    TriggerTimeline,
+    get_trigger_slo,
+)
 
+logger = logging.getLogger(__name__)
 
-class Phase3OracleDatum(PlutusData if PlutusData else object):
-    """Phase 3 Oracle Datum structure - matches on-chain definition"""
-    
-    CONSTR_ID = 0
-    
-    oracle_vk: bytes          # Ed25519 public key (32 bytes)
-    threshold_wind_speed: int # Threshold in m/s × 100
-    max_age_ms: int           # Maximum data age (milliseconds)
-    last_nonce: int           # Replay protection counter
-    location_id: bytes        # Geographic binding
+# pycardano costs ~2s of import time, so it is loaded on first client
+# construction instead of when the API router is imported
+_pycardano: Optional[Dict[str, Any]] = None
 
 
-class Phase3OracleRedeemer(PlutusData if PlutusData else object):
-    """Phase 3 Oracle Redeemer structure - matches on-chain definition"""
-    
-    CONSTR_ID = 0
-    
-    wind_speed: int           # Measured wind speed (m/s × 100)
-    measurement_time: int     # POSIX timestamp (milliseconds)
-    nonce: int                # Unique nonce
-    policy_id: bytes          # Insurance policy identifier (28 bytes)
-    location_id: bytes        # Must match datum location_id
-    signature: bytes          # Ed25519 signature (64 bytes)
+def load_pycardano() -> Optional[Dict[str, Any]]:
+    """
+    Import pycardano and build the Plutus datum/redeemer types (once)
+
+    Returns:
+        Dict of pycardano names plus Phase3OracleDatum / Phase3OracleRedeemer,
+        or None if pycardano is not installed
+    """
+    global _pycardano
+
+    if _pycardano is not None:
+        return _pycardano or None
+
+    try:
+        from pycardano import (
+            BlockFrostChainContext,
+            Network,
+            TransactionBuilder,
+            TransactionOutput,
+            PlutusData,
+        )
+    except ImportError:
+        # Graceful degradation if pycardano not installed yet
+        logger.warning("pycardano not installed - install with: pip install pycardano")
+        _pycardano = {}
+        return None
+
+    class Phase3OracleDatum(PlutusData):
+        """Phase 3 Oracle Datum structure - matches on-chain definition"""
+
+        CONSTR_ID = 0
+
+        oracle_vk: bytes          # Ed25519 public key (32 bytes)
+        threshold_wind_speed: int # Threshold in m/s × 100
+        max_age_ms: int           # Maximum data age (milliseconds)
+        last_nonce: int           # Replay protection counter
+        location_id: bytes        # Geographic binding
+
+    class Phase3OracleRedeemer(PlutusData):
+        """Phase 3 Oracle Redeemer structure - matches on-chain definition"""
+
+        CONSTR_ID = 0
+
+        wind_speed: int           # Measured wind speed (m/s × 100)
+        measurement_time: int     # POSIX timestamp (milliseconds)
+        nonce: int                # Unique nonce
+        policy_id: bytes          # Insurance policy identifier (28 bytes)
+        location_id: bytes        # Must match datum location_id
+        signature: bytes          # Ed25519 signature (64 bytes)
+
+    _pycardano = {
+        "BlockFrostChainContext": BlockFrostChainContext,
+        "Network": Network,
+        "TransactionBuilder": TransactionBuilder,
+        "TransactionOutput": TransactionOutput,
+        "Phase3OracleDatum": Phase3OracleDatum,
+        "Phase3OracleRedeemer": Phase3OracleRedeemer,
+    }
+    return _pycardano
+
+
+def __getattr__(name: str) -> Any:
+    # Phase3OracleDatum / Phase3OracleRedeemer stay importable from this module
+    if name in ("Phase3OracleDatum", "Phase3OracleRedeemer"):
+        cardano = load_pycardano()
+        if cardano:
+            return cardano[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Phase3OracleClient:
@@ -56,7 +104,8 @@ class Phase3OracleClient:
     
     Features:
     - Ed25519 signature generation matching on-chain format
-    - Continuous weather monitoring with < 60s response time
+    - Continuous weather monitoring with < 60s response time, measured per
+      trigger from provider observation to confirmation (app/services/trigger_slo.py)
     - Automatic nonce management and replay protection
     - Transaction building with PyCardano integration
     """
@@ -77,16 +126,22 @@ class Phase3OracleClient:
         """
         self.oracle_sk = SigningKey(bytes.fromhex(oracle_sk_hex))
         self.oracle_vk = self.oracle_sk.verify_key
-        self.network = Network.TESTNET if network == "testnet" else Network.MAINNET
+        self.cardano = load_pycardano()
         
-        if BlockFrostChainContext:
-            self.context = BlockFrostChainContext(
+        if self.cardano:
+            Network = self.cardano["Network"]
+            self.network = Network.TESTNET if network == "testnet" else Network.MAINNET
+            self.context = self.cardano["BlockFrostChainContext"](
                 project_id=blockfrost_project_id,
                 network=self.network
             )
         else:
+            self.network = network
             self.context = None
-            print("⚠️  Running in offline mode - PyCardano not available")
+            logger.warning("Running in offline mode - PyCardano not available")
+        
+        # How long a monitor waits to see its trigger in a block
+        self.confirm_timeout = float(os.getenv("HYPERION_TRIGGER_CONFIRM_TIMEOUT", "180"))
     
     def build_canonical_message(
         self,
@@ -124,6 +179,7 @@ class Phase3OracleClient:
         msg += cbor2.dumps(nonce)
         return msg
     
+    @traced("cardano.sign")
     def sign_oracle_data(
         self,
         policy_id: bytes,
@@ -138,12 +194,15 @@ class Phase3OracleClient:
         Returns:
             64-byte signature
         """
+        start = time.perf_counter()
         message = self.build_canonical_message(
             policy_id, location_id, wind_speed, measurement_time, nonce
         )
         signed = self.oracle_sk.sign(message)
+        observe_signature("phase3_oracle", time.perf_counter() - start)
         return signed.signature  # Returns 64 bytes
     
+    @traced("oracle.trigger")
     async def trigger_oracle(
         self,
         oracle_utxo: "UTxO",
@@ -152,7 +211,8 @@ class Phase3OracleClient:
         wind_speed: int,
         measurement_time: int,
         payment_skey,
-        change_address
+        change_address,
+        timeline: Optional[TriggerTimeline] = None
     ) -> str:
         """
         Submit oracle trigger transaction
@@ -165,6 +225,7 @@ class Phase3OracleClient:
             measurement_time: POSIX timestamp in milliseconds
             payment_skey: Payment signing key for transaction fees
             change_address: Address to receive change
+            timeline: Trigger latency milestones (signed / submitted are marked)
             
         Returns:
             Transaction hash
@@ -172,6 +233,8 @@ class Phase3OracleClient:
         if not self.context:
             raise RuntimeError("PyCardano not available - cannot submit transaction")
         
+        Phase3OracleDatum = self.cardano["Phase3OracleDatum"]
+        
         # Get current nonce from datum
         datum = Phase3OracleDatum.from_cbor(oracle_utxo.output.datum.cbor)
         new_nonce = datum.last_nonce + 1
@@ -180,9 +243,11 @@ class Phase3OracleClient:
         signature = self.sign_oracle_data(
             policy_id, location_id, wind_speed, measurement_time, new_nonce
         )
+        if timeline:
+            timeline.mark("signed")
         
         # Build redeemer
-        redeemer = Phase3OracleRedeemer(
+        redeemer = self.cardano["Phase3OracleRedeemer"](
             wind_speed=wind_speed,
             measurement_time=measurement_time,
             nonce=new_nonce,
@@ -201,10 +266,10 @@ class Phase3OracleClient:
         )
         
         # Build transaction
-        builder = TransactionBuilder(self.context)
+        builder = self.cardano["TransactionBuilder"](self.context)
         builder.add_script_input(oracle_utxo, redeemer=redeemer)
         builder.add_output(
-            TransactionOutput(
+            self.cardano["TransactionOutput"](
                 address=oracle_utxo.output.address,
                 amount=oracle_utxo.output.amount,
                 datum=new_datum,
@@ -218,11 +283,59 @@ class Phase3OracleClient:
         
         # Sign and submit
         tx = builder.build_and_sign([payment_skey], change_address)
-        tx_hash = self.context.submit_tx(tx)
+        submit_start = time.perf_counter()
+        try:
+            with span("chain.submit_tx", kind=SPAN_KIND_CLIENT):
+                tx_hash = self.context.submit_tx(tx)
+        except Exception as e:
+            observe_outbound("blockfrost", time.perf_counter() - submit_start, e)
+            raise
+        observe_outbound("blockfrost", time.perf_counter() - submit_start)
+        if timeline:
+            timeline.mark("submitted")
+            timeline.tx_hash = str(tx_hash)
         
-        print(f"✅ Oracle triggered! Tx: {tx_hash}")
+        logger.info(f"✅ Oracle triggered! Tx: {tx_hash}", extra={"trigger": True, "tx_hash": str(tx_hash)})
         return tx_hash
     
+    @traced("chain.confirm")
+    async def wait_for_confirmation(
+        self,
+        tx_hash: str,
+        timeout: float,
+        poll_interval: float = 2.0
+    ) -> Optional[float]:
+        """
+        Poll BlockFrost until a submitted transaction is in a block
+        
+        Args:
+            tx_hash: Submitted transaction hash
+            timeout: Seconds to wait
+            poll_interval: Seconds between lookups
+            
+        Returns:
+            Block time (epoch seconds) of the confirmation, None on timeout
+        """
+        api = self.context.api
+        deadline = time.monotonic() + timeout
+        while True:
+            lookup_start = time.perf_counter()
+            try:
+                tx = await asyncio.to_thread(api.transaction, str(tx_hash))
+            except Exception as e:
+                # BlockFrost answers 404 until the transaction is in a block
+                if getattr(e, "status_code", None) != 404:
+                    observe_outbound("blockfrost", time.perf_counter() - lookup_start, e)
+                    logger.debug(f"Confirmation lookup for {tx_hash} failed: {e}")
+            else:
+                observe_outbound("blockfrost", time.perf_counter() - lookup_start)
+                return float(getattr(tx, "block_time", None) or time.time())
+            
+            if time.monotonic() + poll_interval > deadline:
+                return None
+            await asyncio.sleep(poll_interval)
+    
+    @traced("oracle.fetch_weather")
     async def fetch_weather_data(self, location_id: bytes) -> dict:
         """
         Fetch real-time weather data from external API
@@ -237,7 +350,9 @@ class Phase3OracleClient:
             location_id: Geographic location identifier
             
         Returns:
-            dict with 'wind_speed_ms' and 'timestamp'
+            dict with 'wind_speed_ms' and 'timestamp' (provider observation
+            time in ms, e.g. OpenWeatherMap `dt` × 1000; the trigger latency
+            SLO is measured from it)
         """
         # TODO: Replace with real API integration
         # Example: OpenWeatherMap API
@@ -264,6 +379,7 @@ class Phase3OracleClient:
         payment_skey,
         change_address,
         poll_interval: int = 30,
+        on_observation: Optional[Callable[[float, float, int], None]] = None,
     ):
         """
         Real-time monitoring loop with < 60 second response time
@@ -278,67 +394,132 @@ class Phase3OracleClient:
             payment_skey: Payment signing key for fees
             change_address: Change address
             poll_interval: Seconds between checks (default: 30s)
+            on_observation: Optional callback(wind_speed_ms, threshold_ms, timestamp_ms)
+                            invoked for every reading compared against the threshold
         """
-        print(f"🔍 Phase 3 Oracle Monitor Started")
-        print(f"   Location ID: {location_id.hex()}")
-        print(f"   Policy ID: {policy_id.hex()}")
-        print(f"   Poll interval: {poll_interval}s")
-        print(f"   Target: < 60s event-to-confirmation latency")
+        monitor_log = {"policy_id": policy_id.hex(), "location_id": location_id.hex()}
+        logger.info(
+            f"🔍 Phase 3 Oracle Monitor Started (location {location_id.hex()}, policy {policy_id.hex()}, "
+            f"poll {poll_interval}s, target < 60s event-to-confirmation)",
+            extra=monitor_log
+        )
         
         while True:
+            # One trace per poll (HYPERION_TRACE_SAMPLE_RATE): fetch → decision → sign → submit
+            with get_tracer().start_trace(
+                "oracle_monitor.poll",
+                **{"policy.id": monitor_log["policy_id"], "location.id": monitor_log["location_id"]}
+            ):
+                triggered = await self._monitor_poll(
+                    oracle_utxo_ref, policy_id, location_id, payment_skey, change_address,
+                    on_observation, monitor_log
+                )
+            
+            if triggered:
+                # Cooldown after trigger (5 minutes)
+                logger.info("⏳ Cooldown period: 5 minutes", extra={**monitor_log, "trigger": True})
+                await asyncio.sleep(300)
+            
+            await asyncio.sleep(poll_interval)
+    
+    async def _monitor_poll(
+        self,
+        oracle_utxo_ref: str,
+        policy_id: bytes,
+        location_id: bytes,
+        payment_skey,
+        change_address,
+        on_observation: Optional[Callable[[float, float, int], None]],
+        monitor_log: Dict[str, str],
+    ) -> bool:
+        """
+        One monitoring poll: fetch, compare against the on-chain threshold and
+        trigger if exceeded
+        
+        Returns:
+            True if the oracle was triggered
+        """
+        try:
+            # Fetch real-time weather data
+            timeline = get_trigger_slo().start(monitor_log["policy_id"], monitor_log["location_id"])
+            stage_start = time.perf_counter()
+            weather = await self.fetch_weather_data(location_id)
+            observe_stage("oracle_client", "fetch_weather", time.perf_counter() - stage_start)
+            wind_speed_ms = weather['wind_speed_ms']
+            wind_speed_int = int(wind_speed_ms * 100)  # Convert to m/s × 100
+            timestamp = weather['timestamp']
+            timeline.mark("fetched")
+            timeline.mark("observed", timestamp / 1000)
+            
+            logger.info(f"📊 Wind: {wind_speed_ms:.1f} m/s", extra={**monitor_log, "wind_speed_ms": wind_speed_ms})
+            
+            if not self.context:
+                logger.info("⚠️  Offline mode - skipping transaction submission", extra=monitor_log)
+                return False
+            
+            # Get current oracle UTxO
+            lookup_start = time.perf_counter()
             try:
-                # Fetch real-time weather data
-                weather = await self.fetch_weather_data(location_id)
-                wind_speed_ms = weather['wind_speed_ms']
-                wind_speed_int = int(wind_speed_ms * 100)  # Convert to m/s × 100
-                timestamp = weather['timestamp']
-                
-                print(f"📊 [{time.strftime('%H:%M:%S')}] Wind: {wind_speed_ms:.1f} m/s")
-                
-                if not self.context:
-                    print("⚠️  Offline mode - skipping transaction submission")
-                    await asyncio.sleep(poll_interval)
-                    continue
-                
-                # Get current oracle UTxO
-                oracle_utxos = await self.context.utxos(oracle_utxo_ref)
-                if not oracle_utxos:
-                    print("❌ Oracle UTxO not found")
-                    await asyncio.sleep(poll_interval)
-                    continue
-                
-                oracle_utxo = oracle_utxos[0]
-                datum = Phase3OracleDatum.from_cbor(oracle_utxo.output.datum.cbor)
-                
-                # Check if threshold exceeded
-                threshold_ms = datum.threshold_wind_speed / 100.0
-                
-                if wind_speed_int >= datum.threshold_wind_speed:
-                    print(f"⚠️  THRESHOLD EXCEEDED! {wind_speed_ms:.1f} m/s >= {threshold_ms:.1f} m/s")
-                    print(f"🚀 Triggering oracle...")
-                    
-                    await self.trigger_oracle(
-                        oracle_utxo,
-                        policy_id,
-                        location_id,
-                        wind_speed_int,
-                        timestamp,
-                        payment_skey,
-                        change_address
-                    )
-                    
-                    # Cooldown after trigger (5 minutes)
-                    print("⏳ Cooldown period: 5 minutes")
-                    await asyncio.sleep(300)
-                else:
-                    print(f"✅ Below threshold ({threshold_ms:.1f} m/s)")
-                
+                with span("chain.utxos", kind=SPAN_KIND_CLIENT):
+                    oracle_utxos = await self.context.utxos(oracle_utxo_ref)
             except Exception as e:
-                print(f"❌ Error in monitoring loop: {e}")
-                import traceback
-                traceback.print_exc()
+                observe_outbound("blockfrost", time.perf_counter() - lookup_start, e)
+                raise
+            observe_outbound("blockfrost", time.perf_counter() - lookup_start)
+            if not oracle_utxos:
+                logger.error("❌ Oracle UTxO not found", extra=monitor_log)
+                return False
             
-            await asyncio.sleep(poll_interval)
+            oracle_utxo = oracle_utxos[0]
+            datum = self.cardano["Phase3OracleDatum"].from_cbor(oracle_utxo.output.datum.cbor)
+            
+            # Check if threshold exceeded
+            threshold_ms = datum.threshold_wind_speed / 100.0
+            
+            if on_observation:
+                on_observation(wind_speed_ms, threshold_ms, timestamp)
+            
+            if wind_speed_int < datum.threshold_wind_speed:
+                logger.info(f"✅ Below threshold ({threshold_ms:.1f} m/s)", extra=monitor_log)
+                return False
+            
+            timeline.mark("decided")
+            logger.warning(
+                f"⚠️  THRESHOLD EXCEEDED! {wind_speed_ms:.1f} m/s >= {threshold_ms:.1f} m/s - triggering oracle",
+                extra={**monitor_log, "trigger": True, "wind_speed_ms": wind_speed_ms}
+            )
+            
+            stage_start = time.perf_counter()
+            try:
+                tx_hash = await self.trigger_oracle(
+                    oracle_utxo,
+                    policy_id,
+                    location_id,
+                    wind_speed_int,
+                    timestamp,
+                    payment_skey,
+                    change_address,
+                    timeline=timeline
+                )
+            except Exception as e:
+                observe_stage("oracle_client", "trigger", time.perf_counter() - stage_start, ok=False)
+                get_trigger_slo().finish(timeline, OUTCOME_FAILED, e)
+                raise
+            observe_stage("oracle_client", "trigger", time.perf_counter() - stage_start)
+            
+            # Event-to-confirmation latency (SLO): wait for the block
+            block_time = await self.wait_for_confirmation(tx_hash, self.confirm_timeout)
+            if block_time is None:
+                get_trigger_slo().finish(timeline, OUTCOME_UNCONFIRMED)
+            else:
+                # Block times have 1s resolution; never before our submission
+                timeline.mark("confirmed", max(block_time, timeline.marks["submitted"]))
+                get_trigger_slo().finish(timeline, OUTCOME_CONFIRMED)
+            return True
+        
+        except Exception as e:
+            logger.error(f"❌ Error in monitoring loop: {e}", exc_info=True, extra=monitor_log)
+            return False
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -6,13 +6,45 @@ FastAPI router for Gemini Forensic Reporting endpoints
 Integrates with existing Phase 6 backend without breaking changes
 """
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from collections import deque
+import asyncio
+import json
 import logging
-
-from app.services.gemini_reporter import get_gemini_reporter, stream_forensic_report
+import os
+import re
+
+from app.services.gemini_reporter import (
+    REPORT_ERROR_MARKER,
+    probe_gemini,
+    stream_forensic_report,
+)
+from app.services.forensic_archive import build_archive_record, get_report_archive
+from app.services.forensic_export import (
+    EXPORT_MEDIA_TYPES,
+    ExportQueueFullError,
+    get_export_service,
+)
+from app.services.forensic_routing import ROUTE_BATCH
+from app.services.forensic_templates import REPORT_MODE_AUTO
+from app.services.forensic_jobs import JOB_COMPLETED, JOB_FAILED, get_job_manager
+from app.services.forensic_speculation import get_speculation_manager
+from app.services.forensic_streams import get_stream_hub
+from app.services.health_probe import (
+    PROBE_DEGRADED,
+    PROBE_DOWN,
+    PROBE_PENDING,
+    PROBE_UP,
+    get_health_prober,
+)
+from app.services.forensic_storms import (
+    DEFAULT_RADIUS_KM,
+    DEFAULT_WINDOW_SECONDS,
+    generate_storm_reports,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +68,8 @@ class OraclePayload(BaseModel):
     threshold: float = Field(default=40.0, description="Trigger threshold in m/s")
     nonce: int = Field(default=0, description="Replay protection nonce")
     signature: Optional[str] = Field(default=None, description="Ed25519 signature (hex)")
+    latitude: Optional[float] = Field(default=None, ge=-90.0, le=90.0, description="Measurement latitude (storm grouping)")
+    longitude: Optional[float] = Field(default=None, ge=-180.0, le=180.0, description="Measurement longitude (storm grouping)")
 
     class Config:
         json_schema_extra = {
@@ -66,6 +100,102 @@ class ForensicReportRequest(BaseModel):
     """
     oracle_payload: OraclePayload
     policy_metadata: Optional[PolicyMetadata] = None
+    report_mode: str = Field(
+        default=REPORT_MODE_AUTO,
+        pattern="^(auto|llm|template)$",
+        description="auto (Gemini with template fallback), llm (Gemini only) or template (no LLM call)"
+    )
+
+
+class ForensicJobRequest(BaseModel):
+    """
+    Request body for a batch forensic report job
+    """
+    reports: List[ForensicReportRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=int(os.getenv("FORENSICS_JOB_MAX_ITEMS", "5000")),
+        description="Report requests to generate in the background"
+    )
+
+
+class ForensicJobResponse(BaseModel):
+    """
+    Progress of a batch forensic report job
+    """
+    job_id: str
+    status: str
+    total: int
+    counts: Dict[str, int]
+    created_at: float
+
+
+class StormReportRequest(BaseModel):
+    """
+    Request body for storm-grouped forensic report generation
+    """
+    reports: List[ForensicReportRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=int(os.getenv("FORENSICS_JOB_MAX_ITEMS", "5000")),
+        description="Triggered policies to report on"
+    )
+    window_seconds: int = Field(
+        default=DEFAULT_WINDOW_SECONDS, ge=60,
+        description="Maximum gap between measurements of one storm"
+    )
+    radius_km: float = Field(
+        default=DEFAULT_RADIUS_KM, gt=0,
+        description="Maximum distance from the storm centroid"
+    )
+    report_mode: str = Field(
+        default=REPORT_MODE_AUTO,
+        pattern="^(auto|llm|template)$",
+        description="Mode for the per-storm narratives"
+    )
+
+
+class WindObservation(BaseModel):
+    """
+    Wind observation or forecast for a monitored policy (speculative reports)
+    """
+    policy_id: str = Field(..., description="CIP-68 Policy NFT ID")
+    location_id: str = Field(..., description="Geographic location identifier")
+    wind_speed: float = Field(..., ge=0, description="Observed or forecast wind speed in m/s")
+    threshold: float = Field(..., gt=0, description="Policy trigger threshold in m/s")
+    measurement_time: Optional[int] = Field(default=None, description="Unix timestamp (defaults to now)")
+    forecast: bool = Field(default=False, description="Whether wind_speed is a forecast")
+
+
+class ForensicExportRequest(ForensicReportRequest):
+    """
+    Request body for a PDF/HTML export
+    """
+    report: Optional[str] = Field(
+        default=None,
+        description="Report text to export (generated from the payload when omitted)"
+    )
+
+
+class ForensicExportBatchRequest(BaseModel):
+    """
+    Request body for a zipped batch export
+    """
+    reports: List[ForensicExportRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=int(os.getenv("FORENSICS_JOB_MAX_ITEMS", "5000")),
+        description="Reports to export"
+    )
+    format: str = Field(default="pdf", pattern="^(pdf|html)$")
+
+
+class ArchivedReportsResponse(BaseModel):
+    """
+    Archived forensic reports matching a lookup
+    """
+    count: int
+    reports: List[Dict[str, Any]]
 
 
 class ForensicReportResponse(BaseModel):
@@ -78,12 +208,65 @@ class ForensicReportResponse(BaseModel):
     timestamp: int
 
 
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def archive_report(data: Dict[str, Any], report: str) -> None:
+    """Queue a generated report for the archive (failed generations are skipped)"""
+    archive = get_report_archive()
+    if archive is None or REPORT_ERROR_MARKER in report:
+        return
+    try:
+        archive.submit(build_archive_record(data, report))
+    except Exception as e:
+        logger.error(f"Archiving report failed: {str(e)}")
+
+
+def report_request_data(request: ForensicReportRequest) -> Dict[str, Any]:
+    """Convert a report request into the gemini_reporter input dict"""
+    data = {
+        "oracle_payload": request.oracle_payload.model_dump(),
+        "report_mode": request.report_mode,
+    }
+    if request.policy_metadata:
+        data["policy_metadata"] = request.policy_metadata.model_dump()
+    return data
+
+
+async def collect_report(data: Dict[str, Any]) -> str:
+    """Generate a complete report and archive it"""
+    chunks = []
+    async for chunk in stream_forensic_report(data):
+        chunks.append(chunk)
+    report = "".join(chunks)
+    archive_report(data, report)
+    return report
+
+
+def export_name(policy_id: str) -> str:
+    """Policy id reduced to characters safe in file names"""
+    return re.sub(r"[^A-Za-z0-9_-]", "_", policy_id)[:64]
+
+
+async def archived_stream(data: Dict[str, Any]):
+    """stream_forensic_report that archives the report once it is complete"""
+    chunks = []
+    async for chunk in stream_forensic_report(data):
+        chunks.append(chunk)
+        yield chunk
+    archive_report(data, "".join(chunks))
+
+
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
 
 @router.post("/stream")
-async def stream_forensic_report_endpoint(request: ForensicReportRequest):
+async def stream_forensic_report_endpoint(
+    request: ForensicReportRequest,
+    last_event_id: Optional[str] = Header(default=None)
+):
     """
     Stream a forensic report using Google Gemini AI
 
@@ -97,42 +280,51 @@ async def stream_forensic_report_endpoint(request: ForensicReportRequest):
     - Frontend: Use EventSource or fetch with streaming
     - Phase 6: Pass Arbiter's signed oracle data
     - Phase 1: Optionally include CIP-68 metadata for context
+    - report_mode="template" skips Gemini and streams a deterministic report
+
+    **Resuming:** every event carries an id ("<stream_id>:<seq>"). Reconnect
+    with the same body and a Last-Event-ID header to receive the remaining
+    chunks of the same generation instead of starting a new one.
 
     **Returns:** text/event-stream with chunks of the forensic report
     """
     try:
-        logger.info(f"Forensic report streaming requested for policy: {request.oracle_payload.policy_id}")
-
-        # Prepare data for gemini_reporter
-        data = {
-            "oracle_payload": request.oracle_payload.model_dump(),
-        }
-
-        if request.policy_metadata:
-            data["policy_metadata"] = request.policy_metadata.model_dump()
-
-        # Stream response using Server-Sent Events (SSE)
-        async def event_generator():
-            """Generate SSE-formatted events"""
-            try:
-                async for chunk in stream_forensic_report(data):
-                    # SSE format: data: <content>\n\n
-                    yield f"data: {chunk}\n\n"
+        policy_id = request.oracle_payload.policy_id
+        hub = get_stream_hub()
+        session, after_seq = None, -1
+
+        if last_event_id:
+            session, after_seq = hub.resume(last_event_id, policy_id)
+            if session is not None:
+                logger.info(f"Resuming forensic stream {session.stream_id} after chunk {after_seq}")
+            else:
+                logger.info(f"Unknown or expired stream {last_event_id}. Starting a new generation")
+
+        if session is None:
+            logger.info(f"Forensic report streaming requested for policy: {policy_id}")
+
+            # Prepare data for gemini_reporter
+            data = {
+                "oracle_payload": request.oracle_payload.model_dump(),
+                "report_mode": request.report_mode,
+            }
 
-                # Send completion signal
-                yield "data: [DONE]\n\n"
+            if request.policy_metadata:
+                data["policy_metadata"] = request.policy_metadata.model_dump()
 
-            except Exception as e:
-                logger.error(f"Streaming error: {str(e)}")
-                yield f"data: [ERROR] {str(e)}\n\n"
+            # Generation runs in the session, independent of this connection
+            session = hub.start(policy_id, lambda: archived_stream(data))
 
+        # Stream response using Server-Sent Events (SSE); disconnecting
+        # clients release the session so unread generations are cancelled
         return StreamingResponse(
-            event_generator(),
+            hub.sse_events(session, after_seq),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "X-Accel-Buffering": "no",  # Disable nginx buffering
+                "X-Stream-Id": session.stream_id,
             }
         )
 
@@ -151,7 +343,7 @@ async def generate_static_report(request: ForensicReportRequest):
     Generate a complete (non-streaming) forensic report
 
     Useful for:
-    - PDF export
+    - PDF export (rendered documents: /export)
     - Email notifications
     - Archival/audit logs
 
@@ -163,17 +355,14 @@ async def generate_static_report(request: ForensicReportRequest):
         # Prepare data
         data = {
             "oracle_payload": request.oracle_payload.model_dump(),
+            "report_mode": request.report_mode,
         }
 
         if request.policy_metadata:
             data["policy_metadata"] = request.policy_metadata.model_dump()
 
-        # Collect all chunks into one string
-        reporter = get_gemini_reporter()
-        report_text = await reporter.generate_static_report(
-            oracle_payload=data["oracle_payload"],
-            policy_metadata=data.get("policy_metadata")
-        )
+        # Collect all chunks into one string (template fallback included)
+        report_text = await collect_report(data)
 
         return ForensicReportResponse(
             success=True,
@@ -190,25 +379,343 @@ async def generate_static_report(request: ForensicReportRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/health")
-async def forensics_health_check():
+@router.post("/export")
+async def export_forensic_report(
+    request: ForensicExportRequest,
+    format: str = Query("pdf", pattern="^(pdf|html)$")
+):
     """
-    Health check for forensic reporting service
-    Tests Gemini API connection
+    Export a forensic report as a PDF or HTML document
+
+    Rendering runs in a process pool; identical exports are served from
+    the artefact cache. Answers 503 with Retry-After when the render queue
+    is full.
+
+    **Returns:** The document (application/pdf or text/html)
     """
+    policy_id = request.oracle_payload.policy_id
     try:
-        reporter = get_gemini_reporter()
-        return {
-            "status": "healthy",
-            "service": "Gemini Forensic Reporter",
-            "model": "gemini-1.5-flash",
-            "api_connected": True
+        report = request.report
+        if report is None:
+            report = await collect_report(report_request_data(request))
+
+        service = get_export_service()
+        path, cached = await service.render(format, report, f"Forensic Report - Policy {policy_id}")
+        content = await service.read_artifact(path)
+
+    except ExportQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        logger.error(f"Report export failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return Response(
+        content=content,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="forensic_report_{export_name(policy_id)}.{format}"',
+            "X-Report-Hash": os.path.basename(path).rsplit(".", 1)[0],
+            "X-Export-Cache": "hit" if cached else "miss",
         }
+    )
+
+
+@router.post("/export/batch")
+async def export_forensic_reports_zip(request: ForensicExportBatchRequest):
+    """
+    Export many forensic reports as one zip archive
+
+    Reports are generated and rendered a few at a time and each document
+    is streamed into the zip as soon as it is ready, so the archive is
+    never held in memory.
+
+    **Returns:** application/zip stream
+    """
+    service = get_export_service()
+    fmt = request.format
+
+    async def prepare(idx: int, item: ForensicExportRequest):
+        report = item.report
+        if report is None:
+            data = report_request_data(item)
+            data["request_class"] = ROUTE_BATCH
+            report = await collect_report(data)
+        policy_id = item.oracle_payload.policy_id
+        path, _ = await service.render(fmt, report, f"Forensic Report - Policy {policy_id}", wait=True)
+        return f"{idx + 1:05d}_{export_name(policy_id)}.{fmt}", path
+
+    async def artifacts():
+        # Keep the renderer pool busy while preserving request order
+        window = deque()
+        try:
+            for idx, item in enumerate(request.reports):
+                window.append(asyncio.ensure_future(prepare(idx, item)))
+                if len(window) > service.workers:
+                    yield await window.popleft()
+            while window:
+                yield await window.popleft()
+        finally:
+            for task in window:
+                task.cancel()
+
+    return StreamingResponse(
+        service.stream_zip(artifacts()),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="forensic_reports_{fmt}.zip"'}
+    )
+
+
+@router.post("/storms")
+async def generate_storm_grouped_reports(request: StormReportRequest):
+    """
+    Generate forensic reports for a mass trigger event
+
+    Triggered policies are grouped into storms by measurement time and
+    location (latitude/longitude when provided, otherwise location_id).
+    One narrative is generated per storm; per-policy reports substitute
+    the policy-specific fields around it without further LLM calls.
+
+    **Returns:** storm summaries with narratives and one report per policy
+    """
+    items = []
+    for report in request.reports:
+        item = {"oracle_payload": report.oracle_payload.model_dump()}
+        if report.policy_metadata:
+            item["policy_metadata"] = report.policy_metadata.model_dump()
+        items.append(item)
+
+    try:
+        return await generate_storm_reports(
+            items,
+            window_seconds=request.window_seconds,
+            radius_km=request.radius_km,
+            mode=request.report_mode,
+        )
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        return {
-            "status": "unhealthy",
-            "service": "Gemini Forensic Reporter",
-            "error": str(e),
-            "api_connected": False
+        logger.error(f"Storm report generation failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/speculative/observe")
+async def observe_wind_for_speculation(observation: WindObservation):
+    """
+    Feed a wind observation or forecast to the speculative report manager
+
+    When wind nears the threshold a draft report is generated in the
+    background; the next /stream or /generate request for the triggered
+    policy is served from the finalised draft. Requires FORENSICS_SPECULATIVE=1.
+
+    **Returns:** started, drafting, discarded or idle
+    """
+    state = get_speculation_manager().observe(**observation.model_dump())
+    return {"policy_id": observation.policy_id, "state": state}
+
+
+@router.get("/speculative/status")
+async def speculation_status():
+    """
+    Current speculative drafts and counters
+    """
+    return get_speculation_manager().status()
+
+
+@router.on_event("startup")
+async def forensics_jobs_startup():
+    """Resume batch jobs left unfinished by a previous process"""
+    get_health_prober().register("gemini", probe_gemini, critical=False)
+
+    try:
+        await get_job_manager().start()
+    except Exception as e:
+        logger.error(f"Forensic job manager failed to start: {str(e)}")
+
+    archive = get_report_archive()
+    if archive is not None:
+        try:
+            await asyncio.to_thread(archive.start)
+        except Exception as e:
+            logger.error(f"Forensic report archive failed to start: {str(e)}")
+
+
+@router.on_event("shutdown")
+async def forensics_jobs_shutdown():
+    """Stop batch workers (unfinished items are resumed on next start)"""
+    await get_job_manager().stop()
+
+    archive = get_report_archive()
+    if archive is not None:
+        await asyncio.to_thread(archive.stop)
+
+    get_export_service().shutdown()
+
+
+@router.post("/jobs", response_model=ForensicJobResponse, status_code=202)
+async def submit_forensic_job(request: ForensicJobRequest):
+    """
+    Submit a batch of forensic reports for background generation
+
+    Reports are generated by a bounded worker pool that leaves rate-limit
+    headroom for interactive /stream and /generate requests. Completed
+    results are persisted and survive restarts.
+
+    **Returns:** job id and initial progress (poll /jobs/{job_id} or
+    subscribe to /jobs/{job_id}/events)
+    """
+    items = []
+    for report in request.reports:
+        item = {
+            "oracle_payload": report.oracle_payload.model_dump(),
+            "report_mode": report.report_mode,
+        }
+        if report.policy_metadata:
+            item["policy_metadata"] = report.policy_metadata.model_dump()
+        items.append(item)
+
+    manager = get_job_manager()
+    job_id = await manager.submit(items)
+    return await manager.get_job(job_id)
+
+
+@router.get("/jobs/{job_id}", response_model=ForensicJobResponse)
+async def get_forensic_job(job_id: str):
+    """
+    Poll the progress of a batch forensic report job
+    """
+    job = await get_job_manager().get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+@router.get("/jobs/{job_id}/results")
+async def get_forensic_job_results(
+    job_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000)
+):
+    """
+    Page through per-policy results of a batch job (in submission order)
+    """
+    manager = get_job_manager()
+    job = await manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "offset": offset,
+        "results": await manager.get_results(job_id, offset, limit),
+    }
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_forensic_job_events(job_id: str):
+    """
+    Subscribe to progress events of a batch job via SSE
+
+    Each event is a JSON object with the finished item index, its status and
+    the updated job counts. The stream ends with [DONE] once the job is finished.
+    """
+    manager = get_job_manager()
+    job = await manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+
+    queue = manager.subscribe(job_id)
+
+    async def event_generator():
+        """Generate SSE-formatted progress events"""
+        try:
+            # Current snapshot first, so late subscribers see where the job is
+            current = await manager.get_job(job_id)
+            yield f"data: {json.dumps(current)}\n\n"
+
+            status = current["status"]
+            while status not in (JOB_COMPLETED, JOB_FAILED):
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {json.dumps(event)}\n\n"
+                status = event["status"]
+
+            yield "data: [DONE]\n\n"
+        finally:
+            manager.unsubscribe(job_id, queue)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
         }
+    )
+
+
+@router.get("/archive", response_model=ArchivedReportsResponse)
+async def scan_report_archive(
+    start: int = Query(..., description="Minimum measurement_time (Unix seconds)"),
+    end: int = Query(..., description="Maximum measurement_time (Unix seconds)"),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """
+    Archived forensic reports measured in a time range, oldest first
+    """
+    archive = get_report_archive()
+    if archive is None:
+        raise HTTPException(status_code=404, detail="Report archive disabled")
+
+    reports = await asyncio.to_thread(archive.range_scan, start, end, limit)
+    return ArchivedReportsResponse(count=len(reports), reports=reports)
+
+
+@router.get("/archive/{policy_id}", response_model=ArchivedReportsResponse)
+async def lookup_report_archive(
+    policy_id: str,
+    start: Optional[int] = Query(None, description="Minimum measurement_time (Unix seconds)"),
+    end: Optional[int] = Query(None, description="Maximum measurement_time (Unix seconds)"),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """
+    Archived forensic reports of one policy, oldest measurement first
+    """
+    archive = get_report_archive()
+    if archive is None:
+        raise HTTPException(status_code=404, detail="Report archive disabled")
+
+    reports = await asyncio.to_thread(archive.lookup, policy_id, start, end, limit)
+    return ArchivedReportsResponse(count=len(reports), reports=reports)
+
+
+@router.get("/health")
+async def forensics_health_check():
+    """
+    Health check for forensic reporting service
+
+    Served from memory: the Gemini backend is checked by the background
+    health prober, never on the request path.
+    """
+    gemini = get_health_prober().dependency("gemini") or {"status": PROBE_PENDING}
+    detail = gemini.get("detail", {})
+    archive = get_report_archive()
+    return {
+        "status": "unhealthy" if gemini["status"] == PROBE_DOWN else "healthy",
+        "service": "Gemini Forensic Reporter",
+        "backend": detail.get("backend"),
+        "model": detail.get("model"),
+        "routing": detail.get("routing"),
+        "prompt_usage": detail.get("prompt_usage"),
+        "gemini": {k: v for k, v in gemini.items() if k != "detail"},
+        "streams": get_stream_hub().status(),
+        "archive": archive.status() if archive is not None else None,
+        "export": get_export_service().status(),
+        "api_connected": gemini["status"] in (PROBE_UP, PROBE_DEGRADED),
+    }
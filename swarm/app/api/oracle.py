@@ -3,12 +3,17 @@ Hyperion API - Oracle Endpoints
 Phase 3 Oracle trigger management and monitoring
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Header, Response
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable
 import asyncio
 
 from app.agents.phase3_oracle_client import Phase3OracleClient
+from app.services.forensic_speculation import get_speculation_manager
+from app.services.health_probe import PROBE_NOT_CONFIGURED, get_health_prober
+from app.services.idempotency import IdempotencyKeyConflict, get_idempotency_store
+from app.services.trigger_slo import get_trigger_slo
 
 router = APIRouter()
 
@@ -41,6 +46,35 @@ class MonitoringRequest(BaseModel):
     poll_interval: int = Field(default=30, description="Polling interval in seconds", ge=10, le=300)
 
 
+async def run_idempotent(
+    operation: str,
+    idempotency_key: Optional[str],
+    payload: BaseModel,
+    response: Response,
+    execute: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Run a mutation once per Idempotency-Key
+    
+    Without a key the request simply runs. With one, a repeat gets the
+    original response (Idempotent-Replayed: true) and a duplicate arriving
+    while the first runs waits for it.
+    """
+    if idempotency_key is None:
+        return await execute()
+    
+    try:
+        result, replayed = await get_idempotency_store().run(
+            operation, idempotency_key, jsonable_encoder(payload), execute
+        )
+    except IdempotencyKeyConflict as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
+
+
 @router.post("/initialize")
 async def initialize_oracle(config: OracleConfig):
     """
@@ -68,13 +102,24 @@ async def initialize_oracle(config: OracleConfig):
 
 
 @router.post("/trigger")
-async def trigger_oracle(request: OracleTriggerRequest):
+async def trigger_oracle(
+    request: OracleTriggerRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255)
+):
     """
     Manually trigger oracle with specific weather data
     
     This bypasses the monitoring loop and directly submits an oracle trigger.
-    Use for testing or manual interventions.
+    Use for testing or manual interventions. Retries with the same
+    Idempotency-Key return the original response.
     """
+    return await run_idempotent(
+        "oracle.trigger", idempotency_key, request, response, lambda: _trigger_oracle(request)
+    )
+
+
+async def _trigger_oracle(request: OracleTriggerRequest) -> Dict[str, Any]:
     if not oracle_client:
         raise HTTPException(
             status_code=400,
@@ -113,13 +158,24 @@ async def trigger_oracle(request: OracleTriggerRequest):
 
 
 @router.post("/monitor/start")
-async def start_monitoring(request: MonitoringRequest, background_tasks: BackgroundTasks):
+async def start_monitoring(
+    request: MonitoringRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255)
+):
     """
     Start real-time weather monitoring for automatic oracle triggers
     
     This starts a background task that continuously monitors weather conditions
     and automatically triggers the oracle when the parametric condition is met.
+    Retries with the same Idempotency-Key return the original response.
     """
+    return await run_idempotent(
+        "oracle.monitor_start", idempotency_key, request, response, lambda: _start_monitoring(request)
+    )
+
+
+async def _start_monitoring(request: MonitoringRequest) -> Dict[str, Any]:
     if not oracle_client:
         raise HTTPException(
             status_code=400,
@@ -140,6 +196,16 @@ async def start_monitoring(request: MonitoringRequest, background_tasks: Backgro
         policy_id = bytes.fromhex(request.policy_id)
         location_id = request.location_id.encode()
         
+        # Feed readings to speculative forensic reports (Phase 7)
+        def on_observation(wind_speed_ms: float, threshold_ms: float, timestamp_ms: int):
+            get_speculation_manager().observe(
+                policy_id=request.policy_id,
+                location_id=request.location_id,
+                wind_speed=wind_speed_ms,
+                threshold=threshold_ms,
+                measurement_time=timestamp_ms // 1000,
+            )
+        
         # Start monitoring in background
         async def monitor_task():
             await oracle_client.monitor_weather_realtime(
@@ -148,7 +214,8 @@ async def start_monitoring(request: MonitoringRequest, background_tasks: Backgro
                 location_id=location_id,
                 payment_skey=None,  # TODO: Load from config
                 change_address=None,  # TODO: Load from config
-                poll_interval=request.poll_interval
+                poll_interval=request.poll_interval,
+                on_observation=on_observation
             )
         
         task = asyncio.create_task(monitor_task())
@@ -213,11 +280,53 @@ async def get_monitoring_status():
     }
 
 
+@router.get("/slo")
+async def get_trigger_latency_slo(limit: int = 20):
+    """
+    Event-to-confirmation latency of oracle triggers against the 60s target
+    
+    Returns rolling percentiles per segment (provider delay, fetch, decision,
+    signing, submission, confirmation), each segment's share of the total,
+    error budget burn rates and alerts, and the latest per-trigger breakdowns.
+    """
+    return get_trigger_slo().status(limit=max(1, min(limit, 500)))
+
+
+async def probe_chain_context() -> Dict[str, Any]:
+    """
+    Health check for the BlockFrost chain context (run by the health prober)
+    
+    Reads the latest block slot; not configured until /initialize succeeds
+    with pycardano installed.
+    """
+    if oracle_client is None or oracle_client.context is None:
+        return {"status": PROBE_NOT_CONFIGURED}
+    
+    context = oracle_client.context
+    slot = await asyncio.to_thread(lambda: context.last_block_slot)
+    return {"network": str(oracle_client.network), "last_block_slot": slot}
+
+
+async def probe_signer() -> Dict[str, Any]:
+    """
+    Health check for the oracle signing key: sign and verify a probe message
+    """
+    if oracle_client is None:
+        return {"status": PROBE_NOT_CONFIGURED}
+    
+    message = b"hyperion-health-probe"
+    oracle_client.oracle_vk.verify(oracle_client.oracle_sk.sign(message))
+    return {"oracle_vk": oracle_client.oracle_vk.encode().hex()[:16]}
+
+
 @router.get("/health")
 async def oracle_health():
     """
     Oracle service health check
+    
+    Chain context and signer state come from the background health prober.
     """
+    prober = get_health_prober()
     return {
         "service": "Phase 3 Oracle",
         "status": "operational",
@@ -227,6 +336,10 @@ async def oracle_health():
             "ed25519_signing": True,
             "realtime_monitoring": True,
             "pycardano_integration": oracle_client is not None and oracle_client.context is not None
+        },
+        "dependencies": {
+            "chain_context": prober.dependency("chain_context"),
+            "signer": prober.dependency("signer"),
         }
     }
 
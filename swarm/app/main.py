@@ -3,10 +3,45 @@ Hyperion AI Backend - FastAPI Application
 AI-Powered Parametric Insurance Protocol
 """
 
-from fastapi import FastAPI
+import httpx
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.services.health_probe import get_health_prober
+from app.services.log_config import configure_logging
+from app.services.loop_watchdog import get_loop_watchdog, start_loop_watchdog
+from app.services.metrics import CONTENT_TYPE_LATEST, MetricsMiddleware, get_metrics_registry
+from app.services.profiling import ProfilingMiddleware
+from app.services.tracing import TracingMiddleware
+from app.services.startup import create_module_warmer
+
+# Text lines by default; HYPERION_LOG_MODE=json for queued, sampled JSON
+configure_logging("swarm")
+
+# Heavy SDKs are imported on first use; these are warmed at startup
+# (HYPERION_STARTUP_MODE=eager) or in the background (HYPERION_WARMUP=1)
+HEAVY_MODULES = [
+    "pycardano",
+    "app.agents.phase3_oracle_client",
+    "google.generativeai",
+]
+module_warmer = create_module_warmer(HEAVY_MODULES)
+
+# Dependency checks run in the background; /health only reads the snapshot
+health_prober = get_health_prober()
+_probe_client: httpx.AsyncClient | None = None
+
+
+async def probe_weather_provider():
+    """Reach the weather API host (unauthenticated, no quota used)"""
+    global _probe_client
+    if _probe_client is None:
+        _probe_client = httpx.AsyncClient(timeout=health_prober.timeout_seconds)
+    response = await _probe_client.head(settings.weather_api_url)
+    if response.status_code >= 500:
+        raise RuntimeError(f"HTTP {response.status_code}")
+    return {"url": settings.weather_api_url, "http_status": response.status_code}
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -26,6 +61,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency histograms for /metrics
+app.add_middleware(MetricsMiddleware)
+# X-Debug-Profile: 1 (with X-Debug-Token) profiles a single request
+app.add_middleware(ProfilingMiddleware)
+# Root span per sampled request; traceparent / X-Trace-Id response headers
+app.add_middleware(TracingMiddleware)
+
+
+@app.on_event("startup")
+async def warm_heavy_modules():
+    """Import heavy SDKs now (eager) or schedule background warm-up (lazy)"""
+    await module_warmer.start()
+    await health_prober.start()
+    await start_loop_watchdog()
+
+
+@app.on_event("shutdown")
+async def stop_module_warmer():
+    global _probe_client
+    await module_warmer.stop()
+    await health_prober.stop()
+    await get_loop_watchdog().stop()
+    if _probe_client is not None:
+        await _probe_client.aclose()
+        _probe_client = None
+
 
 @app.get("/")
 async def root():
@@ -39,22 +100,35 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for monitoring"""
-    return {
-        "status": "healthy",
-        "components": {
-            "api": "up",
-            "ai_agents": "standby",
-            "blockchain": "disconnected",
-            "oracle": "ready",  # Phase 3 Oracle
-            "forensics": "ready",  # Phase 7 Gemini Forensic Reporting
-        },
-    }
+    """
+    Health check endpoint for monitoring
+
+    Served from the background prober's cached snapshot (weather provider,
+    chain context, Gemini, signer) with per-dependency latency and timestamps.
+    """
+    return {**health_prober.snapshot(), "startup": module_warmer.status()}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(get_metrics_registry().render(), media_type=CONTENT_TYPE_LATEST)
 
 
 # Import and include routers
 from app.api import oracle
 from app.api import forensics
+from app.api import debug
+
+get_metrics_registry().callback_gauge(
+    "hyperion_active_monitors",
+    "Real-time weather monitoring tasks still running",
+    lambda: sum(1 for task in oracle.monitoring_tasks.values() if not task.done()),
+)
+
+health_prober.register("weather_provider", probe_weather_provider, critical=False)
+health_prober.register("chain_context", oracle.probe_chain_context, critical=False)
+health_prober.register("signer", oracle.probe_signer)
 
 app.include_router(
     oracle.router,
@@ -74,3 +148,6 @@ app.include_router(
 # app.include_router(risk.router, prefix="/api/v1/risk", tags=["Risk Assessment"])
 # app.include_router(claims.router, prefix="/api/v1/claims", tags=["Claims"])
 # app.include_router(policies.router, prefix="/api/v1/policies", tags=["Policies"])
+
+# Runtime diagnostics (404 unless HYPERION_DEBUG_TOKEN is set)
+app.include_router(debug.router, prefix="/debug", include_in_schema=False)
@@ -0,0 +1,373 @@
+"""
+PROJECT HYPERION - PHASE 7: FORENSIC REPORT EXPORT
+===================================================
+
+Purpose: Render forensic reports as PDF or HTML documents without blocking
+         the event loop.
+
+Rendering:
+- PDF: self-contained PDF 1.4 writer (standard Helvetica fonts, wrapped
+  and paginated text, Flate-compressed pages), so no native PDF toolkit
+  has to be installed
+- HTML: standalone page with the report text
+- Rendering runs in a process pool (FORENSICS_EXPORT_WORKERS processes)
+
+Queueing and caching:
+- At most FORENSICS_EXPORT_QUEUE renders may be pending; single exports
+  beyond that are rejected (the API answers 503), batch exports wait
+- Artefacts are cached on disk under the SHA-256 of format, title and
+  report text (FORENSICS_EXPORT_CACHE_DIR, at most
+  FORENSICS_EXPORT_CACHE_FILES files)
+- Batch exports are streamed as a zip archive entry by entry, reading each
+  artefact from the cache in blocks
+"""
+
+import os
+import html
+import zlib
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import textwrap
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.services.metrics import count_cache
+
+logger = logging.getLogger(__name__)
+
+EXPORT_PDF = "pdf"
+EXPORT_HTML = "html"
+EXPORT_FORMATS = (EXPORT_PDF, EXPORT_HTML)
+EXPORT_MEDIA_TYPES = {EXPORT_PDF: "application/pdf", EXPORT_HTML: "text/html"}
+
+# US Letter, 1 inch margins, 10pt body text
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+MARGIN = 72
+LINE_HEIGHT = 13
+WRAP_COLUMNS = 92
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT
+
+READ_BLOCK_BYTES = 64 * 1024
+
+
+class ExportQueueFullError(Exception):
+    """Raised when the render queue has no free slot"""
+
+
+def _pdf_text(text: str) -> str:
+    """Escape text for a PDF string literal (WinAnsi encoding)"""
+    text = text.encode("cp1252", errors="replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def render_report_pdf(report: str, title: str) -> bytes:
+    """
+    Render report text as a paginated PDF document
+
+    Args:
+        report: Report text (paragraphs separated by newlines)
+        title: Document title, printed on the first page
+
+    Returns:
+        bytes: PDF file
+    """
+    lines: List[str] = []
+    for paragraph in report.split("\n"):
+        lines.extend(textwrap.wrap(paragraph, WRAP_COLUMNS) or [""])
+
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+
+    # Objects: 1 catalog, 2 page tree, 3 body font, 4 title font, then page/content pairs
+    objects: List[bytes] = [b"", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+                            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>"]
+    page_refs = []
+
+    for number, page_lines in enumerate(pages):
+        ops = ["BT", f"{LINE_HEIGHT} TL", f"{MARGIN} {PAGE_HEIGHT - MARGIN} Td"]
+        if number == 0:
+            ops += [f"/F2 14 Tf ({_pdf_text(title)}) Tj", "T* T*"]
+        ops.append("/F1 10 Tf")
+        ops += [f"({_pdf_text(line)}) Tj T*" for line in page_lines]
+        ops.append("ET")
+        stream = zlib.compress("\n".join(ops).encode("latin-1"))
+
+        content_id = len(objects) + 2
+        page_refs.append(f"{len(objects) + 1} 0 R")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        )
+        objects.append(
+            f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode()
+            + stream + b"\nendstream"
+        )
+
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(page_refs)}] /Count {len(pages)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def render_report_html(report: str, title: str) -> bytes:
+    """
+    Render report text as a standalone HTML page
+
+    Args:
+        report: Report text (paragraphs separated by blank lines)
+        title: Page title
+
+    Returns:
+        bytes: UTF-8 encoded HTML document
+    """
+    paragraphs = "\n".join(
+        f"<p>{html.escape(block).replace(chr(10), '<br>')}</p>"
+        for block in report.split("\n\n") if block.strip()
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>body{{font-family:Helvetica,Arial,sans-serif;max-width:46rem;margin:2rem auto;line-height:1.5;color:#1a1a1a}}h1{{font-size:1.4rem}}</style>
+</head>
+<body>
+<h1>{html.escape(title)}</h1>
+{paragraphs}
+</body>
+</html>
+""".encode()
+
+
+def render_artifact(fmt: str, report: str, title: str) -> bytes:
+    """Render one export (runs in a worker process)"""
+    if fmt == EXPORT_PDF:
+        return render_report_pdf(report, title)
+    return render_report_html(report, title)
+
+
+def report_hash(fmt: str, report: str, title: str) -> str:
+    """Content hash identifying a rendered artefact"""
+    digest = hashlib.sha256()
+    for part in (fmt, title, report):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ForensicExportService:
+    """
+    Renders exports in a process pool with a bounded queue and a disk cache
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        workers: int = 2,
+        queue_size: int = 32,
+        cache_files: int = 1000
+    ):
+        """
+        Args:
+            cache_dir: Directory for rendered artefacts
+            workers: Renderer processes
+            queue_size: Maximum pending renders
+            cache_files: Maximum cached artefacts kept on disk
+        """
+        self.cache_dir = cache_dir
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.cache_files = cache_files
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+        self.stats = {"rendered": 0, "cache_hits": 0, "rejected": 0}
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # spawn: workers must not inherit the server's threads and sockets
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the renderer processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def artifact_path(self, digest: str, fmt: str) -> str:
+        return os.path.join(self.cache_dir, f"{digest}.{fmt}")
+
+    def _store(self, path: str, data: bytes) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+
+        cached = [os.path.join(self.cache_dir, n) for n in os.listdir(self.cache_dir) if not n.endswith(".tmp")]
+        if len(cached) > self.cache_files:
+            cached.sort(key=os.path.getmtime)
+            for stale in cached[:len(cached) - self.cache_files]:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    async def render(self, fmt: str, report: str, title: str, wait: bool = False) -> Tuple[str, bool]:
+        """
+        Render (or fetch from cache) one export
+
+        Args:
+            fmt: "pdf" or "html"
+            report: Report text
+            title: Document title
+            wait: Wait for a queue slot instead of failing when the queue is full
+
+        Returns:
+            Tuple[str, bool]: (path of the cached artefact, whether it was a cache hit)
+
+        Raises:
+            ValueError: If fmt is unknown
+            ExportQueueFullError: If the queue is full and wait is False
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{fmt}'. Expected: {', '.join(EXPORT_FORMATS)}")
+
+        path = self.artifact_path(report_hash(fmt, report, title), fmt)
+        if await asyncio.to_thread(os.path.exists, path):
+            self.stats["cache_hits"] += 1
+            count_cache("export_artifacts", True)
+            return path, True
+        count_cache("export_artifacts", False)
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.queue_size)
+        if self._slots.locked() and not wait:
+            self.stats["rejected"] += 1
+            raise ExportQueueFullError(f"Export queue full ({self.queue_size} pending renders)")
+
+        self._pending += 1
+        try:
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(self._executor(), render_artifact, fmt, report, title)
+                await asyncio.to_thread(self._store, path, data)
+        finally:
+            self._pending -= 1
+
+        self.stats["rendered"] += 1
+        return path, False
+
+    async def read_artifact(self, path: str) -> bytes:
+        """Read a cached artefact"""
+        def read() -> bytes:
+            with open(path, "rb") as handle:
+                return handle.read()
+        return await asyncio.to_thread(read)
+
+    async def stream_zip(self, items: AsyncIterator[Tuple[str, str]]) -> AsyncIterator[bytes]:
+        """
+        Stream a zip archive of cached artefacts
+
+        Only one read block is held in memory at a time: each block is read
+        in a worker thread, written to the entry and yielded straight away.
+        Zip entries are written without seeking (data descriptors).
+
+        Args:
+            items: Async iterator of (entry name, artefact path)
+
+        Yields:
+            bytes: Zip archive bytes
+        """
+        sink = _ZipSink()
+        archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED)
+
+        async for name, path in items:
+            source = await asyncio.to_thread(open, path, "rb")
+            try:
+                with archive.open(name, "w", force_zip64=True) as entry:
+                    while True:
+                        block = await asyncio.to_thread(source.read, READ_BLOCK_BYTES)
+                        if not block:
+                            break
+                        entry.write(block)
+                        yield sink.drain()
+            finally:
+                source.close()
+            # Data descriptor of the finished entry
+            yield sink.drain()
+
+        archive.close()
+        yield sink.drain()
+
+    def status(self) -> Dict[str, Any]:
+        """Pool, queue and cache counters"""
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "pending": self._pending,
+            "stats": dict(self.stats),
+        }
+
+
+class _ZipSink:
+    """Write-only, non-seekable buffer drained after every block"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+# Singleton instance for reuse across requests
+_export_instance: Optional[ForensicExportService] = None
+
+
+def get_export_service() -> ForensicExportService:
+    """
+    Get or create the singleton ForensicExportService
+
+    Returns:
+        ForensicExportService: Service configured from environment
+    """
+    global _export_instance
+
+    if _export_instance is None:
+        _export_instance = ForensicExportService(
+            cache_dir=os.getenv("FORENSICS_EXPORT_CACHE_DIR", "forensic_exports"),
+            workers=int(os.getenv("FORENSICS_EXPORT_WORKERS", "2")),
+            queue_size=int(os.getenv("FORENSICS_EXPORT_QUEUE", "32")),
+            cache_files=int(os.getenv("FORENSICS_EXPORT_CACHE_FILES", "1000")),
+        )
+
+    return _export_instance
@@ -0,0 +1,272 @@
+"""
+PROJECT HYPERION - PHASE 7: STORM-EVENT GROUPING
+=================================================
+
+Purpose: Generate forensic reports for mass trigger events with one LLM call
+         per storm instead of one per policy.
+
+Flow:
+1. Cluster triggered oracle payloads by measurement time and location
+2. Generate one storm narrative per cluster (Gemini, or template fallback)
+3. Produce every per-policy report by deterministic substitution of the
+   policy-specific fields around the shared narrative
+
+Clustering:
+- Payloads are processed in measurement_time order
+- A payload joins an open cluster if it was measured within the time window
+  of the cluster's latest measurement and lies within the radius of the
+  cluster centroid (haversine distance)
+- Payloads without coordinates only join clusters with the same location_id
+"""
+
+import math
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.services.forensic_templates import (
+    MS_TO_MPH,
+    REPORT_MODE_AUTO,
+    REPORT_MODE_LLM,
+    REPORT_MODE_TEMPLATE,
+    format_measurement_time,
+    render_storm_policy_chunks,
+)
+from app.services.gemini_reporter import get_gemini_reporter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SECONDS = 6 * 3600
+DEFAULT_RADIUS_KM = 150.0
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two coordinates in kilometres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class StormCluster:
+    """
+    A group of triggered payloads attributed to the same storm event
+    """
+
+    def __init__(self, cluster_id: str):
+        self.cluster_id = cluster_id
+        self.items: List[Dict[str, Any]] = []
+        self.location_ids: List[str] = []
+        self.start_time: int = 0
+        self.end_time: int = 0
+        self._lat_sum = 0.0
+        self._lon_sum = 0.0
+        self._coord_count = 0
+
+    @property
+    def centroid(self) -> Optional[tuple]:
+        if not self._coord_count:
+            return None
+        return (self._lat_sum / self._coord_count, self._lon_sum / self._coord_count)
+
+    def accepts(self, payload: Dict[str, Any], window_seconds: int, radius_km: float) -> bool:
+        """Check whether a payload belongs to this cluster"""
+        if payload["measurement_time"] - self.end_time > window_seconds:
+            return False
+
+        lat, lon = payload.get("latitude"), payload.get("longitude")
+        centroid = self.centroid
+        if lat is None or lon is None or centroid is None:
+            return payload["location_id"] in self.location_ids
+
+        return haversine_km(lat, lon, centroid[0], centroid[1]) <= radius_km
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """Add a report request (oracle_payload + optional policy_metadata)"""
+        payload = item["oracle_payload"]
+        if not self.items:
+            self.start_time = payload["measurement_time"]
+        self.end_time = max(self.end_time, payload["measurement_time"])
+        self.items.append(item)
+
+        if payload["location_id"] not in self.location_ids:
+            self.location_ids.append(payload["location_id"])
+
+        lat, lon = payload.get("latitude"), payload.get("longitude")
+        if lat is not None and lon is not None:
+            self._lat_sum += lat
+            self._lon_sum += lon
+            self._coord_count += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate storm statistics used by the narrative"""
+        speeds = [item["oracle_payload"]["wind_speed"] for item in self.items]
+        centroid = self.centroid
+        return {
+            "cluster_id": self.cluster_id,
+            "policy_count": len(self.items),
+            "location_count": len(self.location_ids),
+            "locations": self.location_ids[:10],
+            "start": format_measurement_time(self.start_time),
+            "end": format_measurement_time(self.end_time),
+            "max_wind": max(speeds),
+            "mean_wind": sum(speeds) / len(speeds),
+            "centroid": [round(centroid[0], 4), round(centroid[1], 4)] if centroid else None,
+        }
+
+
+def cluster_storm_events(
+    items: List[Dict[str, Any]],
+    window_seconds: int = DEFAULT_WINDOW_SECONDS,
+    radius_km: float = DEFAULT_RADIUS_KM
+) -> List[StormCluster]:
+    """
+    Group report requests into storm clusters
+
+    Args:
+        items: Report request dicts ('oracle_payload', optional 'policy_metadata')
+        window_seconds: Maximum gap between measurements in one cluster
+        radius_km: Maximum distance from the cluster centroid
+
+    Returns:
+        List[StormCluster]: Clusters in order of their first measurement
+    """
+    ordered = sorted(items, key=lambda item: item["oracle_payload"]["measurement_time"])
+    clusters: List[StormCluster] = []
+    open_clusters: List[StormCluster] = []
+
+    for item in ordered:
+        payload = item["oracle_payload"]
+
+        # Clusters whose window has passed can never accept a later payload
+        open_clusters = [
+            c for c in open_clusters
+            if payload["measurement_time"] - c.end_time <= window_seconds
+        ]
+
+        target = next(
+            (c for c in open_clusters if c.accepts(payload, window_seconds, radius_km)),
+            None
+        )
+        if target is None:
+            target = StormCluster(f"storm_{len(clusters) + 1}")
+            clusters.append(target)
+            open_clusters.append(target)
+
+        target.add(item)
+
+    return clusters
+
+
+def build_storm_prompt(summary: Dict[str, Any]) -> str:
+    """
+    Construct the Gemini prompt for a storm narrative
+
+    Args:
+        summary: StormCluster.summary() output
+
+    Returns:
+        str: Prompt text
+    """
+    return f"""You are an AI insurance adjuster for Project Hyperion, a parametric hurricane insurance protocol on the Cardano blockchain.
+
+A single storm event triggered {summary['policy_count']} insurance policies. Write ONE storm narrative (120-200 words) that will be shared by every affected policyholder's forensic report.
+
+**STORM DETAILS:**
+- Observation window: {summary['start']} to {summary['end']}
+- Affected locations ({summary['location_count']}): {', '.join(summary['locations'])}
+- Peak recorded wind speed: {summary['max_wind']:.2f} m/s ({summary['max_wind'] * MS_TO_MPH:.1f} mph)
+- Mean recorded wind speed: {summary['mean_wind']:.2f} m/s
+
+**INSTRUCTIONS:**
+Describe the storm event, how independent oracle readings across the region corroborate each other, and that affected policies were settled automatically by the Cardano smart contract. Do NOT mention any individual policy, beneficiary, amount or threshold. Professional but accessible tone, plain paragraphs.
+
+Generate the storm narrative now:
+"""
+
+
+def render_storm_narrative_template(summary: Dict[str, Any]) -> str:
+    """Deterministic storm narrative used when Gemini is unavailable"""
+    return (
+        f"Between {summary['start']} and {summary['end']}, a severe wind event "
+        f"affected {summary['location_count']} monitored location(s) and triggered "
+        f"{summary['policy_count']} policies. Independent oracle readings across the "
+        f"region recorded a peak wind speed of {summary['max_wind']:.2f} m/s "
+        f"({summary['max_wind'] * MS_TO_MPH:.1f} mph) and a mean of "
+        f"{summary['mean_wind']:.2f} m/s, corroborating each other. Every affected "
+        f"policy was evaluated and settled automatically by the Cardano smart contract."
+    )
+
+
+async def generate_storm_narrative(summary: Dict[str, Any], mode: str) -> str:
+    """
+    Generate one narrative for a storm cluster
+
+    Args:
+        summary: StormCluster.summary() output
+        mode: Report mode; "template" never calls Gemini
+
+    Returns:
+        str: Storm narrative text
+    """
+    if mode == REPORT_MODE_TEMPLATE:
+        return render_storm_narrative_template(summary)
+
+    try:
+        return await get_gemini_reporter().generate_text(build_storm_prompt(summary))
+    except Exception as e:
+        if mode == REPORT_MODE_LLM:
+            raise
+        logger.warning(f"Storm narrative generation failed ({e}). Using template narrative")
+        return render_storm_narrative_template(summary)
+
+
+async def generate_storm_reports(
+    items: List[Dict[str, Any]],
+    window_seconds: int = DEFAULT_WINDOW_SECONDS,
+    radius_km: float = DEFAULT_RADIUS_KM,
+    mode: str = REPORT_MODE_AUTO,
+    max_concurrency: int = 4
+) -> Dict[str, Any]:
+    """
+    Cluster report requests into storms and generate every per-policy report
+
+    Args:
+        items: Report request dicts ('oracle_payload', optional 'policy_metadata')
+        window_seconds: Clustering time window
+        radius_km: Clustering radius
+        mode: Report mode for the storm narratives
+        max_concurrency: Maximum concurrent narrative generations
+
+    Returns:
+        dict: 'clusters' (summaries with narratives) and 'reports' (per policy)
+    """
+    clusters = cluster_storm_events(items, window_seconds, radius_km)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def narrate(cluster: StormCluster) -> Dict[str, Any]:
+        summary = cluster.summary()
+        async with semaphore:
+            summary["narrative"] = await generate_storm_narrative(summary, mode)
+        return summary
+
+    summaries = await asyncio.gather(*(narrate(c) for c in clusters))
+
+    reports = []
+    for cluster, summary in zip(clusters, summaries):
+        for item in cluster.items:
+            chunks = render_storm_policy_chunks(
+                item["oracle_payload"], item.get("policy_metadata"), summary["narrative"]
+            )
+            reports.append({
+                "policy_id": item["oracle_payload"]["policy_id"],
+                "cluster_id": cluster.cluster_id,
+                "report": "".join(chunks),
+            })
+
+    logger.info(
+        f"Storm grouping: {len(items)} reports from {len(clusters)} narrative(s)"
+    )
+    return {"clusters": summaries, "reports": reports}
@@ -0,0 +1,335 @@
+"""
+PROJECT HYPERION - TRIGGER LATENCY SLO
+======================================
+
+Purpose: Measure the event-to-confirmation latency of oracle triggers
+         against the Phase 3 target (< 60s) and show where the time goes.
+
+Every trigger of Phase3OracleClient carries a TriggerTimeline with wall
+clock milestones:
+
+    observed        provider observation time (OpenWeatherMap `dt`)
+    fetch_started   our poll starts fetching
+    fetched         reading received
+    decided         on-chain threshold read and compared
+    signed          oracle message signed
+    submitted       transaction accepted by BlockFrost
+    confirmed       transaction seen in a block
+
+Consecutive milestones give the segments (provider_delay, fetch, decision,
+signing, submission, confirmation); observed → confirmed is the SLO latency.
+Finished triggers feed:
+- hyperion_trigger_segment_seconds{segment} / hyperion_trigger_latency_seconds
+- rolling percentiles over the last HYPERION_TRIGGER_SLO_WINDOW triggers
+- multi-window burn rates of the error budget (1 - objective) and alerts:
+  page when the 1h and 5m burn rates exceed 14.4, ticket when the 6h and
+  30m burn rates exceed 6. A trigger is bad when it fails, is not confirmed
+  or takes longer than HYPERION_TRIGGER_SLO_SECONDS
+"""
+
+import os
+import math
+import time
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+SEGMENTS = (
+    ("provider_delay", "observed", "fetch_started"),
+    ("fetch", "fetch_started", "fetched"),
+    ("decision", "fetched", "decided"),
+    ("signing", "decided", "signed"),
+    ("submission", "signed", "submitted"),
+    ("confirmation", "submitted", "confirmed"),
+)
+
+OUTCOME_CONFIRMED = "confirmed"
+OUTCOME_UNCONFIRMED = "unconfirmed"
+OUTCOME_FAILED = "failed"
+
+# (severity, long window, short window, burn rate factor)
+BURN_ALERTS = (
+    ("page", 3600, 300, 14.4),
+    ("ticket", 21600, 1800, 6.0),
+)
+BURN_WINDOWS = {"5m": 300, "30m": 1800, "1h": 3600, "6h": 21600}
+
+_QUANTILES = (0.5, 0.9, 0.99)
+
+_registry = get_metrics_registry()
+_SLO_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0, 180.0, 300.0)
+TRIGGER_SEGMENT = _registry.histogram(
+    "hyperion_trigger_segment_seconds",
+    "Time spent in one segment of an oracle trigger (observation to confirmation)",
+    ("segment",),
+    buckets=_SLO_BUCKETS,
+)
+TRIGGER_LATENCY = _registry.histogram(
+    "hyperion_trigger_latency_seconds",
+    "Oracle trigger latency from provider observation to on-chain confirmation",
+    buckets=_SLO_BUCKETS,
+)
+TRIGGERS = _registry.counter(
+    "hyperion_triggers_total", "Oracle triggers by outcome and SLO result", ("outcome", "slo")
+)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+class TriggerTimeline:
+    """
+    Milestones of one oracle trigger (epoch seconds)
+    """
+
+    __slots__ = ("policy_id", "location_id", "marks", "outcome", "tx_hash", "error")
+
+    def __init__(self, policy_id: str, location_id: str):
+        self.policy_id = policy_id
+        self.location_id = location_id
+        self.marks: Dict[str, float] = {}
+        self.outcome: Optional[str] = None
+        self.tx_hash: Optional[str] = None
+        self.error: Optional[str] = None
+
+    def mark(self, milestone: str, at: Optional[float] = None) -> None:
+        """Record a milestone (now, unless `at` is given)"""
+        self.marks[milestone] = time.time() if at is None else at
+
+    def segments(self) -> Dict[str, float]:
+        """Seconds per segment whose two milestones were reached"""
+        durations = {}
+        for name, start, end in SEGMENTS:
+            if start in self.marks and end in self.marks:
+                durations[name] = max(0.0, self.marks[end] - self.marks[start])
+        return durations
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Observation → confirmation seconds (None until confirmed)"""
+        if "observed" not in self.marks or "confirmed" not in self.marks:
+            return None
+        return max(0.0, self.marks["confirmed"] - self.marks["observed"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        latency = self.latency
+        return {
+            "policy_id": self.policy_id,
+            "location_id": self.location_id,
+            "outcome": self.outcome,
+            "tx_hash": self.tx_hash,
+            "error": self.error,
+            "observed_at": self.marks.get("observed"),
+            "latency_s": round(latency, 3) if latency is not None else None,
+            "segments_s": {name: round(seconds, 3) for name, seconds in self.segments().items()},
+        }
+
+
+class TriggerLatencyTracker:
+    """
+    Rolling trigger latency percentiles and SLO burn rates
+    """
+
+    def __init__(
+        self,
+        target_seconds: float = 60.0,
+        objective: float = 0.99,
+        window: int = 500,
+        max_events: int = 10000
+    ):
+        """
+        Args:
+            target_seconds: Event-to-confirmation latency target
+            objective: Share of triggers that must meet the target
+            window: Finished triggers kept for percentiles and breakdowns
+            max_events: Trigger results kept for burn rates (up to 6h)
+        """
+        self.target_seconds = target_seconds
+        self.objective = objective
+        self._timelines: Deque[TriggerTimeline] = deque(maxlen=max(1, window))
+        self._events: Deque[Tuple[float, bool]] = deque(maxlen=max(1, max_events))
+        self._alerting: Dict[str, bool] = {severity: False for severity, *_ in BURN_ALERTS}
+
+    def start(self, policy_id: str, location_id: str) -> TriggerTimeline:
+        """New timeline, with fetch_started marked"""
+        timeline = TriggerTimeline(policy_id, location_id)
+        timeline.mark("fetch_started")
+        return timeline
+
+    def finish(self, timeline: TriggerTimeline, outcome: str, error: Optional[BaseException] = None) -> bool:
+        """
+        Record a finished trigger
+
+        Args:
+            timeline: Trigger milestones
+            outcome: OUTCOME_CONFIRMED, OUTCOME_UNCONFIRMED or OUTCOME_FAILED
+            error: Exception a failed trigger raised
+
+        Returns:
+            bool: Whether the trigger met the SLO
+        """
+        timeline.outcome = outcome
+        if error is not None:
+            timeline.error = f"{type(error).__name__}: {error}"
+        latency = timeline.latency
+        met = outcome == OUTCOME_CONFIRMED and latency is not None and latency <= self.target_seconds
+
+        segments = timeline.segments()
+        for name, seconds in segments.items():
+            TRIGGER_SEGMENT.labels(name).observe(seconds)
+        if latency is not None:
+            TRIGGER_LATENCY.labels().observe(latency)
+        TRIGGERS.labels(outcome, "met" if met else "missed").inc()
+        self._timelines.append(timeline)
+        self._events.append((time.time(), not met))
+
+        breakdown = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in segments.items())
+        log = logger.info if met else logger.warning
+        log(
+            f"⏱️  Trigger {outcome} for policy {timeline.policy_id}: "
+            f"{f'{latency:.1f}s' if latency is not None else 'n/a'} "
+            f"(target {self.target_seconds:.0f}s) - {breakdown}",
+            extra={"trigger": True, "slo_met": met, **timeline.to_dict()}
+        )
+        self._check_alerts()
+        return met
+
+    def _burn_rate(self, seconds: float, now: float) -> float:
+        total = bad = 0
+        for at, is_bad in reversed(self._events):
+            if now - at > seconds:
+                break
+            total += 1
+            bad += is_bad
+        return bad / total / max(1.0 - self.objective, 1e-9) if total else 0.0
+
+    def burn_rates(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Error budget burn rate per window (1.0 = burning exactly the budget)"""
+        now = time.time() if now is None else now
+        return {label: round(self._burn_rate(seconds, now), 3) for label, seconds in BURN_WINDOWS.items()}
+
+    def alerts(self, now: Optional[float] = None) -> Dict[str, bool]:
+        """Multi-window burn rate alerts by severity"""
+        now = time.time() if now is None else now
+        return {
+            severity: self._burn_rate(long_window, now) > factor and self._burn_rate(short_window, now) > factor
+            for severity, long_window, short_window, factor in BURN_ALERTS
+        }
+
+    def _check_alerts(self) -> None:
+        for severity, firing in self.alerts().items():
+            if firing and not self._alerting[severity]:
+                logger.warning(
+                    f"🔥 Trigger latency SLO burn alert ({severity}): burn rates {self.burn_rates()}",
+                    extra={"slo_alert": severity}
+                )
+            elif not firing and self._alerting[severity]:
+                logger.info(f"Trigger latency SLO burn alert ({severity}) resolved", extra={"slo_alert": severity})
+            self._alerting[severity] = firing
+
+    def _window_quantiles(self) -> Dict[str, Dict[str, float]]:
+        samples: Dict[str, List[float]] = {name: [] for name, *_ in SEGMENTS}
+        samples["total"] = []
+        for timeline in list(self._timelines):
+            for name, seconds in timeline.segments().items():
+                samples[name].append(seconds)
+            if timeline.latency is not None:
+                samples["total"].append(timeline.latency)
+        quantiles = {}
+        for name, values in samples.items():
+            if values:
+                ordered = sorted(values)
+                quantiles[name] = {str(q): _percentile(ordered, q) for q in _QUANTILES}
+        return quantiles
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """p50/p90/p99 seconds per segment and in total over the window"""
+        return {
+            name: {f"p{round(float(q) * 100)}": round(value, 3) for q, value in quantiles.items()}
+            for name, quantiles in self._window_quantiles().items()
+        }
+
+    def budget_share(self) -> Dict[str, float]:
+        """Share of confirmed-trigger latency spent in each segment"""
+        totals: Dict[str, float] = {}
+        for timeline in list(self._timelines):
+            if timeline.latency is None:
+                continue
+            for name, seconds in timeline.segments().items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        overall = sum(totals.values())
+        return {name: round(seconds / overall, 3) for name, seconds in totals.items()} if overall else {}
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Per-trigger breakdowns, newest first"""
+        return [timeline.to_dict() for timeline in list(reversed(self._timelines))[:limit]]
+
+    def status(self, limit: int = 20) -> Dict[str, Any]:
+        met = sum(1 for timeline in self._timelines if timeline.outcome == OUTCOME_CONFIRMED
+                  and timeline.latency is not None and timeline.latency <= self.target_seconds)
+        return {
+            "target_seconds": self.target_seconds,
+            "objective": self.objective,
+            "triggers": len(self._timelines),
+            "met": met,
+            "percentiles_s": self.percentiles(),
+            "budget_share": self.budget_share(),
+            "burn_rates": self.burn_rates(),
+            "alerts": self.alerts(),
+            "recent": self.recent(limit),
+        }
+
+
+# Singleton instance
+_tracker_instance: Optional[TriggerLatencyTracker] = None
+
+
+def get_trigger_slo() -> TriggerLatencyTracker:
+    """
+    Get or create the singleton TriggerLatencyTracker
+
+    Returns:
+        TriggerLatencyTracker: Configured from HYPERION_TRIGGER_SLO_SECONDS /
+        HYPERION_TRIGGER_SLO_OBJECTIVE / HYPERION_TRIGGER_SLO_WINDOW
+    """
+    global _tracker_instance
+
+    if _tracker_instance is None:
+        _tracker_instance = TriggerLatencyTracker(
+            target_seconds=float(os.getenv("HYPERION_TRIGGER_SLO_SECONDS", "60")),
+            objective=float(os.getenv("HYPERION_TRIGGER_SLO_OBJECTIVE", "0.99")),
+            window=int(os.getenv("HYPERION_TRIGGER_SLO_WINDOW", "500")),
+        )
+
+    return _tracker_instance
+
+
+_registry.callback_gauge(
+    "hyperion_trigger_latency_window_seconds",
+    "Oracle trigger latency percentiles per segment over the recent trigger window",
+    lambda: {
+        (segment, q): value
+        for segment, quantiles in get_trigger_slo()._window_quantiles().items()
+        for q, value in quantiles.items()
+    },
+    ("segment", "quantile"),
+)
+_registry.callback_gauge(
+    "hyperion_trigger_slo_burn_rate",
+    "Trigger latency SLO error budget burn rate",
+    lambda: {(window,): rate for window, rate in get_trigger_slo().burn_rates().items()},
+    ("window",),
+)
+_registry.callback_gauge(
+    "hyperion_trigger_slo_alert",
+    "Trigger latency SLO multi-window burn alert (1 = firing)",
+    lambda: {(severity,): float(firing) for severity, firing in get_trigger_slo().alerts().items()},
+    ("severity",),
+)
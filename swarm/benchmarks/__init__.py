@@ -0,0 +1,4 @@
+"""
+Hyperion AI Backend - Benchmarks Package
+Load and latency benchmarks (run from swarm/: python -m benchmarks.<name>)
+"""
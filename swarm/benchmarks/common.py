@@ -0,0 +1,106 @@
+"""
+Hyperion AI Backend - Benchmark Helpers
+Shared percentile math, event-loop lag probing and in-process servers
+"""
+
+import asyncio
+import math
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty sample)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values: List[float], scale: float = 1000.0) -> Dict[str, float]:
+    """p50/p99/max of a sample, scaled (seconds -> ms by default)"""
+    return {
+        "p50": round(percentile(values, 50) * scale, 2),
+        "p99": round(percentile(values, 99) * scale, 2),
+        "max": round(max(values, default=0.0) * scale, 2),
+    }
+
+
+class LoopLagProbe:
+    """
+    Measures event-loop lag by scheduling a sleep and timing the overshoot
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+
+
+def free_port() -> int:
+    """Ask the OS for an unused TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BackgroundServer:
+    """
+    Runs an ASGI app with uvicorn on its own thread and event loop,
+    with a LoopLagProbe attached to the server loop
+    """
+
+    def __init__(self, app, port: Optional[int] = None, log_level: str = "warning"):
+        self.port = port or free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.lag_probe = LoopLagProbe()
+        self._server = uvicorn.Server(uvicorn.Config(
+            app, host="127.0.0.1", port=self.port, log_level=log_level, lifespan="on"
+        ))
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        async def serve():
+            self.lag_probe.start()
+            try:
+                await self._server.serve()
+            finally:
+                self.lag_probe.stop()
+
+        loop.run_until_complete(serve())
+        loop.close()
+
+    def __enter__(self) -> "BackgroundServer":
+        self._thread.start()
+        deadline = time.time() + 30
+        while not self._server.started:
+            if time.time() > deadline or not self._thread.is_alive():
+                raise RuntimeError("Benchmark server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
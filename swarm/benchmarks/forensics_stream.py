@@ -0,0 +1,158 @@
+"""
+Hyperion AI Backend - Forensics SSE Load Benchmark
+
+Drives N concurrent clients against /api/v1/forensics/stream and reports
+TTFB, stream duration percentiles, aggregate chunks/s and server event-loop lag.
+
+By default the app runs in-process on the fake model backend, so no Gemini
+quota is used:
+
+    cd swarm
+    python -m benchmarks.forensics_stream --clients 50 --requests 4 --latency-ms 300
+
+Point --url at a running deployment to benchmark it instead (loop lag is only
+available in-process).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.common import BackgroundServer, summarize
+
+STREAM_PATH = "/api/v1/forensics/stream"
+
+REQUEST_BODY = {
+    "oracle_payload": {
+        "policy_id": "d5e6e2e1a6e1e9e8e7e6e5e4e3e2e1e0",
+        "location_id": "miami_beach_buoy_12",
+        "wind_speed": 45.5,
+        "measurement_time": 1699564800,
+        "threshold": 40.0,
+        "nonce": 42,
+    },
+    "report_mode": "llm",
+}
+
+
+async def run_stream(client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+    """Run one SSE request and time it"""
+    start = time.perf_counter()
+    ttfb: Optional[float] = None
+    chunks = 0
+    error: Optional[str] = None
+
+    try:
+        async with client.stream("POST", url, json=REQUEST_BODY) as response:
+            if response.status_code != 200:
+                error = f"HTTP {response.status_code}"
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                if ttfb is None:
+                    ttfb = time.perf_counter() - start
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                if "[ERROR]" in data:
+                    error = data
+                chunks += 1
+    except httpx.HTTPError as e:
+        error = str(e)
+
+    return {
+        "ttfb": ttfb,
+        "duration": time.perf_counter() - start,
+        "chunks": chunks,
+        "error": error,
+    }
+
+
+async def run_clients(base_url: str, clients: int, requests: int) -> Dict[str, Any]:
+    """Run `clients` concurrent loops of `requests` sequential streams each"""
+    url = base_url.rstrip("/") + STREAM_PATH
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(timeout=120, limits=limits) as client:
+        async def client_loop() -> List[Dict[str, Any]]:
+            return [await run_stream(client, url) for _ in range(requests)]
+
+        wall_start = time.perf_counter()
+        per_client = await asyncio.gather(*(client_loop() for _ in range(clients)))
+        wall = time.perf_counter() - wall_start
+
+    results = [r for batch in per_client for r in batch]
+    ok = [r for r in results if r["error"] is None]
+    total_chunks = sum(r["chunks"] for r in results)
+
+    return {
+        "clients": clients,
+        "requests": len(results),
+        "errors": len(results) - len(ok),
+        "wall_s": round(wall, 3),
+        "ttfb_ms": summarize([r["ttfb"] for r in ok if r["ttfb"] is not None]),
+        "duration_ms": summarize([r["duration"] for r in ok]),
+        "chunks_per_s": round(total_chunks / wall, 1) if wall else 0.0,
+    }
+
+
+def configure_fake_backend(args: argparse.Namespace) -> None:
+    """Point the in-process app at the fake backend with the given profile"""
+    os.environ.update({
+        "FORENSICS_MODEL_BACKEND": "fake",
+        "FORENSICS_FAKE_LATENCY_MS": str(args.latency_ms),
+        "FORENSICS_FAKE_JITTER_MS": str(args.jitter_ms),
+        "FORENSICS_FAKE_ERROR_RATE": str(args.error_rate),
+        "FORENSICS_FAKE_TOKENS_PER_SEC": str(args.tokens_per_sec),
+        "FORENSICS_FAKE_TOKENS": str(args.tokens),
+        "GEMINI_RATE_LIMIT": str(args.rate_limit),
+        "FORENSICS_JOB_DB": os.path.join(tempfile.gettempdir(), "hyperion_bench_jobs.db"),
+    })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=20, help="Concurrent SSE clients")
+    parser.add_argument("--requests", type=int, default=3, help="Sequential streams per client")
+    parser.add_argument("--url", help="Benchmark a running server instead of in-process")
+    parser.add_argument("--latency-ms", type=float, default=300, help="Fake time to first token")
+    parser.add_argument("--jitter-ms", type=float, default=50, help="Fake jitter")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fake error probability")
+    parser.add_argument("--tokens-per-sec", type=float, default=200, help="Fake throughput")
+    parser.add_argument("--tokens", type=int, default=300, help="Fake tokens per report")
+    parser.add_argument("--rate-limit", type=int, default=100000, help="GEMINI_RATE_LIMIT for the run")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+
+    if args.url:
+        result = asyncio.run(run_clients(args.url, args.clients, args.requests))
+    else:
+        configure_fake_backend(args)
+        from app.main import app
+
+        with BackgroundServer(app) as server:
+            result = asyncio.run(run_clients(server.url, args.clients, args.requests))
+            result["loop_lag_ms"] = summarize(server.lag_probe.samples)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"Clients: {result['clients']}  Requests: {result['requests']}  "
+          f"Errors: {result['errors']}  Wall: {result['wall_s']}s")
+    print(f"TTFB ms          p50={result['ttfb_ms']['p50']}  p99={result['ttfb_ms']['p99']}")
+    print(f"Stream ms        p50={result['duration_ms']['p50']}  p99={result['duration_ms']['p99']}")
+    print(f"Chunks/s         {result['chunks_per_s']}")
+    if "loop_lag_ms" in result:
+        lag = result["loop_lag_ms"]
+        print(f"Loop lag ms      p50={lag['p50']}  p99={lag['p99']}  max={lag['max']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Hyperion AI Backend - Logging Mode Throughput Benchmark
+
+Serves an oracle-shaped endpoint that logs like a Phase 6 /oracle/run (about
+twenty INFO lines including "=" banners, one trigger decision) and measures
+request throughput per logging mode (see app/services/log_config.py):
+
+    off           INFO disabled (WARNING and above only)
+    text          classic lines, written synchronously on the event loop
+    json          JSON lines through the QueueHandler/listener thread
+    json-sampled  json with routine lines of the pipeline loggers kept at 10%
+
+    cd swarm
+    python -m benchmarks.logging_modes --clients 20 --requests 50
+
+Each mode runs uvicorn in its own process with log output going to --output
+(a temporary file by default), so real writes are measured rather than a
+terminal, and the load generator does not share the server's GIL.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI
+
+from app.services.log_config import LOG_MODE_JSON, LOG_MODE_TEXT, configure_logging
+from benchmarks.common import free_port, summarize
+
+MODES = ["off", "text", "json", "json-sampled"]
+
+main_logger = logging.getLogger("bench.main")
+agent_logger = logging.getLogger("bench.agents")
+
+
+def create_app() -> FastAPI:
+    """App whose /oracle/run logs like the Phase 6 pipeline"""
+    app = FastAPI()
+
+    @app.post("/oracle/run")
+    async def run_oracle(policy_id: str = "bench", wind_speed: int = 3000):
+        main_logger.info("=" * 80)
+        main_logger.info("🔍 Phase 6 Oracle Request Received")
+        main_logger.info(f"Policy ID: {policy_id}")
+        main_logger.info("Coordinates: 25.7617, -80.1918")
+        main_logger.info("=" * 80)
+        for agent, stage in (("Meteorologist", "fetch"), ("Auditor", "validate"), ("Arbiter", "decide")):
+            agent_logger.info(f"🤖 [{agent}] Starting: {stage}")
+            await asyncio.sleep(0)
+            agent_logger.info(f"✅ [{agent}] Completed: {stage} (0.01s)")
+            agent_logger.info(f"📊 [{agent}] Confidence: 0.95")
+        trigger = wind_speed >= 2500
+        agent_logger.info(f"⚖️  Decision: {'TRIGGER' if trigger else 'NO TRIGGER'}", extra={"trigger": trigger})
+        main_logger.info("=" * 80)
+        main_logger.info("✅ Pipeline complete in 0.03s")
+        main_logger.info("=" * 80)
+        if trigger:
+            main_logger.warning(f"⚠️  THRESHOLD EXCEEDED! Wind: {wind_speed} >= 2500")
+        main_logger.info("=" * 80)
+        return {"policy_id": policy_id, "trigger": trigger}
+
+    return app
+
+
+def serve_app() -> FastAPI:
+    """uvicorn factory: configure the mode in BENCH_LOG_MODE, then build the app"""
+    mode = os.environ["BENCH_LOG_MODE"]
+    if mode == "off":
+        configure_logging("bench", mode=LOG_MODE_TEXT, level=logging.WARNING)
+    elif mode == "text":
+        configure_logging("bench", mode=LOG_MODE_TEXT)
+    else:
+        configure_logging("bench", mode=LOG_MODE_JSON)
+    return create_app()
+
+
+async def drive(url: str, clients: int, requests: int) -> Dict[str, Any]:
+    """`clients` concurrent loops of `requests` sequential POSTs each"""
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        async def loop() -> None:
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = await client.post(url + "/oracle/run")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(loop() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+
+    return {"rps": round(len(latencies) / elapsed, 1), **summarize(latencies)}
+
+
+def run_mode(mode: str, args: argparse.Namespace, output) -> Dict[str, Any]:
+    port = free_port()
+    env = {
+        **os.environ,
+        "BENCH_LOG_MODE": mode,
+        "HYPERION_LOG_SAMPLING": "bench.main=0.1,bench.agents=0.1" if mode == "json-sampled" else "",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.logging_modes:serve_app", "--factory",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        env=env, stdout=output, stderr=output,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.time() + 30
+        while True:
+            try:
+                httpx.get(url + "/docs", timeout=1.0)
+                break
+            except httpx.TransportError:
+                if time.time() > deadline or process.poll() is not None:
+                    raise RuntimeError(f"Benchmark server for {mode} failed to start")
+                time.sleep(0.05)
+        return asyncio.run(drive(url, args.clients, args.requests))
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES)
+    parser.add_argument("--clients", type=int, default=20, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per client")
+    parser.add_argument("--output", help="Log file (default: a temporary file)")
+    args = parser.parse_args()
+
+    path = args.output or tempfile.mkstemp(prefix="hyperion-logbench-", suffix=".log")[1]
+    results = {}
+    with open(path, "w") as output:
+        for mode in args.modes:
+            before = os.path.getsize(path)
+            results[mode] = run_mode(mode, args, output)
+            results[mode]["log_kb"] = round((os.path.getsize(path) - before) / 1024, 1)
+
+    print(f"/oracle/run throughput ({args.clients} clients x {args.requests} requests, log: {path}):")
+    print(f"  {'mode':<13} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'log KB':>8}")
+    for mode, r in results.items():
+        print(f"  {mode:<13} {r['rps']:>8.1f} {r['p50']:>8.2f} {r['p99']:>8.2f} {r['log_kb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Hyperion AI Backend - Time-To-First-Request Benchmark
+
+Starts the app under uvicorn in a fresh process per run and measures the time
+from process spawn until the first successful response, once per startup mode
+(see app/services/startup.py):
+
+    cd swarm
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --modes lazy --max-ms 1500   # regression gate
+
+--app-dir points at another app (e.g. ../app/phase6) and --path at another
+first request. With --max-ms the exit status is 1 when the median of any mode
+exceeds the budget, so the benchmark can guard CI against new eager imports.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.common import free_port, summarize
+
+
+def time_to_first_request(app_dir: str, app: str, path: str, mode: str, timeout: float) -> float:
+    """Seconds from spawning the server until `path` first answers 200"""
+    port = free_port()
+    env = {**os.environ, "HYPERION_STARTUP_MODE": mode, "HYPERION_WARMUP": "0"}
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=app_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        url = f"http://127.0.0.1:{port}{path}"
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited: {process.stderr.read().decode()[-2000:]}")
+            try:
+                if httpx.get(url, timeout=1.0).status_code == 200:
+                    return time.perf_counter() - start
+            except httpx.TransportError:
+                pass
+            time.sleep(0.005)
+        raise RuntimeError(f"No successful response from {url} within {timeout}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for mode in args.modes:
+        samples: List[float] = [
+            time_to_first_request(args.app_dir, args.app, args.path, mode, args.timeout)
+            for _ in range(args.runs)
+        ]
+        results[mode] = {"median": round(statistics.median(samples) * 1000, 2), **summarize(samples)}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app-dir", default=".", help="Directory containing the app package")
+    parser.add_argument("--app", default="app.main:app", help="ASGI app import string")
+    parser.add_argument("--path", default="/health", help="First request (GET)")
+    parser.add_argument("--modes", nargs="+", default=["lazy", "eager"], choices=["lazy", "eager"])
+    parser.add_argument("--runs", type=int, default=3, help="Server starts per mode")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait per start")
+    parser.add_argument("--max-ms", type=float, help="Fail if a mode's median exceeds this")
+    args = parser.parse_args()
+
+    results = run(args)
+    print(f"Time to first request ({args.path}, {args.runs} runs, ms):")
+    for mode, stats in results.items():
+        print(f"  {mode:<6} median {stats['median']:>9.1f}  p99 {stats['p99']:>9.1f}  max {stats['max']:>9.1f}")
+
+    if args.max_ms is not None:
+        slow = [mode for mode, stats in results.items() if stats["median"] > args.max_ms]
+        if slow:
+            print(f"FAIL: {', '.join(slow)} over the {args.max_ms:.0f}ms budget")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
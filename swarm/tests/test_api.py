@@ -26,3 +26,412 @@ def test_health_check():
     data = response.json()
     assert data["status"] == "healthy"
     assert "components" in data
+
+
+def test_app_import_defers_heavy_sdks():
+    """Importing the app must not pull in pycardano or the Gemini SDK"""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    probe = "import sys, app.main; print(sorted(m for m in ('pycardano', 'google.generativeai') if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=Path(__file__).resolve().parents[1], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_module_warmer_eager_and_background():
+    """Eager mode imports at startup; background mode imports after a delay"""
+    import asyncio
+    from app.services.startup import ModuleWarmer, profile_imports
+
+    async def scenario():
+        eager = ModuleWarmer(["json", "not_a_real_module"], mode="eager")
+        await eager.start()
+        assert eager.state == "done"
+        assert eager.timings["json"] is not None
+        assert eager.timings["not_a_real_module"] is None
+
+        lazy = ModuleWarmer(["json"], mode="lazy", background=True, delay_seconds=0.01)
+        await lazy.start()
+        assert lazy.state == "idle"
+        await asyncio.sleep(0.2)
+        assert lazy.status()["state"] == "done"
+        await lazy.stop()
+
+    asyncio.run(scenario())
+
+    entries = profile_imports("json")
+    assert any(e["module"] == "json" and e["depth"] == 0 for e in entries)
+
+
+def test_health_prober_caches_dependency_status():
+    """Health reads the cached snapshot; checks only run in probe rounds"""
+    import asyncio
+    from app.services.health_probe import HealthProber
+
+    calls = {"weather": 0}
+
+    async def weather():
+        calls["weather"] += 1
+        return {"http_status": 401}
+
+    async def chain():
+        raise RuntimeError("blockfrost unreachable")
+
+    async def signer():
+        await asyncio.sleep(1)
+
+    async def scenario():
+        prober = HealthProber(interval_seconds=60, timeout_seconds=0.05)
+        prober.register("weather_provider", weather)
+        prober.register("chain_context", chain, critical=False)
+        assert prober.snapshot()["components"]["weather_provider"] == "pending"
+
+        await prober.probe_once()
+        snapshot = prober.snapshot()
+        assert snapshot["status"] == "degraded"
+        assert snapshot["dependencies"]["weather_provider"]["detail"] == {"http_status": 401}
+        assert snapshot["dependencies"]["chain_context"]["consecutive_failures"] == 1
+        assert snapshot["dependencies"]["weather_provider"]["latency_ms"] >= 0
+
+        for _ in range(100):
+            prober.snapshot()
+        assert calls["weather"] == 1
+
+        prober.register("signer", signer)
+        await prober.probe_once()
+        assert prober.snapshot()["status"] == "unhealthy"
+        assert "timed out" in prober.dependency("signer")["error"]
+
+    asyncio.run(scenario())
+
+
+def test_metrics_endpoint_exposes_route_histograms():
+    """/metrics renders cumulative buckets labelled by route template"""
+    from app.services.metrics import MetricsRegistry, count_cache
+
+    registry = MetricsRegistry()
+    latency = registry.histogram("test_latency_seconds", "Test latency", ("route",), buckets=(0.1, 1.0))
+    latency.labels("/a").observe(0.05)
+    latency.labels("/a").observe(0.5)
+    latency.labels("/a").observe(5)
+    rendered = registry.render()
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in rendered
+    assert 'test_latency_seconds_bucket{route="/a",le="1"} 2' in rendered
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 3' in rendered
+    assert 'test_latency_seconds_count{route="/a"} 3' in rendered
+
+    count_cache("test_cache", True)
+    count_cache("test_cache", False)
+    client.get("/api/v1/oracle/health")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'route="/api/v1/oracle/health",status="200"' in body
+    assert 'hyperion_cache_hit_ratio{cache="test_cache"} 0.5' in body
+    assert "hyperion_active_monitors 0" in body
+
+
+def test_metric_families_must_define_children():
+    """Labelled metric families without _new_child fail on construction"""
+    from app.services.metrics import LabelledMetric, Metric
+
+    class Incomplete(LabelledMetric):
+        kind = "counter"
+
+    with pytest.raises(TypeError, match="_new_child"):
+        Incomplete("hyperion_incomplete_total", "Missing child factory")
+    with pytest.raises(TypeError, match="render"):
+        Metric("hyperion_bare", "Abstract family")
+
+
+def test_log_sampling_keeps_warnings_and_triggers():
+    """Sampled JSON logging drops routine lines and banners only"""
+    import json
+    import logging
+    from app.services.log_config import JsonFormatter, SamplingFilter, parse_sampling
+
+    sampler = SamplingFilter(parse_sampling("app.agents=0.25,bad,app.main=x"))
+    assert sampler.rates == {"app.agents": 0.25}
+
+    def record(name, level, msg, **extra):
+        entry = logging.LogRecord(name, level, __file__, 1, msg, None, None)
+        entry.__dict__.update(extra)
+        return entry
+
+    kept = [sampler.filter(record("app.agents.arbiter", logging.INFO, "routine")) for _ in range(8)]
+    assert kept.count(True) == 2
+    assert sampler.filter(record("app.agents", logging.WARNING, "slow provider"))
+    assert sampler.filter(record("app.agents", logging.INFO, "Decision: TRIGGER", trigger=True))
+    assert sampler.filter(record("app.other", logging.INFO, "unsampled"))
+    assert not sampler.filter(record("app.other", logging.INFO, "=" * 80))
+
+    line = JsonFormatter("swarm").format(record("app.agents", logging.INFO, "Decision", trigger=True))
+    assert json.loads(line) | {"ts": None} == {
+        "ts": None, "level": "INFO", "app": "swarm", "logger": "app.agents",
+        "message": "Decision", "trigger": True,
+    }
+
+
+def test_loop_watchdog_captures_blocking_stack(monkeypatch):
+    """A blocking call is reported with the stack that blocked the loop"""
+    import asyncio
+    import time
+    from app.services.loop_watchdog import LoopWatchdog
+
+    def blocking_signature():
+        time.sleep(0.3)
+
+    async def scenario():
+        watchdog = LoopWatchdog(interval_seconds=0.02, threshold_seconds=0.1)
+        await watchdog.start()
+        await asyncio.sleep(0.1)
+        blocking_signature()
+        await asyncio.sleep(0.1)
+        await watchdog.stop()
+        return watchdog.status()
+
+    status = asyncio.run(scenario())
+    assert len(status["stalls"]) == 1
+    stall = status["stalls"][0]
+    assert any("blocking_signature" in line for line in stall["stack"])
+    assert stall["blocked_ms"] >= 250
+    assert status["lag_ms"]["max"] >= 250
+
+    assert client.get("/debug/loop").status_code == 404
+    monkeypatch.setenv("HYPERION_DEBUG_TOKEN", "s3cret")
+    assert client.get("/debug/loop", headers={"X-Debug-Token": "wrong"}).status_code == 401
+    response = client.get("/debug/loop", headers={"X-Debug-Token": "s3cret"})
+    assert response.status_code == 200
+    assert set(response.json()["lag_ms"]) == {"p50", "p90", "p99", "max"}
+
+
+def test_on_demand_profiling_and_memory_diff(monkeypatch):
+    """Authenticated requests can be profiled; memory snapshots diff"""
+    import asyncio
+    import time
+    from app.services.profiling import StackSampler, get_profile_store
+
+    def busy():
+        end = time.perf_counter() + 0.05
+        while time.perf_counter() < end:
+            pass
+
+    async def handler():
+        busy()
+        await asyncio.sleep(0.05)
+
+    async def scenario():
+        import threading
+        task = asyncio.ensure_future(handler())
+        sampler = StackSampler(threading.get_ident(), 0.002, asyncio.get_running_loop(), task).start()
+        await task
+        return sampler.stop()
+
+    profile = asyncio.run(scenario())
+    lines = profile["folded"].strip().splitlines()
+    assert profile["samples"] > 0
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("test_api:busy" in line for line in lines)
+    assert any("test_api:handler;asyncio.tasks:sleep;[awaiting Future]" in line for line in lines)
+
+    monkeypatch.setenv("HYPERION_DEBUG_TOKEN", "s3cret")
+    auth = {"X-Debug-Token": "s3cret"}
+    response = client.get("/", headers={**auth, "X-Debug-Profile": "1"})
+    profile_id = response.headers["X-Profile-Id"]
+    assert get_profile_store().get(profile_id)["target"] == "GET /"
+    assert "X-Profile-Id" not in client.get("/", headers={"X-Debug-Profile": "1"}).headers
+    assert client.get(f"/debug/profiles/{profile_id}", headers=auth).status_code == 200
+
+    window = client.post("/debug/profile?seconds=0.1", headers=auth)
+    assert window.status_code == 200
+    assert window.headers["X-Profile-Id"] in {p["id"] for p in client.get("/debug/profiles", headers=auth).json()["profiles"]}
+
+    first = client.post("/debug/memory/snapshot?top=5", headers=auth).json()
+    hoard = [bytearray(1024) for _ in range(2000)]
+    second = client.post("/debug/memory/snapshot?top=5", headers=auth).json()
+    assert first["snapshot"] + 1 == second["snapshot"]
+    assert second["top"][0]["size_diff_kb"] >= 1000
+    assert client.delete("/debug/memory", headers=auth).json()["tracing"] is False
+    del hoard
+
+
+def test_memory_snapshot_runs_off_the_event_loop(monkeypatch):
+    """The tracemalloc walk never runs on the loop thread"""
+    import asyncio
+    from app.services.profiling import get_memory_tracker
+
+    tracker = get_memory_tracker()
+    on_loop = []
+    original = tracker.snapshot
+
+    def snapshot(top=25):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return original(top)
+
+    monkeypatch.setattr(tracker, "snapshot", snapshot)
+    monkeypatch.setenv("HYPERION_DEBUG_TOKEN", "s3cret")
+    auth = {"X-Debug-Token": "s3cret"}
+    assert client.post("/debug/memory/snapshot?top=1", headers=auth).status_code == 200
+    assert client.delete("/debug/memory", headers=auth).status_code == 200
+    assert on_loop == [False]
+
+
+def test_tracing_spans_propagate_and_export_otlp(monkeypatch):
+    """Spans nest through contextvars, httpx calls and response headers"""
+    import asyncio
+    import httpx
+    from app.services.tracing import TracingTransport, get_tracer, span, traced
+
+    tracer = get_tracer()
+
+    @traced("agent.sign")
+    def sign():
+        return b"sig"
+
+    async def pipeline():
+        transport = TracingTransport(httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"traceparent": request.headers["traceparent"]})
+        ))
+        async with httpx.AsyncClient(transport=transport) as http:
+            with tracer.start_trace("oracle.pipeline") as root:
+                with span("agent.fetch"):
+                    upstream = (await http.get("https://weather.test/now")).json()["traceparent"]
+                sign()
+            return root.trace_id, upstream
+
+    # Sampling off: no trace, spans are no-ops
+    monkeypatch.setattr(tracer, "sample_rate", 0.0)
+    assert client.get("/").headers.get("X-Trace-Id") is None
+    with span("orphan") as orphan:
+        assert orphan is None
+
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    trace_id, upstream = asyncio.run(pipeline())
+    assert upstream.split("-")[1] == trace_id
+    spans = tracer.trace(trace_id)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    by_name = {s["name"]: s for s in spans}
+    assert set(by_name) == {"oracle.pipeline", "agent.fetch", "HTTP GET", "agent.sign"}
+    assert by_name["HTTP GET"]["parentSpanId"] == by_name["agent.fetch"]["spanId"]
+    assert by_name["agent.sign"]["parentSpanId"] == by_name["oracle.pipeline"]["spanId"]
+    assert by_name["HTTP GET"]["kind"] == 3
+
+    incoming = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    response = client.get("/", headers={"traceparent": incoming})
+    assert response.headers["X-Trace-Id"] == "0af7651916cd43dd8448eb211c80319c"
+    server = tracer.trace("0af7651916cd43dd8448eb211c80319c")["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+    assert server["parentSpanId"] == "b7ad6b7169203331" and server["kind"] == 2
+
+
+def test_trigger_latency_slo_breakdown_and_burn_alerts(monkeypatch):
+    """Trigger timelines give segment percentiles, burn rates and alerts"""
+    import app.services.trigger_slo as trigger_slo
+
+    tracker = trigger_slo.TriggerLatencyTracker(target_seconds=60.0, objective=0.99)
+    monkeypatch.setattr(trigger_slo, "_tracker_instance", tracker)
+
+    def trigger(observed, confirm_after):
+        timeline = trigger_slo.TriggerTimeline("ab" * 28, "miami")
+        for milestone, at in (
+            ("observed", observed), ("fetch_started", observed + 5), ("fetched", observed + 6),
+            ("decided", observed + 7), ("signed", observed + 7.1), ("submitted", observed + 9),
+        ):
+            timeline.mark(milestone, at)
+        if confirm_after is None:
+            return tracker.finish(timeline, trigger_slo.OUTCOME_UNCONFIRMED)
+        timeline.mark("confirmed", observed + confirm_after)
+        return tracker.finish(timeline, trigger_slo.OUTCOME_CONFIRMED)
+
+    assert trigger(1000.0, 30.0) is True
+    assert trigger(1000.0, 95.0) is False
+    assert trigger(1000.0, None) is False
+    assert tracker.alerts() == {"page": True, "ticket": True}
+
+    status = client.get("/api/v1/oracle/slo").json()
+    assert status["triggers"] == 3 and status["met"] == 1
+    assert status["percentiles_s"]["total"]["p50"] == 30.0
+    assert status["percentiles_s"]["provider_delay"]["p99"] == 5.0
+    assert status["recent"][0]["outcome"] == "unconfirmed"
+    assert status["recent"][1]["segments_s"]["confirmation"] == 86.0
+    assert status["burn_rates"]["5m"] == round((2 / 3) / 0.01, 3)
+
+    metrics = client.get("/metrics").text
+    assert 'hyperion_triggers_total{outcome="confirmed",slo="missed"}' in metrics
+    assert 'hyperion_trigger_slo_alert{severity="page"} 1' in metrics
+    assert 'hyperion_trigger_latency_window_seconds{segment="confirmation",quantile="0.5"} 21' in metrics
+
+
+def test_idempotency_key_replays_trigger_and_joins_in_flight(monkeypatch):
+    """Idempotency-Key replays results, rejects reuse and joins duplicates"""
+    import asyncio
+    import app.api.oracle as oracle_api
+    import app.services.idempotency as idempotency
+
+    store = idempotency.IdempotencyStore(ttl_seconds=60.0, max_entries=10)
+    monkeypatch.setattr(idempotency, "_store_instance", store)
+
+    body = {"oracle_utxo_ref": "ab" * 32 + "#0", "policy_id": "cd" * 28, "location_id": "miami", "wind_speed": 42.5}
+    headers = {"Idempotency-Key": "job-7"}
+
+    # Failures are not remembered: the retry runs again
+    monkeypatch.setattr(oracle_api, "oracle_client", None)
+    assert client.post("/api/v1/oracle/trigger", json=body, headers=headers).status_code == 400
+
+    class FakeOracle:
+        signed = 0
+
+        def sign_oracle_data(self, **fields):
+            FakeOracle.signed += 1
+            return bytes([FakeOracle.signed]) * 64
+
+    monkeypatch.setattr(oracle_api, "oracle_client", FakeOracle())
+    first = client.post("/api/v1/oracle/trigger", json=body, headers=headers)
+    repeat = client.post("/api/v1/oracle/trigger", json=body, headers=headers)
+    assert first.status_code == repeat.status_code == 200
+    assert "Idempotent-Replayed" not in first.headers
+    assert repeat.headers["Idempotent-Replayed"] == "true"
+    assert repeat.json() == first.json() and FakeOracle.signed == 1
+
+    conflict = client.post("/api/v1/oracle/trigger", json={**body, "wind_speed": 10}, headers=headers)
+    assert conflict.status_code == 422
+    assert client.post("/api/v1/oracle/trigger", json=body).status_code == 200
+    assert FakeOracle.signed == 2
+
+    async def scenario():
+        runs = []
+
+        async def execute():
+            runs.append(1)
+            await asyncio.sleep(0.05)
+            return {"nonce": len(runs)}
+
+        results = await asyncio.gather(*[store.run("oracle.run", "storm-1", body, execute) for _ in range(4)])
+        return runs, results
+
+    runs, results = asyncio.run(scenario())
+    assert len(runs) == 1
+    assert [from_earlier for _, from_earlier in results] == [False, True, True, True]
+    assert all(result == {"nonce": 1} for result, _ in results)
+
+    async def retry_after_failure():
+        # A failure whose done callback has not run yet is never replayed
+        failed = asyncio.get_running_loop().create_future()
+        failed.set_exception(RuntimeError("provider down"))
+        fingerprint = idempotency.payload_fingerprint(body)
+        store._entries[("oracle.run", "storm-2")] = idempotency._Entry(fingerprint, failed)
+
+        async def execute():
+            return {"nonce": 2}
+
+        return await store.run("oracle.run", "storm-2", body, execute)
+
+    assert asyncio.run(retry_after_failure()) == ({"nonce": 2}, False)
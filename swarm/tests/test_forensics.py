@@ -0,0 +1,656 @@
+"""
+Hyperion AI Backend - Forensic Reporting Tests
+"""
+
+import os
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+
+# Keep job databases and archived reports out of the working tree
+_DATA_DIR = tempfile.mkdtemp(prefix="hyperion_forensics_")
+os.environ.setdefault("FORENSICS_JOB_DB", os.path.join(_DATA_DIR, "jobs.db"))
+os.environ.setdefault("FORENSICS_ARCHIVE_DIR", os.path.join(_DATA_DIR, "archive"))
+
+from app.main import app
+from app.services.forensic_templates import render_template_report
+
+client = TestClient(app)
+
+ORACLE_PAYLOAD = {
+    "policy_id": "d5e6e2e1a6e1e9e8e7e6e5e4e3e2e1e0",
+    "location_id": "miami_beach_buoy_12",
+    "wind_speed": 45.5,
+    "measurement_time": 1699564800,
+    "threshold": 40.0,
+    "nonce": 42,
+}
+
+
+def test_template_report_mentions_trigger_fields():
+    """Template report states wind, threshold and location"""
+    report = render_template_report(ORACLE_PAYLOAD)
+    assert "45.50 m/s" in report
+    assert "exceeded the agreed threshold of 40.00 m/s" in report
+    assert "miami_beach_buoy_12" in report
+
+
+def test_template_report_below_threshold():
+    """Template report does not claim a payout below threshold"""
+    report = render_template_report({**ORACLE_PAYLOAD, "wind_speed": 30.0})
+    assert "did not exceed" in report
+    assert "no payout" in report
+
+
+def test_template_report_renders_under_a_millisecond():
+    """Template rendering stays well under a millisecond"""
+    runs = 1000
+    start = time.perf_counter()
+    for _ in range(runs):
+        render_template_report(ORACLE_PAYLOAD)
+    assert (time.perf_counter() - start) / runs < 0.001
+
+
+def test_stream_template_mode():
+    """Template mode streams SSE chunks without a Gemini key"""
+    response = client.post(
+        "/api/v1/forensics/stream",
+        json={"oracle_payload": ORACLE_PAYLOAD, "report_mode": "template"},
+    )
+    assert response.status_code == 200
+    assert "data: FORENSIC REPORT" in response.text
+    assert response.text.endswith("data: [DONE]\n\n")
+
+
+def sse_events(text):
+    """Parse SSE text into (id, data) pairs"""
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = block.split("\n")
+        event_id = next((l[4:] for l in lines if l.startswith("id: ")), None)
+        data = "\n".join(l[6:] for l in lines if l.startswith("data: "))
+        events.append((event_id, data))
+    return events
+
+
+def test_stream_resumes_from_last_event_id():
+    """Reconnecting with Last-Event-ID replays only the missed chunks"""
+    body = {"oracle_payload": ORACLE_PAYLOAD, "report_mode": "template"}
+    with TestClient(app) as stream_client:
+        first = sse_events(stream_client.post("/api/v1/forensics/stream", json=body).text)
+        assert first[-1][1] == "[DONE]"
+        chunks = [data for _, data in first[:-1]]
+
+        resumed = stream_client.post(
+            "/api/v1/forensics/stream", json=body,
+            headers={"Last-Event-ID": first[1][0]},
+        )
+        events = sse_events(resumed.text)
+        assert [data for _, data in events[:-1]] == chunks[2:]
+        assert events[-1] == first[-1]
+
+        # Unknown streams start a fresh generation
+        fresh = stream_client.post(
+            "/api/v1/forensics/stream", json=body,
+            headers={"Last-Event-ID": "unknown:3"},
+        )
+        assert [data for _, data in sse_events(fresh.text)[:-1]] == chunks
+
+
+def test_stream_cancelled_when_last_client_disconnects():
+    """Upstream generation stops once no client is reading"""
+    import asyncio
+    from app.services.forensic_streams import ForensicStreamHub
+
+    async def endless():
+        while True:
+            await asyncio.sleep(0.001)
+            yield "token " * 4
+
+    async def scenario():
+        hub = ForensicStreamHub(cancel_grace_seconds=0)
+        session = hub.start("policy", endless)
+        events = hub.sse_events(session)
+        for _ in range(3):
+            await events.__anext__()
+        await events.aclose()  # Client went away
+        await asyncio.sleep(0.05)
+        return hub, session
+
+    hub, session = asyncio.run(scenario())
+    assert session.task.cancelled()
+    status = hub.status()
+    assert status["stats"]["cancelled"] == 1
+    assert status["stats"]["client_disconnects"] == 1
+    assert status["stats"]["tokens_generated"] == session.tokens
+    assert status["stats"]["tokens_wasted"] == session.tokens - session.delivered_tokens
+
+
+def test_slow_consumer_backlog_is_coalesced():
+    """A client far behind receives its backlog as one event"""
+    import asyncio
+    from app.services.forensic_streams import ForensicStreamHub
+
+    async def chunks():
+        for i in range(20):
+            yield f"{i},"
+
+    async def scenario():
+        hub = ForensicStreamHub(client_buffer=5)
+        session = hub.start("policy", chunks)
+        await session.task  # Generation finished before the client reads
+        events = [event async for event in hub.sse_events(session)]
+        return hub, events
+
+    hub, events = asyncio.run(scenario())
+    assert len(events) == 2
+    assert events[0].endswith("data: " + "".join(f"{i}," for i in range(20)) + "\n\n")
+    assert hub.stats["slow_coalesced"] == 1
+
+
+def test_generate_template_mode():
+    """Static generation honours the template mode"""
+    response = client.post(
+        "/api/v1/forensics/generate",
+        json={"oracle_payload": ORACLE_PAYLOAD, "report_mode": "template"},
+    )
+    assert response.status_code == 200
+    assert "exceeded" in response.json()["report"]
+
+
+def test_invalid_report_mode_rejected():
+    """Unknown report modes are rejected by validation"""
+    response = client.post(
+        "/api/v1/forensics/stream",
+        json={"oracle_payload": ORACLE_PAYLOAD, "report_mode": "fast"},
+    )
+    assert response.status_code == 422
+
+
+def test_report_archive_lookup_and_range_scan(tmp_path):
+    """Archived reports are found by policy and time without full scans"""
+    from app.services.forensic_archive import ForensicReportArchive, build_archive_record
+
+    archive = ForensicReportArchive(str(tmp_path), block_records=4, segment_bytes=256, flush_seconds=0.05)
+    # The request path never opens the archive: records before start() are dropped
+    assert archive.submit(build_archive_record({"oracle_payload": ORACLE_PAYLOAD}, "early")) is False
+    assert archive.status()["stats"]["dropped"] == 1 and archive._thread is None
+    archive.start()
+    for n in range(10):
+        payload = {**ORACLE_PAYLOAD, "policy_id": f"policy_{n % 3}", "measurement_time": 1000 + n}
+        archive.submit(build_archive_record({"oracle_payload": payload}, f"report {n}"))
+    archive.flush()
+
+    assert [r["report"] for r in archive.lookup("policy_1")] == ["report 1", "report 4", "report 7"]
+    assert [r["measurement_time"] for r in archive.range_scan(1003, 1005)] == [1003, 1004, 1005]
+    assert archive.status()["segment"] > 1
+    archive.stop()
+
+    # A torn block after a crash is dropped; indexed records survive a reopen
+    segment = sorted(p for p in os.listdir(tmp_path) if p.startswith("segment-"))[-1]
+    with open(tmp_path / segment, "ab") as handle:
+        handle.write(b"HFAB\x01partial")
+    reopened = ForensicReportArchive(str(tmp_path))
+    reopened.start()
+    assert len(reopened.range_scan(0, 2000, limit=100)) == 10
+    reopened.stop()
+
+
+def test_report_archive_recovers_block_lost_in_os_crash(tmp_path):
+    """Index rows of a block that never reached disk do not shadow later blocks"""
+    from app.services.forensic_archive import ForensicReportArchive, build_archive_record
+
+    def record(n):
+        payload = {**ORACLE_PAYLOAD, "policy_id": "crashed", "measurement_time": 2000 + n}
+        return build_archive_record({"oracle_payload": payload}, f"report {n}")
+
+    archive = ForensicReportArchive(str(tmp_path), block_records=1, flush_seconds=0.05)
+    archive.start()
+    archive.submit(record(0))
+    archive.flush()
+    kept = os.path.getsize(tmp_path / "segment-000001.log")
+    archive.submit(record(1))
+    archive.flush()
+    archive.stop()
+
+    # OS crash: the index committed block 1 but its bytes never hit the disk
+    with open(tmp_path / "segment-000001.log", "r+b") as handle:
+        handle.truncate(kept)
+
+    reopened = ForensicReportArchive(str(tmp_path), block_records=1, flush_seconds=0.05)
+    reopened.start()
+    assert [r["report"] for r in reopened.lookup("crashed")] == ["report 0"]
+    reopened.submit(record(2))
+    reopened.flush()
+    assert [r["report"] for r in reopened.lookup("crashed")] == ["report 0", "report 2"]
+    reopened.stop()
+
+
+def test_generated_reports_are_archived(tmp_path, monkeypatch):
+    """/generate stores the report in the archive"""
+    from app.services import forensic_archive
+
+    monkeypatch.setenv("FORENSICS_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setenv("FORENSICS_ARCHIVE_FLUSH_SECONDS", "0.05")
+    monkeypatch.setattr(forensic_archive, "_archive_instance", None)
+
+    # Opened by the forensics startup hook in the app
+    forensic_archive.get_report_archive().start()
+    payload = {**ORACLE_PAYLOAD, "policy_id": "archived_policy"}
+    client.post("/api/v1/forensics/generate", json={"oracle_payload": payload, "report_mode": "template"})
+    forensic_archive.get_report_archive().flush()
+
+    response = client.get("/api/v1/forensics/archive/archived_policy")
+    assert response.json()["count"] == 1
+    assert "FORENSIC REPORT - Policy archived_policy" in response.json()["reports"][0]["report"]
+
+    forensic_archive.get_report_archive().stop()
+    monkeypatch.setattr(forensic_archive, "_archive_instance", None)
+
+
+def test_export_pdf_cached_and_batch_zip(tmp_path, monkeypatch):
+    """Exports render in the process pool, hit the cache and stream as zip"""
+    import io
+    import zipfile
+    from app.services import forensic_export
+
+    monkeypatch.setattr(
+        forensic_export, "_export_instance",
+        forensic_export.ForensicExportService(str(tmp_path), workers=1),
+    )
+    body = {"oracle_payload": ORACLE_PAYLOAD, "report_mode": "template"}
+
+    first = client.post("/api/v1/forensics/export", json=body)
+    assert first.status_code == 200
+    assert first.content.startswith(b"%PDF-1.4") and first.content.rstrip().endswith(b"%%EOF")
+    assert first.headers["X-Export-Cache"] == "miss"
+    second = client.post("/api/v1/forensics/export", json=body)
+    assert second.headers["X-Export-Cache"] == "hit"
+
+    reports = [
+        {"oracle_payload": {**ORACLE_PAYLOAD, "policy_id": f"policy_{n}"}, "report_mode": "template"}
+        for n in range(3)
+    ]
+    response = client.post("/api/v1/forensics/export/batch", json={"reports": reports, "format": "html"})
+    names = zipfile.ZipFile(io.BytesIO(response.content)).namelist()
+    assert names == ["00001_policy_0.html", "00002_policy_1.html", "00003_policy_2.html"]
+
+    forensic_export.get_export_service().shutdown()
+
+
+def test_zip_stream_yields_block_by_block(tmp_path):
+    """Batch zips are streamed one read block at a time, not one entry at a time"""
+    import asyncio
+    import io
+    import zipfile
+    from app.services.forensic_export import READ_BLOCK_BYTES, ForensicExportService
+
+    artefact = tmp_path / "report.pdf"
+    artefact.write_bytes(os.urandom(3 * READ_BLOCK_BYTES + 100))
+
+    async def items():
+        yield "00001_report.pdf", str(artefact)
+
+    async def collect():
+        service = ForensicExportService(str(tmp_path / "cache"))
+        return [chunk async for chunk in service.stream_zip(items())]
+
+    chunks = asyncio.run(collect())
+    assert max(len(chunk) for chunk in chunks) <= READ_BLOCK_BYTES + 1024
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.read("00001_report.pdf") == artefact.read_bytes()
+
+
+def test_batch_job_lifecycle(tmp_path, monkeypatch):
+    """Batch jobs generate every report and expose paged results"""
+    from app.services import forensic_jobs
+
+    monkeypatch.setenv("FORENSICS_JOB_DB", str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(forensic_jobs, "_job_manager_instance", None)
+
+    reports = [
+        {"oracle_payload": {**ORACLE_PAYLOAD, "policy_id": f"policy_{n}"}, "report_mode": "template"}
+        for n in range(5)
+    ]
+
+    with TestClient(app) as job_client:
+        response = job_client.post("/api/v1/forensics/jobs", json={"reports": reports})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        events = job_client.get(f"/api/v1/forensics/jobs/{job_id}/events")
+        assert events.text.endswith("data: [DONE]\n\n")
+
+        job = job_client.get(f"/api/v1/forensics/jobs/{job_id}").json()
+        assert job["status"] == "completed"
+        assert job["counts"] == {"completed": 5}
+
+        results = job_client.get(
+            f"/api/v1/forensics/jobs/{job_id}/results", params={"offset": 3}
+        ).json()["results"]
+        assert [r["policy_id"] for r in results] == ["policy_3", "policy_4"]
+        assert "FORENSIC REPORT - Policy policy_3" in results[0]["report"]
+
+        assert job_client.get("/api/v1/forensics/jobs/missing").status_code == 404
+
+    forensic_jobs.get_job_manager().store.close()
+    monkeypatch.setattr(forensic_jobs, "_job_manager_instance", None)
+
+
+def test_batch_job_resumes_after_restart(tmp_path):
+    """Items left queued by a previous process are generated on start"""
+    import asyncio
+    from app.services.forensic_jobs import ForensicJobManager, ForensicJobStore
+
+    path = str(tmp_path / "jobs.db")
+    item = {"oracle_payload": ORACLE_PAYLOAD, "report_mode": "template"}
+
+    store = ForensicJobStore(path)
+    store.create_job("previous", [item, item])
+    store.set_item_status("previous", 0, "completed", report="kept")
+    store.close()
+
+    async def restart():
+        manager = ForensicJobManager(ForensicJobStore(path), workers=2)
+        await manager.start()
+        await manager._queue.join()
+        await manager.stop()
+        results = await manager.get_results("previous")
+        manager.store.close()
+        return results
+
+    results = asyncio.run(restart())
+    assert results[0]["report"] == "kept"
+    assert results[1]["status"] == "completed"
+    assert "FORENSIC REPORT" in results[1]["report"]
+
+
+def test_batch_worker_survives_store_errors(tmp_path):
+    """A failing store write is logged and the worker keeps serving the queue"""
+    import asyncio
+    import sqlite3
+    from app.services.forensic_jobs import ForensicJobManager, ForensicJobStore
+
+    item = {"oracle_payload": ORACLE_PAYLOAD, "report_mode": "template"}
+    store = ForensicJobStore(str(tmp_path / "jobs.db"))
+    store.create_job("locked", [item])
+    store.create_job("next", [item])
+    original = store.set_item_status
+
+    def set_item_status(job_id, *args, **kwargs):
+        if job_id == "locked":
+            raise sqlite3.OperationalError("database is locked")
+        return original(job_id, *args, **kwargs)
+
+    store.set_item_status = set_item_status
+
+    async def run():
+        manager = ForensicJobManager(store, workers=1)
+        await manager.start()
+        await asyncio.wait_for(manager._queue.join(), 5)
+        alive = not manager._tasks[0].done()
+        await manager.stop()
+        return alive, await manager.get_results("next")
+
+    alive, results = asyncio.run(run())
+    store.close()
+    assert alive
+    assert results[0]["status"] == "completed"
+
+
+def test_batch_rate_limit_leaves_interactive_reserve():
+    """Concurrent batch callers cannot take the slots kept for interactive reports"""
+    import asyncio
+    from app.services.forensic_backends import FakeModelBackend
+    from app.services.gemini_reporter import GeminiForensicReporter
+
+    reporter = GeminiForensicReporter(backend=FakeModelBackend(latency_ms=0, jitter_ms=0))
+    reporter.max_requests_per_minute = 5
+    reporter.interactive_reserve = 2
+
+    async def scenario():
+        batch = [asyncio.create_task(reporter._enforce_rate_limit("batch")) for _ in range(5)]
+        await asyncio.sleep(0.1)
+        admitted = sum(task.done() for task in batch)
+        await asyncio.wait_for(reporter._enforce_rate_limit("interactive"), 1)
+        await asyncio.wait_for(reporter._enforce_rate_limit("interactive"), 1)
+        for task in batch:
+            task.cancel()
+        return admitted
+
+    assert asyncio.run(scenario()) == 3
+    assert len(reporter._request_timestamps) == 5
+
+
+def test_fake_backend_streams_synthetic_report():
+    """The fake backend stands in for Gemini without an API key"""
+    import asyncio
+    from app.services.forensic_backends import FakeModelBackend
+    from app.services.gemini_reporter import GeminiForensicReporter
+
+    backend = FakeModelBackend(latency_ms=0, jitter_ms=0, tokens=20, chunk_tokens=5, seed=1)
+    reporter = GeminiForensicReporter(backend=backend)
+
+    async def collect():
+        return [c async for c in reporter.stream_forensic_report(ORACLE_PAYLOAD, mode="llm")]
+
+    chunks = asyncio.run(collect())
+    assert len(chunks) == 4
+    assert reporter.model_name == "fake-gemini"
+
+
+def test_backend_without_stream_generate_fails_on_construction():
+    """ForensicModelBackend is abstract: stream_generate must be implemented"""
+    import inspect
+    import pytest
+    from app.services.forensic_backends import ForensicModelBackend
+
+    class Incomplete(ForensicModelBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError, match="stream_generate"):
+        Incomplete("model")
+    assert inspect.isasyncgenfunction(ForensicModelBackend.stream_generate)
+
+
+def test_gemini_stream_cancelled_when_consumer_stops_early(monkeypatch, caplog):
+    """Closing the stream early cancels the SDK call; unsupported responses warn"""
+    import asyncio
+    import sys
+    import types
+    from app.services.forensic_backends import GeminiModelBackend
+
+    class StubStream:
+        def __init__(self):
+            self.cancelled = 0
+
+        def cancel(self):
+            self.cancelled += 1
+
+    class StubResponse:
+        def __init__(self, stream):
+            if stream is not None:
+                self._iterator = stream
+
+        def __iter__(self):
+            return iter([types.SimpleNamespace(text=f"chunk {n} ") for n in range(5)])
+
+    class StubModel:
+        def __init__(self, model_name, **kwargs):
+            self.stream = None
+
+        def generate_content(self, prompt, stream=False):
+            return StubResponse(self.stream)
+
+    genai = types.SimpleNamespace(configure=lambda api_key: None, GenerativeModel=StubModel)
+    monkeypatch.setitem(sys.modules, "google.generativeai", genai)
+    monkeypatch.setattr(sys.modules["google"], "generativeai", genai, raising=False)
+    backend = GeminiModelBackend(api_key="test-key")
+
+    async def first_chunk():
+        stream = backend.stream_generate("prompt")
+        chunk = await stream.__anext__()
+        await stream.aclose()
+        return chunk
+
+    backend.model.stream = StubStream()
+    assert asyncio.run(first_chunk()) == "chunk 0 "
+    assert backend.model.stream.cancelled == 1
+
+    backend.model.stream = None
+    with caplog.at_level("WARNING", logger="app.services.forensic_backends"):
+        asyncio.run(first_chunk())
+    assert "cannot be cancelled" in caplog.text
+
+
+def test_prompt_static_prefix_is_not_resent():
+    """Per-request prompts are compact and token usage is tracked"""
+    import asyncio
+    from app.services.forensic_backends import FakeModelBackend
+    from app.services.gemini_reporter import (
+        FORENSIC_SYSTEM_INSTRUCTION_TOKENS,
+        GeminiForensicReporter,
+    )
+
+    reporter = GeminiForensicReporter(backend=FakeModelBackend(latency_ms=0, jitter_ms=0, tokens=8))
+    prompt = reporter._build_forensic_prompt(ORACLE_PAYLOAD)
+    assert "**INSTRUCTIONS:**" not in prompt
+    assert '"wind_speed":45.5' in prompt
+
+    async def collect():
+        return [c async for c in reporter.stream_forensic_report(ORACLE_PAYLOAD, mode="llm")]
+
+    asyncio.run(collect())
+    usage = reporter.prompt_usage()
+    assert usage["requests"] == 1
+    assert usage["avg_prompt_tokens"] > FORENSIC_SYSTEM_INSTRUCTION_TOKENS
+
+
+def test_router_shifts_traffic_to_faster_healthy_model():
+    """Degraded models lose interactive traffic; failures retry on the fallback"""
+    import asyncio
+    from app.services.forensic_backends import FakeModelBackend
+    from app.services.forensic_routing import ModelRouter, create_model_router
+    from app.services.gemini_reporter import GeminiForensicReporter
+
+    backends = {
+        "primary": FakeModelBackend(latency_ms=0, jitter_ms=0, tokens=8, model_name="primary"),
+        "secondary": FakeModelBackend(latency_ms=0, jitter_ms=0, tokens=8, model_name="secondary"),
+    }
+    router = ModelRouter(
+        backends.__getitem__,
+        {"interactive": ["primary", "secondary"], "fallback": ["secondary"]},
+        probe_every=0,
+    )
+    for _ in range(5):
+        router.record("primary", 900.0, ok=True)
+        router.record("secondary", 100.0, ok=True)
+    assert router.select("interactive").model_name == "secondary"
+
+    # Defaults give interactive and batch a second candidate to shift to
+    router = create_model_router(lambda name: FakeModelBackend(latency_ms=0, model_name=name))
+    assert router.routes["interactive"] == ["gemini-1.5-flash", "gemini-1.5-flash-8b"]
+    assert router.routes["batch"] == router.routes["interactive"]
+    for _ in range(5):
+        router.record("gemini-1.5-flash", 900.0, ok=True)
+        router.record("gemini-1.5-flash-8b", 100.0, ok=True)
+    assert router.select("batch").model_name == "gemini-1.5-flash-8b"
+
+    # Failing primary: the report is retried on the fallback model
+    router = ModelRouter(backends.__getitem__, {"interactive": ["primary"], "fallback": ["secondary"]})
+    backends["primary"].error_rate = 1.0
+    reporter = GeminiForensicReporter(backend=backends["primary"])
+    reporter.router = router
+
+    async def collect():
+        return [c async for c in reporter.stream_forensic_report(ORACLE_PAYLOAD, mode="llm")]
+
+    for _ in range(3):
+        assert len(asyncio.run(collect())) == 1
+    status = router.status()["models"]
+    assert status["primary"]["errors"] == 3 and status["primary"]["cooling_down"]
+    assert status["secondary"]["requests"] == 3
+
+
+def test_backend_error_falls_back_to_template():
+    """Auto mode answers with the template when the backend fails"""
+    import asyncio
+    from app.services.forensic_backends import FakeModelBackend
+    from app.services.gemini_reporter import GeminiForensicReporter
+
+    backend = FakeModelBackend(latency_ms=0, jitter_ms=0, error_rate=1.0)
+    reporter = GeminiForensicReporter(backend=backend)
+
+    report = asyncio.run(reporter.generate_static_report(ORACLE_PAYLOAD))
+    assert report.startswith("FORENSIC REPORT")
+
+
+def test_storm_grouping_clusters_by_time_and_distance():
+    """Nearby payloads in the same window share one storm"""
+    from app.services.forensic_storms import cluster_storm_events
+
+    def item(policy_id, t, lat, lon):
+        payload = {**ORACLE_PAYLOAD, "policy_id": policy_id, "measurement_time": t,
+                   "latitude": lat, "longitude": lon}
+        return {"oracle_payload": payload}
+
+    items = [
+        item("miami_1", 1699564800, 25.76, -80.19),
+        item("miami_2", 1699566000, 25.90, -80.30),    # ~20 km, 20 min later
+        item("tampa_1", 1699566000, 27.95, -82.46),    # ~330 km away
+        item("miami_3", 1699564800 + 86400, 25.76, -80.19),  # next day
+    ]
+    clusters = cluster_storm_events(items, window_seconds=6 * 3600, radius_km=150)
+    groups = sorted(sorted(i["oracle_payload"]["policy_id"] for i in c.items) for c in clusters)
+    assert groups == [["miami_1", "miami_2"], ["miami_3"], ["tampa_1"]]
+
+
+def test_storm_reports_endpoint_template_mode():
+    """Storm endpoint returns one narrative per storm and a report per policy"""
+    reports = [
+        {"oracle_payload": {**ORACLE_PAYLOAD, "policy_id": f"p{n}", "wind_speed": 41.0 + n}}
+        for n in range(3)
+    ]
+    response = client.post(
+        "/api/v1/forensics/storms",
+        json={"reports": reports, "report_mode": "template"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["clusters"]) == 1
+    assert data["clusters"][0]["policy_count"] == 3
+    assert [r["policy_id"] for r in data["reports"]] == ["p0", "p1", "p2"]
+    assert "Storm Event: " in data["reports"][2]["report"]
+    assert "43.00 m/s" in data["reports"][2]["report"]
+
+
+def test_speculative_draft_finalized_on_trigger(monkeypatch):
+    """A near-threshold draft is finalised with the measured values"""
+    import asyncio
+    from app.services import gemini_reporter
+    from app.services.forensic_backends import FakeModelBackend
+    from app.services.forensic_speculation import SpeculativeReportManager
+
+    backend = FakeModelBackend(latency_ms=0, jitter_ms=0, tokens=10, seed=3)
+    monkeypatch.setattr(
+        gemini_reporter, "_reporter_instance",
+        gemini_reporter.GeminiForensicReporter(backend=backend)
+    )
+    manager = SpeculativeReportManager(enabled=True, start_fraction=0.8, fade_fraction=0.6)
+
+    async def scenario():
+        policy_id = ORACLE_PAYLOAD["policy_id"]
+        assert manager.observe(policy_id, "miami", 20.0, 40.0) == "idle"
+        assert manager.observe(policy_id, "miami", 34.0, 40.0) == "started"
+        assert manager.observe(policy_id, "miami", 30.0, 40.0) == "drafting"
+        chunks = await manager.finalize(ORACLE_PAYLOAD)
+
+        assert manager.observe("faded", "tampa", 36.0, 40.0) == "started"
+        assert manager.observe("faded", "tampa", 10.0, 40.0) == "discarded"
+        return chunks
+
+    report = "".join(asyncio.run(scenario()))
+    assert "Storm Event: " in report
+    assert "45.50 m/s" in report
+    assert manager.stats == {"started": 2, "finalized": 1, "discarded": 1, "failed": 0}